@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import os
+import random
+from datetime import date, timedelta
+from inkwell.cache import makedirs
+
+CORPUS_MARKER = '.corpus'
+
+WORDS = (
+    'lorem ipsum dolor sit amet consectetur adipisicing elit sed do eiusmod '
+    'tempor incididunt ut labore et dolore magna aliqua enim ad minim veniam '
+    'quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo '
+    'consequat duis aute irure in reprehenderit voluptate velit esse cillum '
+    'fugiat nulla pariatur excepteur sint occaecat cupidatat non proident sunt '
+    'culpa qui officia deserunt mollit anim id est laborum'
+).split()
+
+TAGS = ['python', 'flask', 'git', 'yaml', 'markdown', 'api', 'json', 'http',
+    'cache', 'linux', 'unix', 'design', 'notes', 'travel', 'music', 'books']
+
+def generate(folder, size, seed=None):
+    """ Writes a synthetic articles folder holding `size` articles, unless a
+    complete one already exists there. Articles are spread over consecutive
+    days, several to a day, and have headers and bodies of varied sizes: from
+    a bare title to a dozen extra fields, and from a sentence to a few dozen
+    paragraphs of Markdown with headings, lists and code blocks.
+
+    Arguments::
+        folder str  path of the articles folder
+        size   int  number of articles to write
+        seed   int  optional random seed; defaults to `size` so a corpus is
+                    always generated identically
+
+    Returns::
+        str path of the articles folder
+    """
+    marker = os.path.join(folder, CORPUS_MARKER)
+    if os.path.isfile(marker):
+        with open(marker) as f:
+            if f.read().strip() == str(size):
+                return folder
+
+    makedirs(folder)
+    for filename in os.listdir(folder):
+        os.unlink(os.path.join(folder, filename))
+
+    generator = random.Random(size if seed is None else seed)
+    day = date(1990, 1, 1)
+
+    for number in range(size):
+        if generator.random() < 0.6:
+            day += timedelta(days=1)
+
+        slug = '-'.join(generator.sample(WORDS, generator.randint(1, 6)) +
+            [str(number)])
+        filename = "{}-{}.txt".format(day.strftime('%Y-%m-%d'), slug)
+
+        with open(os.path.join(folder, filename), 'w') as f:
+            f.write(_header(generator, slug))
+            f.write('\n\n')
+            f.write(_body(generator))
+
+    with open(marker, 'w') as f:
+        f.write(str(size))
+    return folder
+
+def _sentence(generator, minimum=4, maximum=24):
+    """Returns a random sentence."""
+    words = [generator.choice(WORDS)
+        for _ in range(generator.randint(minimum, maximum))]
+    return ' '.join(words).capitalize() + '.'
+
+def _paragraph(generator):
+    """Returns a random paragraph of two to eight sentences."""
+    return ' '.join(_sentence(generator)
+        for _ in range(generator.randint(2, 8)))
+
+def _header(generator, slug):
+    """Returns a random YAML header block."""
+    lines = ["title: {}".format(slug.replace('-', ' ').title())]
+
+    if generator.random() < 0.7:
+        lines.append("tags: [{}]".format(', '.join(
+            generator.sample(TAGS, generator.randint(1, 5)))))
+
+    if generator.random() < 0.5:
+        lines.append("author: {}".format(generator.choice(WORDS).title()))
+
+    if generator.random() < 0.4:
+        lines.append("summary: {}".format(_sentence(generator)))
+
+    for number in range(generator.choice([0, 0, 1, 3, 12])):
+        lines.append("field{}: {}".format(number, _sentence(generator)))
+
+    return '\n'.join(lines)
+
+def _body(generator):
+    """Returns a random Markdown body."""
+    blocks = []
+    for _ in range(generator.choice([1, 2, 4, 8, 16, 40])):
+        kind = generator.random()
+        if kind < 0.1:
+            blocks.append("## {}".format(_sentence(generator, 2, 6)))
+        elif kind < 0.2:
+            blocks.append('\n'.join("* {}".format(_sentence(generator))
+                for _ in range(generator.randint(2, 6))))
+        elif kind < 0.25:
+            blocks.append("```\n{}\n```".format('\n'.join(
+                "    {} = {}".format(generator.choice(WORDS), number)
+                for number in range(generator.randint(2, 12)))))
+        else:
+            blocks.append(_paragraph(generator))
+    return '\n\n'.join(blocks) + '\n'
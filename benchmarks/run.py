@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+import json
+import time
+import random
+import timeit
+import argparse
+import multiprocessing
+import platform
+import yaml
+import tempfile
+import subprocess
+from benchmarks import corpus
+from inkwell import bootstrap, reader, encoding
+from inkwell.config import TestConfig
+from inkwell.reader import Reader
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_REPEAT = 5
+PARALLEL = multiprocessing.cpu_count()
+DEFAULT_CORPUS_FOLDER = os.path.join(tempfile.gettempdir(),
+    'inkwell-benchmarks')
+DEFAULT_RESULTS_FOLDER = os.path.join(os.path.dirname(__file__), 'results')
+
+JSON_HEADERS = {'Accept': 'application/json'}
+
+def measure(function, repeat=DEFAULT_REPEAT, number=1, setup=None):
+    """ Times a function, keeping the best of several runs as the least noisy
+    estimate of its cost.
+
+    Arguments::
+        function callable the code to time
+        repeat   int      number of timed runs
+        number   int      number of calls within each run
+        setup    callable optional, untimed, code run before each run
+
+    Returns::
+        dict containing the minimum, median and maximum seconds per call
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = timeit.default_timer()
+        for _ in range(number):
+            function()
+        timings.append((timeit.default_timer() - start) / number)
+
+    timings.sort()
+    return {
+          'min': timings[0]
+        , 'median': timings[len(timings) // 2]
+        , 'max': timings[-1]
+        , 'repeat': repeat
+        , 'number': number
+    }
+
+def reset(subject):
+    """ Drops the index, article and fragment caches of the specified reader,
+    and the rendered Markdown and parsed header caches, so the next run starts
+    cold.
+    """
+    subject._index = None
+    subject.cache.clear()
+    subject.fragment_cache.clear()
+    reader.renderer.cache.clear()
+    reader.header_parser.cache.clear()
+
+def benchmark(folder, repeat=DEFAULT_REPEAT):
+    """ Runs every benchmark against a single articles folder.
+
+    Arguments::
+        folder str path of the articles folder
+        repeat int number of timed runs of each benchmark
+
+    Returns::
+        dict mapping benchmark names to their timings
+    """
+    results = {}
+    generator = random.Random(0)
+
+    subject = Reader(folder, cache_size=None, fragment_cache_size=None)
+    cold = lambda: reset(subject)
+
+    filenames = subject.index.lookup()
+    sample = generator.sample(filenames, min(len(filenames), 100))
+    year = filenames[len(filenames) // 2][:4]
+
+    def fetch_sample():
+        for filename in sample:
+            subject.fetch_article(filename=filename)
+
+    results['reader.index'] = measure(lambda: subject.index, repeat,
+        setup=cold)
+    results['reader.list.page'] = measure(lambda: subject.list(limit=10,
+        lazy=True), repeat, number=10)
+    results['reader.list.year.cold'] = measure(lambda: subject.list(
+        by_year=year, lazy=True), repeat, setup=cold)
+    results['reader.list.year.warm'] = measure(lambda: subject.list(
+        by_year=year, lazy=True), repeat)
+    results['reader.list.all.lazy'] = measure(lambda: subject.list(lazy=True),
+        max(repeat // 2, 1), setup=cold)
+    for name, options in [
+          ('reader.load_all', {})
+        , ('reader.load_all.threads', {'parallel': PARALLEL})
+        , ('reader.load_all.processes', {'parallel': PARALLEL,
+            'processes': True})
+    ]:
+        results[name] = measure(lambda: subject.load_all(lazy=True,
+            **options), max(repeat // 2, 1), setup=cold)
+
+    results['reader.fetch_article.cold'] = measure(fetch_sample, repeat,
+        setup=cold)
+    results['reader.fetch_article.warm'] = measure(fetch_sample, repeat)
+
+    headers = []
+    for filename in sample:
+        with open(os.path.join(folder, filename)) as f:
+            headers.append(f.read().split('\n\n', 1)[0])
+
+    loaders = [
+          ('yaml.loader', yaml.Loader)
+        , ('yaml.safe_loader', yaml.SafeLoader)
+    ]
+    if hasattr(yaml, 'CSafeLoader'):
+        loaders.append(('yaml.safe_loader.libyaml', yaml.CSafeLoader))
+
+    for name, loader in loaders:
+        results[name] = measure(lambda: [yaml.load(header, Loader=loader)
+            for header in headers], repeat)
+
+    parser = reader.HeaderParser(cache_size=None)
+    results['yaml.header_parser.warm'] = measure(lambda: [parser.parse(header)
+        for header in headers], repeat)
+
+    articles = [subject.fetch_article(filename=filename)
+        for filename in sample]
+
+    def to_json():
+        for article in articles:
+            article.to_json()
+
+    results['article.to_json.cold'] = measure(to_json, repeat,
+        setup=reader.renderer.cache.clear)
+    results['article.to_json.warm'] = measure(to_json, repeat)
+
+    listing = subject.index.lookup(year)
+    encode = lambda: encoding.array(subject.fragments(listing))
+    results['encoding.listing.cold'] = measure(encode, repeat,
+        setup=subject.fragment_cache.clear)
+    results['encoding.listing.warm'] = measure(encode, repeat)
+    results['encoding.listing.stdlib'] = measure(lambda: json.dumps([
+        article.to_json() for article in subject.iterate(listing, lazy=True)],
+        cls=encoding.Encoder), repeat)
+
+    def unindexed():
+        subject._search = None
+
+    results['search.build'] = measure(lambda: subject.search('lorem'),
+        max(repeat // 2, 1), setup=unindexed)
+    results['search.query'] = measure(lambda: subject.search('lorem ipsum',
+        limit=10), repeat, number=10)
+    results['search.query.prefix'] = measure(lambda: subject.search('lo*',
+        limit=10), repeat, number=10)
+
+    collection = subject.list(by_year=year)
+    shuffle = lambda: generator.shuffle(collection.articles)
+    results['collection.sort.title'] = measure(lambda: collection.sort('title'),
+        repeat, setup=shuffle)
+    results['collection.sort.date'] = measure(lambda: collection.sort(
+        lambda a: a.date), repeat, setup=shuffle)
+
+    configuration = type('BenchmarkConfig', (TestConfig,), {
+          'ARTICLES_FOLDER': folder
+        , 'ARTICLE_CACHE_SIZE': None
+    })
+    app = bootstrap(configuration)
+    client = app.test_client()
+    responses = app.extensions.get('inkwell_responses')
+
+    def uncached():
+        if responses is not None:
+            responses.memory.clear()
+
+    article = "/inkwell/{}".format(subject._filename_to_path(sample[0]))
+    urls = [
+          ('api.archive.page', '/inkwell/?limit=10')
+        , ('api.archive.year', "/inkwell/{}".format(year))
+        , ('api.archive.summary', '/inkwell/archive/summary')
+        , ('api.feed.atom', '/inkwell/feed.atom')
+        , ('api.article', article)
+        , ('api.article.linked', article + '?neighbors=1&related=5')
+    ]
+
+    for name, url in urls:
+        get = lambda: client.get(url, headers=JSON_HEADERS)
+        response = get()
+        assert response.status_code == 200, url
+
+        results[name + '.uncached'] = measure(get, repeat, setup=uncached)
+        results[name + '.cached'] = measure(get, repeat, number=10)
+
+        etag = response.headers.get('ETag')
+        if etag:
+            headers = dict(JSON_HEADERS, **{'If-None-Match': etag})
+            results[name + '.not_modified'] = measure(lambda: client.get(url,
+                headers=headers), repeat, number=10)
+
+    def first_byte():
+        response = client.get('/inkwell/', headers=JSON_HEADERS,
+            buffered=False)
+        next(iter(response.response))
+        response.close()
+
+    def whole():
+        client.get('/inkwell/', headers=JSON_HEADERS).get_data()
+
+    threshold = app.config['STREAM_THRESHOLD']
+    for name, value in (('buffered', None), ('streamed', 1)):
+        app.config['STREAM_THRESHOLD'] = value
+        results['api.archive.all.first_byte.' + name] = measure(first_byte,
+            repeat, setup=uncached)
+        results['api.archive.all.' + name] = measure(whole, repeat,
+            setup=uncached)
+    app.config['STREAM_THRESHOLD'] = threshold
+
+    reset(subject)
+    return results
+
+def compare(previous, current):
+    """ Prints the ratio of the current median timings to previous ones.
+
+    Arguments::
+        previous dict earlier results, as written by `main`
+        current  dict current results
+    """
+    for size in sorted(current['results']):
+        before = previous['results'].get(size, {})
+        print size
+        for name, timing in sorted(current['results'][size].iteritems()):
+            if name not in before:
+                continue
+            ratio = timing['median'] / (before[name]['median'] or 1e-9)
+            print "  {:<36} {:>12.6f}s {:>8.2f}x".format(name,
+                timing['median'], ratio)
+
+def revision():
+    """Returns the SHA-1 of the checked out commit, if there is one."""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.STDOUT).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    """ Generates the synthetic corpora, benchmarks each of them and writes
+    the results as JSON.
+
+    Arguments::
+        argv list optional command line arguments; defaults to `sys.argv`
+
+    Returns::
+        int exit status
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run',
+        description='Benchmarks Inkwell against synthetic articles folders.')
+    parser.add_argument('--sizes', type=int, nargs='*', default=DEFAULT_SIZES,
+        help='number of articles in each corpus')
+    parser.add_argument('--folder', action='append', default=[],
+        help='also benchmark an existing articles folder, such as your own')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+        help='number of timed runs of each benchmark')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS_FOLDER,
+        help='folder to generate the corpora in')
+    parser.add_argument('--output', default=None,
+        help='file to write results to; defaults to results/<commit>.json')
+    parser.add_argument('--compare', default=None,
+        help='earlier results file to compare against')
+    arguments = parser.parse_args(argv)
+
+    commit = revision()
+    results = {
+          'commit': commit
+        , 'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        , 'python': platform.python_version()
+        , 'platform': platform.platform()
+        , 'results': {}
+    }
+
+    for size in arguments.sizes:
+        folder = corpus.generate(os.path.join(arguments.corpus, str(size)),
+            size)
+        sys.stderr.write("Benchmarking {} articles ...\n".format(size))
+        results['results'][str(size)] = benchmark(folder, arguments.repeat)
+
+    for folder in arguments.folder:
+        folder = os.path.abspath(folder)
+        sys.stderr.write("Benchmarking {} ...\n".format(folder))
+        results['results'][folder] = benchmark(folder, arguments.repeat)
+
+    output = arguments.output or os.path.join(DEFAULT_RESULTS_FOLDER,
+        "{}.json".format((commit or 'latest')[:12]))
+    corpus.makedirs(os.path.dirname(os.path.abspath(output)))
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+    sys.stderr.write("Results written to {}\n".format(output))
+
+    if arguments.compare:
+        with open(arguments.compare) as f:
+            compare(json.load(f), results)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
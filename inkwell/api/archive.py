@@ -1,40 +1,152 @@
 # -*- coding: utf-8 -*-
-from inkwell import utils, exceptions
-from validator import field, rules, collection
+import hashlib
+from inkwell import utils, encoding, exceptions
+from inkwell.reader import Article
+from flask import current_app
+from werkzeug.urls import url_encode
+
+SUMMARY_FIELDS = ['title', 'summary', 'meta']
 
 class Archive(utils.ApiEndpoint):
-    def get(self, year=None, month=None, day=None):
-        check = collection.Collection()
+    def validate(self, year=None, month=None, day=None):
+        utils.validate_date(year, month, day)
+        self.arguments()
+        self.fields()
+
+    def sources(self, **kwargs):
+        filenames, total, cursor = self.page(**kwargs)
+        return filenames, total
 
-        if year:
-            check.append(field.Field('year', year).append(
-                rules.Regex(utils.REGEX_YEAR, error='{} is not a valid year')))
+    @utils.memoized
+    def page(self, year=None, month=None, day=None):
+        """ Looks up the page of articles requested by the view arguments.
+        Endpoints listing other sets of articles override this method, and
+        memoize it likewise.
 
-        if month: 
-            check.append(field.Field('month', month).append(
-                rules.Regex(utils.REGEX_MONTH, error='{} is not a valid month')))
+        Returns::
+            See `inkwell.reader.Reader.page`.
+        """
+        return self.query(by_year=year, by_month=month, by_day=day)
 
-        if day:
-            check.append(field.Field('day', day).append(
-                rules.Regex(utils.REGEX_DAY, error='{} is not a valid day')))
+    def query(self, **filters):
+        """ Looks up a page of the articles matching the specified filters,
+        paginated and narrowed down by the `limit`, `offset`, `after`, `since`
+        and `until` query arguments.
 
-        if not check.run():
-            raise exceptions.BadRequest(check.errors())
+        Arguments::
+            filters dict additional arguments of `inkwell.reader.Reader.page`
 
-        limit  = self.request.args.get('limit',  0, type=int)
-        offset = self.request.args.get('offset', 0, type=int)
+        Returns::
+            See `inkwell.reader.Reader.page`.
 
+        Raises::
+            inkwell.exceptions.NotFound if any of the filters are invalid.
+        """
         try:
-            articles = self.reader.list(
-                  by_year=year
-                , by_month=month
-                , by_day=day
-                , limit=limit
-                , offset=offset
+            return self.reader.page(
+                  limit=self.request.args.get('limit',  0, type=int)
+                , offset=self.request.args.get('offset', 0, type=int)
+                , after=self.request.args.get('after', None)
+                , since=self.request.args.get('since', None)
+                , until=self.request.args.get('until', None)
+                , **filters
             )
         except ValueError:
             raise exceptions.NotFound
+
+    def arguments(self):
+        """ Validates the query arguments `inkwell.api.archive.Archive.query`
+        reads.
+
+        Raises::
+            inkwell.exceptions.BadRequest if any of them are invalid.
+        """
+        utils.validate_paging(self.request.args.get('limit'),
+            self.request.args.get('offset'))
+        utils.validate_range(self.request.args.get('since'),
+            self.request.args.get('until'))
+
+    def fields(self):
+        """ Parses the `fields` and `summary_only` query arguments.
+
+        Returns::
+            A list of the article fields to include in the response.
+
+        Raises::
+            inkwell.exceptions.BadRequest if any of the fields are invalid.
+        """
+        if self.request.args.get('summary_only', type=int):
+            return SUMMARY_FIELDS
+
+        fields = self.request.args.get('fields', '')
+        fields = [f.strip() for f in fields.split(',') if f.strip()]
+
+        invalid = [f for f in fields if f not in Article.JSON_FIELDS]
+        if invalid:
+            raise exceptions.BadRequest({'fields': [
+                "{} is not a valid field".format(f) for f in invalid
+            ]})
+        return fields
+
+    def get(self, **kwargs):
+        filenames, total, cursor = self.page(**kwargs)
+
+        headers = {'X-Total-Count': str(total)}
+        if cursor:
+            args = self.request.args.copy()
+            args.pop('offset', None)
+            args['after'] = cursor
+            headers['Link'] = '<{}?{}>; rel="next"'.format(
+                self.request.base_url, url_encode(args))
+
+        fragments = self.reader.fragments(filenames, fields=self.fields())
+
+        # Large listings are encoded and sent one article at a time, rather
+        # than holding every article and the whole response in memory.
+        threshold = current_app.config.get('STREAM_THRESHOLD')
+        if threshold and len(filenames) > threshold:
+            return utils.json_stream(fragments, headers)
+
+        try:
+            body = encoding.array(fragments)
+        except ValueError:
+            raise exceptions.NotFound
         except Exception as e:
             raise exceptions.InternalServerError(e.message)
 
-        return articles
\ No newline at end of file
+        return body, headers
+
+
+class Summary(utils.ApiEndpoint):
+    def sources(self):
+        return (self.summary(),)
+
+    @utils.memoized
+    def summary(self):
+        """ Counts the articles of every year, month and day.
+
+        Returns::
+            See `inkwell.index.ArticleIndex.summary`.
+        """
+        return self.reader.index.summary()
+
+    def fingerprint(self, years):
+        """ Computes the strong entity tag of a response from the endpoint and
+        the checksum the index keeps of its counts, so conditional requests
+        are answered without walking the summary. Counts have no modification
+        time.
+
+        Arguments::
+            years list see `inkwell.index.ArticleIndex.summary`
+
+        Returns::
+            A tuple containing the entity tag and None.
+        """
+        digest = hashlib.sha1(self.request.endpoint)
+        digest.update(self.reader.index.checksum())
+        return digest.hexdigest(), None
+
+    def get(self):
+        years = self.summary()
+        headers = {'X-Total-Count': str(sum(y['count'] for y in years))}
+        return years, headers
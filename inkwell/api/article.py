@@ -1,18 +1,70 @@
 # -*- coding: utf-8 -*-
 from inkwell import utils, exceptions
-from validator import field, rules, collection
+from flask import current_app
+
+STUB_FIELDS = ['title', 'meta']
 
 class Article(utils.ApiEndpoint):
-    def get(self, year, month, day, title):
-        check = collection.Collection().append([
-              field.Field('year',  year).append(rules.Regex(utils.REGEX_YEAR,   error='{} is not a valid year'))
-            , field.Field('month', month).append(rules.Regex(utils.REGEX_MONTH, error='{} is not a valid month'))
-            , field.Field('day',   day).append(rules.Regex(utils.REGEX_DAY,     error='{} is not a valid day'))
-        ])
+    listing = False
+
+    def validate(self, year=None, month=None, day=None, title=None):
+        utils.validate_date(year, month, day)
+
+    def sources(self, year, month, day, title):
+        try:
+            filename = self.reader._build_filename(
+                  year=year
+                , month=month
+                , day=day
+                , title=title
+            )
+        except ValueError:
+            raise exceptions.NotFound
+
+        if self.reader.stat(filename) is None:
+            return None
+
+        # Linked articles are part of the response, so their versions are
+        # part of its fingerprint.
+        return [filename] + self.linked(filename), 1
+
+    @utils.memoized
+    def links(self, filename):
+        """ Looks up the articles linked from an article: its neighbors if the
+        `neighbors` query argument is set, and as many related articles as the
+        `related` query argument asks for, up to `RELATED_LIMIT`.
+
+        Returns::
+            dict mapping any of `previous`, `next` and `related` to filenames
+        """
+        links = {}
+        if self.request.args.get('neighbors', 0, type=int):
+            links['previous'], links['next'] = self.reader.neighbors(filename)
+
+        related = min(self.request.args.get('related', 0, type=int),
+            current_app.config.get('RELATED_LIMIT'))
+        if related > 0:
+            try:
+                links['related'] = self.reader.related(filename, limit=related)
+            except Exception as e:
+                raise exceptions.InternalServerError(e.message)
 
-        if not check.run():
-            raise exceptions.BadRequest(check.errors())
+        # Neighbors and related articles change along with the set of
+        # articles, just like listings do.
+        self.listing = bool(links)
+        return links
 
+    def linked(self, filename):
+        """ Lists the filenames of every article linked from an article.
+
+        Returns::
+            A list of filenames.
+        """
+        links = self.links(filename)
+        return [f for f in [links.get('previous'), links.get('next')] +
+            links.get('related', []) if f]
+
+    def get(self, year, month, day, title):
         try:
             article = self.reader.fetch_article(
                   year=year
@@ -28,4 +80,23 @@ class Article(utils.ApiEndpoint):
         if not article:
             raise exceptions.NotFound
 
-        return article
\ No newline at end of file
+        links = self.links(article.filename)
+        if not links:
+            return article
+
+        # Linked articles are only described by their title and meta data, so
+        # only their headers are read.
+        stubs = dict(
+            (a.filename, a.to_json(fields=STUB_FIELDS))
+            for a in self.reader.load_all(self.linked(article.filename),
+                lazy=True)
+        )
+
+        result = article.to_json()
+        for name in ('previous', 'next'):
+            if name in links:
+                result[name] = stubs.get(links[name])
+        if 'related' in links:
+            result['related'] = [stubs[f] for f in links['related']
+                if f in stubs]
+        return result
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from inkwell import utils, feeds, exceptions
+from flask import current_app, make_response, url_for
+
+class Feed(utils.ApiEndpoint):
+    """ Base class of the feed endpoints, which serve the latest `FEED_SIZE`
+    articles. Feeds are fingerprinted like any other listing, so a document is
+    only built again once the set of latest articles, or one of them,
+    changes, and idle pollers are answered with `304 Not Modified`.
+    """
+    document = None
+
+    def sources(self):
+        return self.latest()
+
+    @utils.memoized
+    def latest(self):
+        """ Looks up the latest articles.
+
+        Returns::
+            A tuple containing a list of filenames, newest first, and the
+            total number of articles.
+        """
+        filenames, total, cursor = self.reader.page(
+            limit=current_app.config.get('FEED_SIZE'))
+        return filenames, total
+
+    def url(self, article):
+        """ Returns the absolute URL of an article; `FEED_ARTICLE_URL`
+        formatted with the article's `path`, or its API endpoint.
+        """
+        template = current_app.config.get('FEED_ARTICLE_URL')
+        if template:
+            return template.format(path=article.path)
+        return url_for('inkwell_api.api_article', year=article.year,
+            month=article.month, day=article.day, title=article.slug,
+            _external=True)
+
+    def serialize(self, result):
+        return result
+
+    def respond(self, body, headers):
+        response = make_response(body)
+        response.headers.extend(headers or {})
+        response.headers['Content-Type'] = "{}; charset=utf-8".format(
+            self.mimetype)
+        response.headers['Cache-Control'] = utils.cache_control()
+        return response
+
+    def get(self):
+        filenames, total = self.latest()
+
+        try:
+            entries = [feeds.entry(article, self.url(article))
+                for article in self.reader.iterate(filenames)]
+        except Exception as e:
+            raise exceptions.InternalServerError(e.message)
+
+        config = current_app.config
+        feed = {
+              'title': config.get('FEED_TITLE')
+            , 'description': config.get('FEED_DESCRIPTION')
+            , 'author': config.get('FEED_AUTHOR')
+            , 'link': config.get('FEED_LINK') or self.request.url_root
+            , 'url': self.request.base_url
+        }
+        return self.document(feed, entries)
+
+
+class Atom(Feed):
+    mimetype = 'application/atom+xml'
+    document = staticmethod(feeds.atom)
+
+
+class RSS(Feed):
+    mimetype = 'application/rss+xml'
+    document = staticmethod(feeds.rss)
+
+
+class JSONFeed(Feed):
+    mimetype = 'application/feed+json'
+    document = staticmethod(feeds.json_feed)
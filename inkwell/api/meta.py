@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import hashlib
+from inkwell import utils, exceptions
+from inkwell.api.archive import Archive
+from inkwell.utils import ApiEndpoint
+
+class Values(ApiEndpoint):
+    key = None
+
+    def validate(self, key=None):
+        if (key or self.key) not in self.reader.indexed_meta_keys:
+            raise exceptions.NotFound
+
+    def sources(self, key=None):
+        return (self.values(key or self.key),)
+
+    @utils.memoized
+    def values(self, key):
+        """ Counts the articles having each value of an indexed meta key.
+
+        Returns::
+            A list of tuples containing each value and its number of articles,
+            most common first.
+        """
+        try:
+            values = self.reader.meta_index.values(key)
+        except Exception as e:
+            raise exceptions.InternalServerError(e.message)
+        return sorted(values.iteritems(),
+            key=lambda (value, count): (-count, value))
+
+    def fingerprint(self, values):
+        """ Computes the strong entity tag of a response from the endpoint,
+        view arguments and the counted values themselves, rather than from
+        every article having them. Counts have no modification time.
+
+        Arguments::
+            values list tuples of each value and its number of articles
+
+        Returns::
+            A tuple containing the entity tag and None.
+        """
+        digest = hashlib.sha1(self.request.endpoint)
+        for key, value in sorted(self.request.view_args.iteritems()):
+            digest.update(u"\n{}={}".format(key, value).encode('utf-8'))
+        for value, count in values:
+            digest.update(u"\n{}:{}".format(value, count).encode('utf-8'))
+        return digest.hexdigest(), None
+
+    def get(self, key=None):
+        values = self.values(key or self.key)
+        headers = {'X-Total-Count': str(len(values))}
+        return [{'value': v, 'count': c} for v, c in values], headers
+
+
+class Tags(Values):
+    key = 'tags'
+
+
+class ValueArchive(Archive):
+    def validate(self, key, value):
+        if key not in self.reader.indexed_meta_keys:
+            raise exceptions.NotFound
+        self.arguments()
+        self.fields()
+
+    @utils.memoized
+    def page(self, key, value):
+        return self.query(by_meta={key: value})
+
+
+class TagArchive(ValueArchive):
+    def validate(self, tag):
+        super(TagArchive, self).validate('tags', tag)
+
+    @utils.memoized
+    def page(self, tag):
+        return super(TagArchive, self).page('tags', tag)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from inkwell import utils, encoding, exceptions
+from inkwell.api.archive import Archive
+from flask import current_app
+from werkzeug.urls import url_encode
+
+class Search(Archive):
+    def validate(self):
+        if not self.request.args.get('q', '').strip():
+            raise exceptions.BadRequest({'q': ['q is required']})
+        self.arguments()
+        self.fields()
+
+    def sources(self):
+        return self.results()
+
+    @utils.memoized
+    def results(self):
+        """ Searches the articles for the `q` query argument, paginated by the
+        `limit` and `offset` query arguments.
+
+        Returns::
+            A tuple containing a list of filenames and the total number of
+            matching articles.
+        """
+        limit = self.request.args.get('limit', 0, type=int) or \
+            current_app.config.get('SEARCH_PAGE_SIZE')
+        try:
+            return self.reader.search(
+                  self.request.args.get('q')
+                , offset=self.request.args.get('offset', 0, type=int)
+                , limit=limit
+            )
+        except Exception as e:
+            raise exceptions.InternalServerError(e.message)
+
+    def get(self):
+        filenames, total = self.results()
+
+        headers = {'X-Total-Count': str(total)}
+        offset = max(self.request.args.get('offset', 0, type=int), 0)
+        if offset + len(filenames) < total:
+            args = self.request.args.copy()
+            args['offset'] = offset + len(filenames)
+            headers['Link'] = '<{}?{}>; rel="next"'.format(
+                self.request.base_url, url_encode(args))
+
+        fragments = self.reader.fragments(filenames, fields=self.fields())
+        return encoding.array(fragments), headers
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import hashlib
+import multiprocessing
+from werkzeug.urls import url_quote
+from inkwell import bootstrap
+from cache import makedirs, write_file
+
+BUILD_MANIFEST = '.inkwell-build.json'
+BUILD_DOCUMENT = 'index.json'
+BUILD_FEEDS = ['inkwell/feed.atom', 'inkwell/feed.rss', 'inkwell/feed.json']
+
+class Builder(object):
+    """ Class `inkwell.build.Builder` exports every endpoint of the Inkwell API
+    as static JSON documents, so the API can be served straight off disk by a
+    CDN or web server. Each document is rendered through the API itself and
+    written to `<output>/<url>/index.json`, or to `<output>/<url>` for feeds:
+
+        inkwell/index.json                    GET /inkwell/
+        inkwell/page/2/index.json             GET /inkwell/?limit=10&offset=10
+        inkwell/2013/index.json               GET /inkwell/2013
+        inkwell/2013/07/page/2/index.json     GET /inkwell/2013/07?limit=10&...
+        inkwell/2013/07/12/welcome/index.json GET /inkwell/2013/07/12/welcome
+        inkwell/archive/summary/index.json    GET /inkwell/archive/summary
+        inkwell/tags/python/index.json        GET /inkwell/tags/python
+        inkwell/meta/author/index.json        GET /inkwell/meta/author
+        inkwell/feed.atom                     GET /inkwell/feed.atom
+
+    Search results depend on arbitrary queries, so `/inkwell/search` is never
+    built, and neither are query arguments other than `limit` and `offset`.
+
+    A manifest of the article versions each document was built from is kept
+    in the output folder, and subsequent builds only render documents whose
+    articles have changed. Documents are rendered in parallel across a pool
+    of processes.
+
+    Usage::
+
+        builder = Builder('inkwell.config.ProductionConfig', output='public')
+        print builder.build()
+        >>> {'built': 12, 'skipped': 0, 'removed': 0}
+    """
+    def __init__(self, configuration=None, output=None, page_size=None,
+        processes=None):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            configuration str,None import path of the configuration to build
+            output        str,None folder to write documents to; defaults to
+                                   `BUILD_FOLDER`
+            page_size     int,None number of articles per listing page;
+                                   defaults to `BUILD_PAGE_SIZE`
+            processes     int,None size of the process pool; defaults to the
+                                   number of CPUs
+        """
+        self.configuration = configuration or 'inkwell.config.LocalConfig'
+        self.app = bootstrap(self.configuration)
+        self.output = os.path.abspath(output or
+            self.app.config['BUILD_FOLDER'])
+        self.page_size = page_size or self.app.config['BUILD_PAGE_SIZE']
+        self.processes = processes or multiprocessing.cpu_count()
+        self.reader = self.app.extensions['inkwell_reader']
+
+    def targets(self):
+        """ Lists every document the API serves, along with the articles each
+        one is built from.
+
+        Returns::
+            A list of tuples containing the URL of a document, its path within
+            the output folder and a list of article filenames.
+        """
+        index = self.reader.index
+        meta = self.reader.meta_index
+        everything = index.lookup()[::-1]
+        targets = []
+
+        def listing(url, path, filenames):
+            targets.append((url, path, filenames))
+            for offset in range(0, len(filenames), self.page_size):
+                targets.append((
+                      "{}?limit={}&offset={}".format(url, self.page_size,
+                        offset)
+                    , "{}/page/{}".format(path, offset // self.page_size + 1)
+                    , filenames[offset:offset + self.page_size]
+                ))
+
+        def values(url, path, key):
+            # Counts and tag listings change whenever any article's meta data
+            # does, so they are built from every article.
+            targets.append((url, path, everything))
+            for value in sorted(meta.values(key)):
+                if '/' in value or value in ('.', '..'):
+                    continue
+                listing("{}/{}".format(url, url_quote(value, safe='')),
+                    u"{}/{}".format(path, value),
+                    meta.lookup(key, value)[::-1])
+
+        listing('/inkwell/', 'inkwell', everything)
+        for year, months in index.tree.iteritems():
+            path = "inkwell/{}".format(year)
+            listing('/' + path, path, index.lookup(year)[::-1])
+
+            for month, days in months.iteritems():
+                path = "inkwell/{}/{}".format(year, month)
+                listing('/' + path, path, index.lookup(year, month)[::-1])
+
+                for day in days:
+                    path = "inkwell/{}/{}/{}".format(year, month, day)
+                    listing('/' + path, path,
+                        index.lookup(year, month, day)[::-1])
+
+        for filename in index:
+            path = "inkwell/{}".format(self.reader._filename_to_path(filename))
+            targets.append(('/' + path, path, [filename]))
+
+        targets.append(('/inkwell/archive/summary', 'inkwell/archive/summary',
+            everything))
+
+        if 'tags' in meta.keys:
+            values('/inkwell/tags', 'inkwell/tags', 'tags')
+        for key in meta.keys:
+            values('/inkwell/meta/' + key, 'inkwell/meta/' + key, key)
+
+        latest = everything[:self.app.config.get('FEED_SIZE')]
+        for path in BUILD_FEEDS:
+            targets.append(('/' + path, path, latest))
+
+        return targets
+
+    def build(self):
+        """ Renders every document whose articles have changed since the last
+        build, and removes documents which no longer exist.
+
+        Returns::
+            dict containing the number of documents built, skipped and removed
+        """
+        manifest_path = os.path.join(self.output, BUILD_MANIFEST)
+        try:
+            with open(manifest_path) as f:
+                previous = json.load(f)
+        except (IOError, ValueError):
+            previous = {}
+
+        manifest = {}
+        pending = []
+        for url, path, filenames in self.targets():
+            digest = self._digest(url, filenames)
+            manifest[path] = digest
+
+            destination = self._destination(path)
+            if previous.get(path) != digest or \
+                not os.path.isfile(destination):
+                pending.append((url, destination))
+
+        if self.processes > 1 and len(pending) > 1:
+            pool = multiprocessing.Pool(self.processes,
+                initializer=_initialize, initargs=(self.configuration,))
+            try:
+                for _ in pool.imap_unordered(_render, pending):
+                    pass
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            _initialize(self.configuration, self.app)
+            for target in pending:
+                _render(target)
+
+        removed = [path for path in previous if path not in manifest]
+        for path in removed:
+            try:
+                os.unlink(self._destination(path))
+            except OSError:
+                pass
+
+        makedirs(self.output)
+        write_file(manifest_path, json.dumps(manifest, sort_keys=True))
+
+        return {
+              'built': len(pending)
+            , 'skipped': len(manifest) - len(pending)
+            , 'removed': len(removed)
+        }
+
+    def _destination(self, path):
+        """ Returns where the document at `path` is written: `path` itself for
+        feeds, and an `index.json` file within it otherwise.
+        """
+        if isinstance(path, unicode):
+            path = path.encode('utf-8')
+        if path in BUILD_FEEDS:
+            return os.path.join(self.output, path)
+        return os.path.join(self.output, path, BUILD_DOCUMENT)
+
+    def _digest(self, url, filenames):
+        """ Fingerprints a document by its URL and the versions of the articles
+        it is built from.
+
+        Arguments::
+            url       str  URL of the document
+            filenames list filenames of the articles in the document
+
+        Returns::
+            str SHA-1 hex digest
+        """
+        digest = hashlib.sha1(url)
+        for filename in filenames:
+            digest.update("\n{} {!r}".format(filename,
+                self.reader.version(filename)))
+        return digest.hexdigest()
+
+
+_client = None
+
+def _initialize(configuration, app=None):
+    """ Prepares a build process by creating the test client documents are
+    rendered with.
+
+    Arguments::
+        configuration str import path of the configuration to build
+        app           object optional, already bootstrapped, Inkwell server
+    """
+    global _client
+    _client = (app or bootstrap(configuration)).test_client()
+
+def _render(target):
+    """ Renders a single document through the API and writes it to disk.
+
+    Arguments::
+        target tuple containing the URL and destination of the document
+
+    Raises::
+        ValueError if the API does not respond with 200 OK.
+    """
+    url, destination = target
+    response = _client.get(url, headers={'Accept': 'application/json'})
+    if response.status_code != 200:
+        raise ValueError("{} responded with {}".format(url,
+            response.status_code))
+
+    makedirs(os.path.dirname(destination))
+    write_file(destination, response.data)
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import time
+import tempfile
+import threading
+from collections import OrderedDict
+
+# Bumped whenever the way responses are serialized changes.
+RESPONSE_FORMAT = 1
+RESPONSE_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+def makedirs(path):
+    """ Creates the specified folder, and any missing parents, unless it
+    already exists. Safe to call from several processes at once.
+
+    Arguments::
+        path str path to the folder
+    """
+    if not os.path.isdir(path):
+        try:
+            os.makedirs(path)
+        except OSError:
+            if not os.path.isdir(path):
+                raise
+
+def write_file(path, data, mode=0644):
+    """ Atomically replaces the file at `path` by writing `data` to a
+    temporary file in the same folder and renaming it into place.
+
+    Arguments::
+        path str path of the file
+        data str content of the file
+        mode int permissions of the file
+    """
+    handle, temp = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            f.write(data)
+        os.chmod(temp, mode)
+        os.rename(temp, path)
+    except:
+        os.unlink(temp)
+        raise
+
+class LRUCache(object):
+    """ Class `inkwell.cache.LRUCache` is a thread-safe, size-bounded cache
+    which evicts its least recently used entries once the combined size of its
+    entries exceeds `max_size`. Every entry may carry a version; lookups made
+    with a different version are treated as misses and drop the stale entry.
+
+    Usage::
+
+        cache = LRUCache(max_size=1024)
+        cache.set('foo.txt', 'value', version=(1373587200.0, 42), size=42)
+
+        print cache.get('foo.txt', version=(1373587200.0, 42))
+        >>> 'value'
+
+        print cache.get('foo.txt', version=(1373590800.0, 42))
+        >>> None
+
+        print cache.stats()
+        >>> {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 0, 'size': 0,
+            'max_size': 1024}
+    """
+    def __init__(self, max_size=None):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            max_size int,None combined size of all entries allowed before the
+                              least recently used are evicted. None means the
+                              cache is unbounded and 0 disables it.
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None, version=None):
+        """ Returns the value cached under `key` and marks it as the most
+        recently used entry.
+
+        Arguments::
+            key     hashable the key of the entry
+            default object   returned when there is no valid entry
+            version object   if specified, must equal the version the entry was
+                             stored with
+
+        Returns::
+            The cached value, or `default`.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, entry_version, size = entry
+            if version is not None and version != entry_version:
+                self.size -= size
+                self.misses += 1
+                return default
+
+            self._entries[key] = entry
+            self.hits += 1
+            return value
+
+    def set(self, key, value, version=None, size=1):
+        """ Stores `value` under `key`, evicting the least recently used entries
+        if the cache has grown beyond `max_size`. Values larger than `max_size`
+        are not stored at all.
+
+        Arguments::
+            key     hashable the key of the entry
+            value   object   the value to store
+            version object   optional version of the value
+            size    int      cost of the entry counted against `max_size`
+        """
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[2]
+
+            if self.max_size is not None and size > self.max_size:
+                return
+
+            self._entries[key] = (value, version, size)
+            self.size += size
+
+            while self.max_size is not None and self.size > self.max_size:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+                self.evictions += 1
+
+    def delete(self, key):
+        """ Removes the entry stored under `key`, if any.
+
+        Arguments::
+            key hashable the key of the entry
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[2]
+
+    def clear(self):
+        """Removes every entry from the cache. Counters are left untouched."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """ Returns the cache's counters.
+
+        Returns::
+            dict containing hits, misses, evictions, entries, size and max_size
+        """
+        with self._lock:
+            return {
+                  'hits': self.hits
+                , 'misses': self.misses
+                , 'evictions': self.evictions
+                , 'entries': len(self._entries)
+                , 'size': self.size
+                , 'max_size': self.max_size
+            }
+
+    def __contains__(self, key):
+        """Implements `in` checks without affecting counters or recency."""
+        return key in self._entries
+
+    def __len__(self):
+        """Returns the number of entries in the cache."""
+        return len(self._entries)
+
+
+class FileCache(object):
+    """ Class `inkwell.cache.FileCache` is a simple on-disk key/value store
+    holding one file per entry beneath `folder`. Entries are written to a
+    temporary file and renamed into place, so concurrent readers, including
+    other processes, never see partially written values. It survives process
+    restarts and can be shared by every worker on a host.
+
+    Usage::
+
+        cache = FileCache('/tmp/inkwell')
+        cache.set('4b3a...', '<p>Hello World!</p>')
+
+        print cache.get('4b3a...')
+        >>> '<p>Hello World!</p>'
+    """
+    def __init__(self, folder):
+        """ Creates class instance and assigns properties. The folder will be
+        created if it does not exist.
+
+        Arguments::
+            folder str path to the folder holding cache entries.
+        """
+        self.folder = os.path.abspath(folder)
+        makedirs(self.folder)
+
+    def get(self, key, default=None):
+        """ Returns the bytes stored under `key`.
+
+        Arguments::
+            key     str the key of the entry; must be safe to use as a filename
+            default object returned when there is no entry
+
+        Returns::
+            str containing the stored bytes, or `default`.
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except IOError:
+            return default
+
+    def set(self, key, value):
+        """ Stores `value` under `key`, replacing any existing entry.
+
+        Arguments::
+            key   str the key of the entry; must be safe to use as a filename
+            value str the bytes to store
+        """
+        path = self._path(key)
+        makedirs(os.path.dirname(path))
+        write_file(path, value)
+
+    def delete(self, key):
+        """ Removes the entry stored under `key`, if any.
+
+        Arguments::
+            key str the key of the entry
+        """
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    def prune(self, max_age):
+        """ Removes the entries written more than `max_age` seconds ago.
+
+        Arguments::
+            max_age float age, in seconds, of the oldest entry to keep
+
+        Returns::
+            int number of entries removed
+        """
+        expires = time.time() - max_age
+        removed = 0
+        for folder, _, filenames in os.walk(self.folder):
+            for filename in filenames:
+                path = os.path.join(folder, filename)
+                try:
+                    if os.path.getmtime(path) < expires:
+                        os.unlink(path)
+                        removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def _path(self, key):
+        """ Returns the path of the file holding the entry for `key`. Entries
+        are spread across sub-folders named after the first two characters of
+        their key.
+
+        Arguments::
+            key str the key of the entry
+
+        Returns::
+            str absolute path to the entry's file
+        """
+        return os.path.join(self.folder, key[:2], key)
+
+
+class ResponseCache(object):
+    """ Class `inkwell.cache.ResponseCache` stores serialized API responses,
+    their body along with any headers of their own, so repeated requests for
+    unchanged content are answered without reading articles or encoding JSON.
+    Responses are kept in an in-process `inkwell.cache.LRUCache` and, if a
+    `folder` is specified, in a `inkwell.cache.FileCache` shared by every
+    worker on the host.
+
+    Keys are expected to change along with the content they describe, such as
+    the entity tag of the response, so entries never need to be invalidated;
+    responses for outdated article versions are simply never requested again
+    and are evicted from memory in time. On disk, entries are stored under
+    their key and `RESPONSE_FORMAT`, so releases which serialize responses
+    differently never read each other's entries, and entries older than
+    `max_age` seconds are pruned when the cache is created and at most every
+    `max_age` seconds afterwards.
+
+    Usage::
+
+        cache = ResponseCache(max_size=1024 * 1024, folder='/tmp/responses')
+        cache.set('0b1a...', '{"title": "Foo"}', {'X-Total-Count': '1'})
+
+        print cache.get('0b1a...')
+        >>> ('{"title": "Foo"}', {'X-Total-Count': '1'})
+    """
+    def __init__(self, max_size=None, folder=None,
+        max_age=RESPONSE_CACHE_MAX_AGE):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            max_size int,None   combined size, in bytes, of the responses kept
+                                in memory. None means unbounded and 0
+                                disables the in-memory cache.
+            folder   str,None   optional folder for the on-disk cache.
+            max_age  float,None age, in seconds, after which entries are
+                                pruned from the on-disk cache. None never
+                                prunes them.
+        """
+        self.memory = LRUCache(max_size=max_size)
+        self.store = FileCache(folder) if folder else None
+        self.max_age = max_age
+        self._pruned = 0
+        self._lock = threading.Lock()
+        self.prune()
+
+    def prune(self):
+        """ Removes the entries of the on-disk cache older than `max_age`
+        seconds, unless it was pruned less than `max_age` seconds ago.
+
+        Returns::
+            int number of entries removed
+        """
+        if not self.store or self.max_age is None:
+            return 0
+
+        with self._lock:
+            now = time.time()
+            if now - self._pruned < self.max_age:
+                return 0
+            self._pruned = now
+        return self.store.prune(self.max_age)
+
+    def get(self, key):
+        """ Returns the response stored under `key`.
+
+        Arguments::
+            key str the key of the entry; must be safe to use as a filename
+
+        Returns::
+            A tuple containing the body and a dict of headers, or None.
+        """
+        entry = self.memory.get(key)
+        if entry is not None:
+            return entry
+
+        if self.store:
+            data = self.store.get(self._key(key))
+            if data is not None:
+                headers, body = data.split('\n', 1)
+                entry = body, json.loads(headers)
+                self.memory.set(key, entry, size=len(data))
+        return entry
+
+    def set(self, key, body, headers=None):
+        """ Stores a response under `key`.
+
+        Arguments::
+            key     str  the key of the entry; must be safe to use as a filename
+            body    str  the serialized body of the response
+            headers dict optional headers of the response
+        """
+        headers = dict(headers or {})
+        encoded = json.dumps(headers)
+        self.memory.set(key, (body, headers), size=len(body) + len(encoded))
+        if self.store:
+            self.store.set(self._key(key), encoded + '\n' + body)
+            self.prune()
+
+    def _key(self, key):
+        """Returns the key of an entry in the on-disk cache."""
+        return '{}.{}'.format(key, RESPONSE_FORMAT)
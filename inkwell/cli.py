@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import os
+import argparse
+from build import Builder
+from inkwell import bootstrap
+import snapshot
+
+def main(argv=None):
+    """ Entry point of the `inkwell` command.
+
+    Usage::
+
+        $: inkwell build --config inkwell.config.ProductionConfig --output public
+        $: inkwell snapshot --config inkwell.config.ProductionConfig --html
+
+    Arguments::
+        argv list optional command line arguments; defaults to `sys.argv`
+    """
+    parser = argparse.ArgumentParser(prog='inkwell')
+    parser.add_argument('--config',
+        default=os.environ.get('INKWELL_CONFIG_MODULE',
+            'inkwell.config.LocalConfig'),
+        help='import path of the configuration to use')
+    commands = parser.add_subparsers(dest='command')
+
+    build = commands.add_parser('build',
+        help='export every API endpoint as static JSON documents')
+    build.add_argument('--output', default=None,
+        help='folder to write documents to; defaults to BUILD_FOLDER')
+    build.add_argument('--page-size', type=int, default=None,
+        help='number of articles per listing page; defaults to BUILD_PAGE_SIZE')
+    build.add_argument('--processes', type=int, default=None,
+        help='number of processes to build with; defaults to the CPU count')
+
+    warm = commands.add_parser('snapshot',
+        help='write the snapshot of parsed articles workers warm up from')
+    warm.add_argument('--output', default=None,
+        help='file to write the snapshot to; defaults to SNAPSHOT_FILE')
+    warm.add_argument('--html', action='store_true', default=None,
+        help='include bodies and rendered HTML; defaults to SNAPSHOT_HTML')
+    warm.add_argument('--pack', action='store_true', default=None,
+        help='keep bodies and HTML in a memory-mapped region shared by '
+            'workers; defaults to SNAPSHOT_PACK')
+    warm.add_argument('--processes', type=int, default=None,
+        help='number of processes to read articles with')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        builder = Builder(args.config, output=args.output,
+            page_size=args.page_size, processes=args.processes)
+        result = builder.build()
+
+        print "Built {} documents in {}, {} unchanged, {} removed.".format(
+              result['built']
+            , builder.output
+            , result['skipped']
+            , result['removed']
+        )
+
+    elif args.command == 'snapshot':
+        app = bootstrap(args.config)
+        path = args.output or app.config.get('SNAPSHOT_FILE')
+        if not path:
+            parser.error('--output is required unless SNAPSHOT_FILE is set')
+
+        html = args.html if args.html is not None else \
+            app.config.get('SNAPSHOT_HTML')
+        pack = args.pack if args.pack is not None else \
+            app.config.get('SNAPSHOT_PACK')
+        result = snapshot.warm(app.extensions['inkwell_reader'], path, html=html,
+            pack=pack, parallel=args.processes, processes=True)
+
+        print "Wrote {} with {} articles, {} of them read again.".format(
+              path
+            , result['restored'] + result['read']
+            , result['read']
+        )
+
+if __name__ == '__main__':
+    main()
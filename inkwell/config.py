@@ -7,6 +7,33 @@ class Config(object):
     TESTING = False
     CACHE_TTL = 28800
     ARTICLES_FOLDER = 'articles'
+    ARTICLES_REF = None
+    ARTICLE_CACHE_SIZE = 32 * 1024 * 1024
+    FRAGMENT_CACHE_SIZE = 16 * 1024 * 1024
+    MARKDOWN_CACHE_SIZE = 16 * 1024 * 1024
+    MARKDOWN_CACHE_FOLDER = None
+    MARKDOWN_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+    HEADER_CACHE_SIZE = 4 * 1024 * 1024
+    RESPONSE_CACHE_SIZE = 8 * 1024 * 1024
+    RESPONSE_CACHE_FOLDER = None
+    RESPONSE_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+    STREAM_THRESHOLD = 100
+    SEARCH_PAGE_SIZE = 10
+    INDEXED_META_KEYS = ['tags']
+    RELATED_LIMIT = 10
+    FEED_SIZE = 20
+    FEED_TITLE = 'Inkwell'
+    FEED_DESCRIPTION = None
+    FEED_AUTHOR = None
+    FEED_LINK = None
+    FEED_ARTICLE_URL = None
+    SNAPSHOT_FILE = None
+    SNAPSHOT_HTML = False
+    SNAPSHOT_PACK = False
+    WATCH_ARTICLES = False
+    WATCH_INTERVAL = 1.0
+    BUILD_FOLDER = 'public'
+    BUILD_PAGE_SIZE = 10
 
 class LocalConfig(Config):
     pass
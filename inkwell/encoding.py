@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+from flask import json
+from json import dumps as _dumps
+from datetime import date, datetime
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+class Fragment(str):
+    """ Class `inkwell.encoding.Fragment` marks a string as an already
+    serialized JSON document, so it can be cached and embedded in larger
+    documents without being decoded and encoded again.
+
+    Usage::
+
+        fragments = [Fragment('{"title": "Foo"}'), Fragment('{"title": "Bar"}')]
+
+        print array(fragments)
+        >>> '[{"title": "Foo"}, {"title": "Bar"}]'
+    """
+    pass
+
+
+class Encoder(json.JSONEncoder):
+    """ Custom JSON encoder used to parse dicts which may contain instances of
+    `inkwell.reader.Article` or `inkwell.reader.ArticleCollection`, or any
+    other object providing a `to_json` method.
+
+    Usage::
+
+        response = {
+            articles: [
+                  Article(filename='2012-02-01-foo.txt', body='foo')
+                , Article(filename='2012-02-01-bar.txt', body='bar')
+                , Article(filename='2012-02-01-baz.txt', body='baz')
+            ]
+        }
+
+        parsed = json.dumps(response, cls=Encoder)
+    """
+    def default(self, obj):
+        return default(obj)
+
+
+def default(obj):
+    """ Converts objects the JSON libraries cannot encode to values they can;
+    articles and collections to their JSON representation and dates and times
+    to strings.
+
+    Arguments::
+        obj object the object to convert
+
+    Returns::
+        The converted value.
+
+    Raises::
+        TypeError if the object cannot be converted.
+    """
+    to_json = getattr(obj, 'to_json', None)
+    if to_json is not None:
+        return to_json()
+    return plain(obj)
+
+
+JSON_TYPES = (basestring, int, long, float, bool, type(None))
+
+def plain(value):
+    """ Converts dates and times within a value to the strings they are
+    encoded as, leaving a value only made of types any JSON library can
+    encode.
+
+    Arguments::
+        value object the value to convert
+
+    Returns::
+        The converted value.
+
+    Raises::
+        TypeError if the value holds any other type of object.
+    """
+    if isinstance(value, JSON_TYPES):
+        return value
+    elif isinstance(value, dict):
+        return {k: plain(v) for k, v in value.iteritems()}
+    elif isinstance(value, (list, tuple)):
+        return [plain(v) for v in value]
+    elif isinstance(value, (datetime, date)):
+        return value.isoformat() + 'Z'
+    elif hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError("{!r} is not JSON serializable".format(value))
+
+def dumps(value):
+    """ Serializes a value to JSON. Fragments are returned as they are. Values
+    are encoded with `ujson` if it is installed and they can be reduced to
+    plain JSON types, and with the standard library otherwise.
+
+    Arguments::
+        value object the value to serialize
+
+    Returns::
+        instance of `inkwell.encoding.Fragment`
+    """
+    if isinstance(value, Fragment):
+        return value
+
+    if ujson is not None:
+        try:
+            return Fragment(ujson.dumps(plain(value),
+                escape_forward_slashes=False))
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    # Flask sorts keys by default, which rules out the standard library's C
+    # accelerated encoder.
+    return Fragment(_dumps(value, default=default))
+
+def array(fragments):
+    """ Joins serialized JSON documents into a JSON array.
+
+    Arguments::
+        fragments iterable instances of `inkwell.encoding.Fragment`
+
+    Returns::
+        instance of `inkwell.encoding.Fragment`
+    """
+    return Fragment('[' + ', '.join(fragments) + ']')
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+import calendar
+from email.utils import formatdate
+from xml.etree import ElementTree
+from encoding import dumps
+
+ATOM_NAMESPACE = 'http://www.w3.org/2005/Atom'
+JSON_FEED_VERSION = 'https://jsonfeed.org/version/1.1'
+
+def entry(article, url):
+    """ Describes an article as a feed entry, from the same JSON
+    representation the API serves, so its Markdown is rendered once and
+    cached for both.
+
+    Arguments::
+        article object instance of `inkwell.reader.Article`
+        url     str    absolute URL of the article
+
+    Returns::
+        dict holding the `url`, `title`, `date`, `summary` and `content` of the
+        entry, as HTML, its `tags`, and its `author` header, or None.
+    """
+    data = article.to_json()
+    meta = data['meta']
+
+    tags = meta.get('tags') or []
+    if not isinstance(tags, (list, tuple)):
+        tags = [tags]
+
+    html = [h for h in (data['summary'], data['body']) if h]
+    return {
+          'url': url
+        , 'title': data['title'] or meta['slug']
+        , 'date': meta['date']
+        , 'summary': data['summary'] or None
+        , 'content': u'\n'.join(html)
+        , 'tags': [unicode(t) for t in tags if t is not None]
+        , 'author': unicode(meta['author']) if meta.get('author') else None
+    }
+
+def atom(feed, entries):
+    """ Builds an Atom 1.0 document.
+
+    Arguments::
+        feed    dict the `title`, `description`, `author`, `link` (URL of the
+                     site) and `url` (URL of the feed itself) of the feed.
+                     Atom requires an author, so feeds without one are
+                     authored by their title; entries name their own author
+                     when the article has one.
+        entries list feed entries, newest first; see `inkwell.feeds.entry`
+
+    Returns::
+        str UTF-8 encoded XML document
+    """
+    root = ElementTree.Element('feed', xmlns=ATOM_NAMESPACE)
+    _text(root, 'title', feed['title'])
+    if feed.get('description'):
+        _text(root, 'subtitle', feed['description'])
+    _text(root, 'id', feed['url'])
+    ElementTree.SubElement(root, 'link', href=feed['link'])
+    ElementTree.SubElement(root, 'link', rel='self', href=feed['url'])
+    _text(root, 'updated', _isoformat(entries[0]['date'] if entries else None))
+    _author(root, feed.get('author') or feed['title'])
+
+    for e in entries:
+        item = ElementTree.SubElement(root, 'entry')
+        _text(item, 'title', e['title'])
+        _text(item, 'id', e['url'])
+        ElementTree.SubElement(item, 'link', href=e['url'])
+        _text(item, 'updated', _isoformat(e['date']))
+        if e.get('author'):
+            _author(item, e['author'])
+        if e['summary']:
+            _text(item, 'summary', e['summary'], type='html')
+        _text(item, 'content', e['content'], type='html')
+        for tag in e['tags']:
+            ElementTree.SubElement(item, 'category', term=tag)
+
+    return _tostring(root)
+
+def rss(feed, entries):
+    """ Builds an RSS 2.0 document. See `inkwell.feeds.atom`.
+
+    Returns::
+        str UTF-8 encoded XML document
+    """
+    root = ElementTree.Element('rss', version='2.0')
+    channel = ElementTree.SubElement(root, 'channel')
+    _text(channel, 'title', feed['title'])
+    _text(channel, 'link', feed['link'])
+    _text(channel, 'description', feed.get('description') or feed['title'])
+    if entries:
+        _text(channel, 'lastBuildDate', _rfc822(entries[0]['date']))
+
+    for e in entries:
+        item = ElementTree.SubElement(channel, 'item')
+        _text(item, 'title', e['title'])
+        _text(item, 'link', e['url'])
+        _text(item, 'guid', e['url'], isPermaLink='true')
+        _text(item, 'pubDate', _rfc822(e['date']))
+        _text(item, 'description', e['content'])
+        for tag in e['tags']:
+            _text(item, 'category', tag)
+
+    return _tostring(root)
+
+def json_feed(feed, entries):
+    """ Builds a JSON Feed 1.1 document. See `inkwell.feeds.atom`.
+
+    Returns::
+        instance of `inkwell.encoding.Fragment`
+    """
+    document = {
+          'version': JSON_FEED_VERSION
+        , 'title': feed['title']
+        , 'home_page_url': feed['link']
+        , 'feed_url': feed['url']
+        , 'items': [{
+              'id': e['url']
+            , 'url': e['url']
+            , 'title': e['title']
+            , 'content_html': e['content']
+            , 'date_published': _isoformat(e['date'])
+            , 'tags': e['tags']
+        } for e in entries]
+    }
+    if feed.get('description'):
+        document['description'] = feed['description']
+    if feed.get('author'):
+        document['authors'] = [{'name': feed['author']}]
+    for item, e in zip(document['items'], entries):
+        if e.get('author'):
+            item['authors'] = [{'name': e['author']}]
+    return dumps(document)
+
+def _text(parent, tag, text, **attributes):
+    """Appends an element holding text to an XML element."""
+    element = ElementTree.SubElement(parent, tag, **attributes)
+    if isinstance(text, str):
+        text = text.decode('utf-8', 'replace')
+    element.text = text
+    return element
+
+def _author(parent, name):
+    """Appends an Atom author element to an XML element."""
+    author = ElementTree.SubElement(parent, 'author')
+    _text(author, 'name', name)
+    return author
+
+def _tostring(root):
+    """Serializes an XML element to a UTF-8 encoded document."""
+    return '<?xml version="1.0" encoding="utf-8"?>\n' + \
+        ElementTree.tostring(root, encoding='utf-8')
+
+def _isoformat(value):
+    """Formats an article date, which is in UTC, as RFC 3339."""
+    if value is None:
+        return '1970-01-01T00:00:00Z'
+    return value.isoformat() + 'Z'
+
+def _rfc822(value):
+    """Formats an article date, which is in UTC, as RFC 822."""
+    return formatdate(calendar.timegm(value.utctimetuple()), usegmt=True)
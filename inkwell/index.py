@@ -0,0 +1,638 @@
+# -*- coding: utf-8 -*-
+import re
+import hashlib
+import calendar
+import threading
+from array import array
+from datetime import date
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+class ArticleIndex(object):
+    """ Class `inkwell.index.ArticleIndex` is an in-memory, date-keyed index of
+    article filenames. It is built once from a directory listing and then
+    answers archive lookups without touching the filesystem again. Articles are
+    stored in a tree keyed by year, month and day, with each day holding a
+    mapping of slugs to their filenames. A sorted array of the date ordinals of
+    all articles is kept alongside them, so date ranges are found by binary
+    search, as is the number of articles of every year, month and day.
+
+    Usage::
+
+        index = ArticleIndex(ARTICLE_FILE_PATTERN)
+        index.add('2013-07-12-welcome-to-inkwell.txt')
+
+        print index.lookup(year=2013, month=7)
+        >>> ['2013-07-12-welcome-to-inkwell.txt']
+
+        print index.tree
+        >>> {'2013': {'07': {'12': {'welcome-to-inkwell':
+                '2013-07-12-welcome-to-inkwell.txt'}}}}
+
+        print index.page(since=date(2013, 7, 1), until=date(2013, 7, 31))
+        >>> (['2013-07-12-welcome-to-inkwell.txt'], 1)
+
+        print index.count(year=2013)
+        >>> 1
+    """
+    def __init__(self, pattern, filenames=None):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            pattern   str  regular expression with `year`, `month`, `day` and
+                           `title` groups used to parse filenames.
+            filenames list optional filenames to populate the index with.
+        """
+        self.pattern = re.compile(pattern)
+        self.tree = {}
+
+        self._entries = {}
+        self._sorted = []
+        self._ordinals = array('l')
+        self._counts = {}
+        self._summary = None
+        self._lock = threading.RLock()
+
+        for filename in filenames or []:
+            self.add(filename)
+
+    def add(self, filename):
+        """ Adds the specified filename to the index. Filenames which do not
+        match the index pattern are ignored.
+
+        Arguments::
+            filename str the name of the article's file.
+
+        Returns::
+            Boolean True if the filename was indexed, otherwise False; for
+            instance if it does not contain a valid date.
+        """
+        matched = self.pattern.match(filename)
+        if not matched:
+            return False
+
+        year, month, day, slug = matched.group('year', 'month', 'day', 'title')
+
+        try:
+            ordinal = date(int(year), int(month), int(day)).toordinal()
+        except ValueError:
+            return False
+
+        with self._lock:
+            if filename in self._entries:
+                return True
+
+            self._entries[filename] = (year, month, day, slug)
+
+            # Filenames start with their date, so both lists stay sorted in
+            # the same order.
+            position = bisect_left(self._sorted, filename)
+            self._sorted.insert(position, filename)
+            self._ordinals.insert(position, ordinal)
+
+            self.tree.setdefault(year, {}).setdefault(month, {})\
+                .setdefault(day, {})[slug] = filename
+
+            for bucket in ((year,), (year, month), (year, month, day)):
+                self._counts[bucket] = self._counts.get(bucket, 0) + 1
+            self._summary = None
+        return True
+
+    def remove(self, filename):
+        """ Removes the specified filename from the index, pruning any date
+        buckets left empty.
+
+        Arguments::
+            filename str the name of the article's file.
+
+        Returns::
+            Boolean True if the filename was removed, otherwise False.
+        """
+        with self._lock:
+            entry = self._entries.pop(filename, None)
+            if entry is None:
+                return False
+
+            position = bisect_left(self._sorted, filename)
+            del self._sorted[position]
+            del self._ordinals[position]
+
+            year, month, day, slug = entry
+            days = self.tree[year][month]
+            del days[day][slug]
+
+            if not days[day]:
+                del days[day]
+            if not days:
+                del self.tree[year][month]
+            if not self.tree[year]:
+                del self.tree[year]
+
+            for bucket in ((year,), (year, month), (year, month, day)):
+                count = self._counts[bucket] - 1
+                if count:
+                    self._counts[bucket] = count
+                else:
+                    del self._counts[bucket]
+            self._summary = None
+        return True
+
+    def lookup(self, year=None, month=None, day=None):
+        """ Returns the filenames of all indexed articles, optionally filtered
+        by date elements, sorted chronologically in descending order.
+
+        Arguments::
+            year  int Four-digit number representing the article year
+            month int Two-digit number representing the article month
+            day   int Two-digit number representing the article day
+
+        Returns::
+            A list containing any matched filenames.
+
+        Raises::
+            ValueError if any of the date elements are not numeric.
+        """
+        year, month, day = self._normalize(year, month, day)
+
+        with self._lock:
+            if not year and not month and not day:
+                return self._sorted[::-1]
+
+            filenames = []
+            for y in ([year] if year else self.tree.keys()):
+                months = self.tree.get(y, {})
+                for m in ([month] if month else months.keys()):
+                    days = months.get(m, {})
+                    for d in ([day] if day else days.keys()):
+                        filenames.extend(days.get(d, {}).values())
+
+        return sorted(filenames, reverse=True)
+
+    def neighbors(self, filename):
+        """ Finds the articles published right before and right after an
+        article by binary search, without looking any of them up.
+
+        Arguments::
+            filename str the name of the article's file.
+
+        Returns::
+            A tuple containing the filenames of the previous, older, and the
+            next, newer, article, either of which is None if there is none.
+        """
+        with self._lock:
+            position = bisect_left(self._sorted, filename)
+            if position >= len(self._sorted) or \
+                self._sorted[position] != filename:
+                return None, None
+
+            older = self._sorted[position - 1] if position else None
+            newer = self._sorted[position + 1] \
+                if position + 1 < len(self._sorted) else None
+        return older, newer
+
+    def count(self, year=None, month=None, day=None):
+        """ Returns the number of indexed articles published under the given
+        date elements, without looking any of them up.
+
+        Arguments::
+            year  int Four-digit number representing the article year
+            month int Two-digit number representing the article month
+            day   int Two-digit number representing the article day
+
+        Returns::
+            int number of articles
+
+        Raises::
+            ValueError if any of the date elements are not numeric, or if they
+            do not describe a single year, month or day.
+        """
+        year, month, day = self._normalize(year, month, day)
+        if not year and not month and not day:
+            return len(self._entries)
+        if not year or (day and not month):
+            raise ValueError('month requires a year, and day a month')
+
+        bucket = tuple(e for e in (year, month, day) if e)
+        return self._counts.get(bucket, 0)
+
+    def summary(self):
+        """ Lists the number of articles published in every year, month and
+        day, newest first. Only the counts kept by the index are read, so the
+        cost of a summary grows with the number of dates, not of articles.
+        The summary is kept until an article is added or removed, and must
+        not be modified.
+
+        Returns::
+            A list of dicts holding the `year`, its `count` and its `months`,
+            which in turn hold the `month`, its `count` and its `days`, each
+            holding the `day` and its `count`.
+        """
+        return self._summarize()[0]
+
+    def checksum(self):
+        """ Returns a checksum of the number of articles published in every
+        day, which changes whenever `ArticleIndex.summary` does. It is computed
+        along with the summary.
+
+        Returns::
+            str SHA-1 hex digest
+        """
+        return self._summarize()[1]
+
+    def _summarize(self):
+        """ Builds the summary and checksum of the index, unless they have
+        been built since the last article was added or removed.
+
+        Returns::
+            A tuple containing the summary and its checksum.
+        """
+        with self._lock:
+            if self._summary is None:
+                counts = self._counts
+                years = [{'year': y, 'count': counts[(y,)], 'months': [
+                    {'month': m, 'count': counts[(y, m)], 'days': [
+                        {'day': d, 'count': counts[(y, m, d)]}
+                        for d in sorted(days, reverse=True)
+                    ]} for m, days in sorted(months.iteritems(), reverse=True)
+                ]} for y, months in sorted(self.tree.iteritems(), reverse=True)]
+
+                digest = hashlib.sha1()
+                for year in years:
+                    for month in year['months']:
+                        for day in month['days']:
+                            digest.update("{}-{}-{}:{}\n".format(year['year'],
+                                month['month'], day['day'], day['count']))
+                self._summary = years, digest.hexdigest()
+            return self._summary
+
+    def page(self, year=None, month=None, day=None, offset=0, limit=0,
+        after=None, since=None, until=None, within=None):
+        """ Returns a single page of filenames, newest first, along with the
+        total number of articles matching the date elements and range. Pages
+        filtered by a year, a year and month, a full date or a range of dates
+        are sliced straight out of the index without copying it.
+
+        Arguments::
+            year   int  Four-digit number representing the article year
+            month  int  Two-digit number representing the article month
+            day    int  Two-digit number representing the article day
+            offset int  Number of matching articles to skip
+            limit  int  Maximum number of filenames to return; 0 for all
+            after  str  Keyset cursor; only articles older than this filename
+                        are returned. Applied before `offset`.
+            since  date Only articles published on or after this date
+            until  date Only articles published on or before this date
+            within list Optional sorted list of indexed filenames, such as
+                        those of a `inkwell.index.MetaIndex`, to page through
+                        instead of every article
+
+        Returns::
+            A tuple containing a list of filenames and the total number of
+            matching articles.
+
+        Raises::
+            ValueError if any of the date elements are not numeric.
+        """
+        year, month, day = self._normalize(year, month, day)
+        bounds = self._bounds(year, month, day)
+
+        if bounds is None:
+            # Date elements which do not describe a single range, such as a
+            # month of every year, are looked up in the tree instead.
+            filenames = self._filter(self.lookup(year, month, day), since,
+                until)
+            if within is not None:
+                within = set(within)
+                filenames = [f for f in filenames if f in within]
+            total = len(filenames)
+            if after:
+                filenames = [f for f in filenames if f < after]
+            offset = max(offset or 0, 0)
+            end = offset + limit if limit and limit > 0 else None
+            return filenames[offset:end], total
+
+        first, last = bounds
+        if since:
+            first = max(first, since.toordinal()) if first else \
+                since.toordinal()
+        if until:
+            last = min(last, until.toordinal()) if last else until.toordinal()
+
+        if within is not None:
+            # Filenames start with their date and a dash, so a range of dates
+            # is also a range of filenames; every filename of the last day
+            # sorts before its date followed by a dot.
+            start = bisect_left(within, date.fromordinal(first).isoformat()) \
+                if first else 0
+            end = bisect_right(within, date.fromordinal(last).isoformat() +
+                '.') if last else len(within)
+            return self._slice(within, start, max(start, end), offset, limit,
+                after)
+
+        with self._lock:
+            start, end = self._range(first, last)
+            return self._slice(self._sorted, start, end, offset, limit, after)
+
+    def _slice(self, filenames, start, end, offset=0, limit=0, after=None):
+        """ Pages through a range of a sorted list of filenames, newest first.
+
+        Returns::
+            A tuple containing a list of filenames and the number of filenames
+            within the range.
+        """
+        offset = max(offset or 0, 0)
+        limit  = max(limit or 0, 0)
+
+        total = end - start
+        if after:
+            end = max(min(end, bisect_left(filenames, after)), start)
+        end = max(end - offset, start)
+        start = max(end - limit, start) if limit else start
+        return filenames[start:end][::-1], total
+
+    def _bounds(self, year=None, month=None, day=None):
+        """ Converts normalized date elements to a range of date ordinals.
+
+        Returns::
+            A tuple containing the first and last ordinal of the range, either
+            of which may be None if it is open, or None if the date elements
+            do not describe a single range.
+        """
+        if not year and not month and not day:
+            return None, None
+        if not year or (day and not month):
+            return None
+
+        try:
+            if day:
+                first = last = date(int(year), int(month), int(day))
+            elif month:
+                first = date(int(year), int(month), 1)
+                last = date(int(year), int(month), calendar.monthrange(
+                    int(year), int(month))[1])
+            else:
+                first, last = date(int(year), 1, 1), date(int(year), 12, 31)
+        except ValueError:
+            return None
+        return first.toordinal(), last.toordinal()
+
+    def _range(self, first=None, last=None):
+        """ Finds the articles published between two date ordinals.
+
+        Returns::
+            A tuple containing the start and end positions of the articles
+            within the sorted list of filenames.
+        """
+        start = bisect_left(self._ordinals, first) if first else 0
+        end = bisect_right(self._ordinals, last) if last else \
+            len(self._ordinals)
+        return start, max(start, end)
+
+    def _filter(self, filenames, since=None, until=None):
+        """Filters a list of indexed filenames by a range of dates."""
+        if not since and not until:
+            return filenames
+
+        first = since.toordinal() if since else None
+        last = until.toordinal() if until else None
+
+        filtered = []
+        with self._lock:
+            for filename in filenames:
+                position = bisect_left(self._sorted, filename)
+                if position >= len(self._sorted) or \
+                    self._sorted[position] != filename:
+                    continue
+                ordinal = self._ordinals[position]
+                if (first is None or ordinal >= first) and \
+                    (last is None or ordinal <= last):
+                    filtered.append(filename)
+        return filtered
+
+    def _normalize(self, year=None, month=None, day=None):
+        """ Zero-pads date elements so they match the keys of the index.
+
+        Returns::
+            A tuple containing the year, month and day as strings, or None.
+
+        Raises::
+            ValueError if any of the date elements are not numeric.
+        """
+        try:
+            year  = "%04d" % (int(year),) if year else None
+            month = "%02d" % (int(month),) if month else None
+            day   = "%02d" % (int(day),) if day else None
+        except:
+            raise ValueError('year, month and day must be of type int')
+        return year, month, day
+
+    def __contains__(self, filename):
+        """Implements `in` checks against indexed filenames."""
+        return filename in self._entries
+
+    def __len__(self):
+        """Returns the number of indexed articles."""
+        return len(self._entries)
+
+    def __iter__(self):
+        """Returns a generator yielding indexed filenames in ascending order."""
+        for filename in list(self._sorted):
+            yield filename
+
+
+class MetaIndex(object):
+    """ Class `inkwell.index.MetaIndex` is an in-memory secondary index of
+    article meta data, such as tags. For each indexed meta key it maps every
+    value to a sorted list of the filenames of the articles having it, so the
+    articles of a tag are found without parsing any other article, and paged
+    through with `inkwell.index.ArticleIndex.page`. Lists of values, such as
+    `tags: [inkwell, python]`, are indexed element by element.
+
+    Articles related to one another by the values they share are computed on
+    demand and kept until an article having one of those values changes.
+
+    Usage::
+
+        index = MetaIndex(['tags'])
+        index.add('2013-07-12-welcome-to-inkwell.txt', {'tags': ['inkwell']})
+
+        print index.lookup('tags', 'inkwell')
+        >>> ['2013-07-12-welcome-to-inkwell.txt']
+
+        print index.values('tags')
+        >>> {u'inkwell': 1}
+
+        print index.related('2013-07-12-welcome-to-inkwell.txt', 'tags')
+        >>> []
+    """
+    def __init__(self, keys):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            keys list names of the meta keys to index
+        """
+        self.keys = list(keys)
+
+        self._values = dict((key, {}) for key in self.keys)
+        self._entries = {}
+        self._related = {}
+        self._lock = threading.RLock()
+
+    def add(self, filename, meta):
+        """ Indexes the meta data of an article, replacing any previous
+        version of it.
+
+        Arguments::
+            filename str  the name of the article's file
+            meta     dict the article's meta data
+        """
+        entries = []
+        for key in self.keys:
+            for value in self._normalize(meta.get(key)):
+                if (key, value) not in entries:
+                    entries.append((key, value))
+
+        with self._lock:
+            self.remove(filename)
+
+            for key, value in entries:
+                filenames = self._values[key].setdefault(value, [])
+                filenames.insert(bisect_left(filenames, filename), filename)
+            if entries:
+                self._entries[filename] = entries
+            self._invalidate(entries)
+
+    def remove(self, filename):
+        """ Removes an article from the index.
+
+        Arguments::
+            filename str the name of the article's file
+
+        Returns::
+            Boolean True if the article had been indexed.
+        """
+        with self._lock:
+            entries = self._entries.pop(filename, None)
+            if entries is None:
+                return False
+
+            self._invalidate(entries)
+            self._related.pop(filename, None)
+            for key, value in entries:
+                filenames = self._values[key][value]
+                del filenames[bisect_left(filenames, filename)]
+                if not filenames:
+                    del self._values[key][value]
+        return True
+
+    def lookup(self, key, value):
+        """ Returns the filenames of the articles with a meta value, sorted
+        chronologically in ascending order.
+
+        Arguments::
+            key   str the meta key
+            value str the meta value
+
+        Returns::
+            A list containing any matched filenames.
+
+        Raises::
+            KeyError if the meta key is not indexed.
+        """
+        normalized = self._normalize(value)
+        with self._lock:
+            values = self._values[key]
+            return list(values.get(normalized[0], [])) if normalized else []
+
+    def values(self, key):
+        """ Counts the articles having each value of a meta key.
+
+        Arguments::
+            key str the meta key
+
+        Returns::
+            dict mapping values to their number of articles
+
+        Raises::
+            KeyError if the meta key is not indexed.
+        """
+        with self._lock:
+            return dict((value, len(filenames)) for value, filenames in
+                self._values[key].iteritems())
+
+    def related(self, filename, key, limit=0):
+        """ Finds the articles sharing the most values of a meta key with an
+        article, such as those with the most tags in common. Articles sharing
+        as many values are ordered newest first.
+
+        The full ranking of an article is kept, once per meta key, until an
+        article sharing one of its values changes, and sliced for each
+        `limit`.
+
+        Arguments::
+            filename str the name of the article's file
+            key      str the meta key
+            limit    int maximum number of filenames to return; 0 for all
+
+        Returns::
+            A list of filenames.
+
+        Raises::
+            KeyError if the meta key is not indexed.
+        """
+        values = self._values[key]
+
+        with self._lock:
+            cached = self._related.setdefault(filename, {})
+            if key not in cached:
+                overlap = defaultdict(int)
+                for k, value in self._entries.get(filename, []):
+                    if k != key:
+                        continue
+                    for other in values[value]:
+                        if other != filename:
+                            overlap[other] += 1
+
+                rank = lambda (other, count): (count, other)
+                ranked = sorted(overlap.iteritems(), key=rank, reverse=True)
+                cached[key] = [other for other, _ in ranked]
+            ranked = cached[key]
+
+        if limit and limit > 0:
+            return ranked[:limit]
+        return list(ranked)
+
+    def _invalidate(self, entries):
+        """Forgets the related articles of every article sharing any of the
+        specified meta values."""
+        for key, value in entries:
+            for filename in self._values[key].get(value, []):
+                self._related.pop(filename, None)
+
+    def _normalize(self, value):
+        """ Converts a meta value to the unicode strings it is indexed by.
+
+        Returns::
+            A list of unicode strings.
+        """
+        if value is None:
+            return []
+        if not isinstance(value, (list, tuple, set)):
+            value = [value]
+
+        normalized = []
+        for v in value:
+            if v is None:
+                continue
+            if isinstance(v, str):
+                v = v.decode('utf-8', 'replace')
+            normalized.append(unicode(v).strip())
+        return [v for v in normalized if v]
+
+    def __contains__(self, filename):
+        """Implements `in` checks against indexed filenames."""
+        return filename in self._entries
+
+    def __len__(self):
+        """Returns the number of articles with any indexed meta data."""
+        return len(self._entries)
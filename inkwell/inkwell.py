@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-from flask import Blueprint, Flask, render_template, current_app
-from api import archive, article
-from . import utils, exceptions
+from flask import Blueprint, Flask, render_template, current_app, request
+from api import archive, article, search, meta, feed
+from . import utils, exceptions, watcher, cache, snapshot
 
 rules = [
       ('/', archive.Archive, 'api_archive')
@@ -9,6 +9,15 @@ rules = [
     , ('/<year>/<month>', archive.Archive, 'api_archive_year_month')
     , ('/<year>/<month>/<day>', archive.Archive, 'api_archive_year_month_day')
     , ('/<year>/<month>/<day>/<title>', article.Article, 'api_article')
+    , ('/archive/summary', archive.Summary, 'api_archive_summary')
+    , ('/search', search.Search, 'api_search')
+    , ('/feed.atom', feed.Atom, 'api_feed_atom')
+    , ('/feed.rss', feed.RSS, 'api_feed_rss')
+    , ('/feed.json', feed.JSONFeed, 'api_feed_json')
+    , ('/tags', meta.Tags, 'api_tags')
+    , ('/tags/<tag>', meta.TagArchive, 'api_tag')
+    , ('/meta/<key>', meta.Values, 'api_meta')
+    , ('/meta/<key>/<value>', meta.ValueArchive, 'api_meta_value')
 ]
 
 api = Blueprint('inkwell_api', __name__, url_prefix='/inkwell')
@@ -21,12 +30,17 @@ for rule in rules:
 def before_request():
     """ Decorator applied to all incoming requests determines whether the
     request contains a valid `Accept` header with the value of
-    `application/json`. Raises `BadRequest` if evaluated to False.
+    `application/json`. Raises `BadRequest` if evaluated to False. Endpoints
+    serving another `mimetype`, such as feeds, are left to content readers
+    which know nothing of the API.
 
     Returns::
         inkwell.exceptions.BadRequest
     """
-    if not utils.request_wants_json():
+    view = current_app.view_functions.get(request.endpoint)
+    mimetype = getattr(getattr(view, 'view_class', None), 'mimetype',
+        'application/json')
+    if mimetype == 'application/json' and not utils.request_wants_json():
         raise exceptions.BadRequest
 
 @api.errorhandler(404)
@@ -71,4 +85,29 @@ def bootstrap(configuration=None):
     app.config.from_object(configuration or 'inkwell.config.LocalConfig')
     app.register_blueprint(api)
 
+    # A single reader serves every request, so its index and caches carry
+    # over from one request to the next.
+    utils.app_reader(app)
+
+    if app.config.get('SNAPSHOT_FILE'):
+        snapshot.warm(app.extensions['inkwell_reader'],
+            app.config.get('SNAPSHOT_FILE'),
+            html=app.config.get('SNAPSHOT_HTML'),
+            pack=app.config.get('SNAPSHOT_PACK'))
+
+    if app.config.get('RESPONSE_CACHE_SIZE') != 0 or \
+        app.config.get('RESPONSE_CACHE_FOLDER'):
+        app.extensions['inkwell_responses'] = cache.ResponseCache(
+              max_size=app.config.get('RESPONSE_CACHE_SIZE')
+            , folder=app.config.get('RESPONSE_CACHE_FOLDER')
+            , max_age=app.config.get('RESPONSE_CACHE_MAX_AGE')
+        )
+
+    if app.config.get('WATCH_ARTICLES'):
+        app.extensions['inkwell_watcher'] = watcher.Watcher(
+              app.extensions['inkwell_reader']
+            , interval=app.config.get('WATCH_INTERVAL')
+        )
+        app.extensions['inkwell_watcher'].start()
+
     return app
\ No newline at end of file
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import mmap
+
+class Pack(object):
+    """ Class `inkwell.pack.Pack` provides read-only access to blobs stored
+    back to back in a region of a file, through a shared memory map. Every
+    process mapping the same file shares a single copy of it in the operating
+    system's page cache, and each read copies one blob out of it, so that
+    processes do not keep blobs of their own between reads.
+
+    Usage::
+
+        writer = PackWriter()
+        location = writer.add('Hello World!')
+
+        with open('/tmp/blobs.pack', 'wb') as f:
+            f.write(writer.getvalue())
+
+        pack = Pack('/tmp/blobs.pack')
+        print pack.read(*location)
+        >>> 'Hello World!'
+    """
+    def __init__(self, path, offset=0):
+        """ Creates class instance and maps the file.
+
+        Arguments::
+            path   str path of the file
+            offset int position of the blob region within the file
+
+        Raises::
+            IOError if the file cannot be opened.
+        """
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.offset = offset
+
+    def read(self, offset, length):
+        """ Reads a blob.
+
+        Arguments::
+            offset int position of the blob within the blob region
+            length int size of the blob in bytes
+
+        Returns::
+            str containing a copy of the blob
+        """
+        start = self.offset + offset
+        return self._map[start:start + length]
+
+    def close(self):
+        """Unmaps the file."""
+        self._map.close()
+
+
+class PackWriter(object):
+    """ Class `inkwell.pack.PackWriter` collects the blobs of a pack.
+    Identical blobs are only stored once.
+    """
+    def __init__(self):
+        """Creates class instance and assigns properties."""
+        self.size = 0
+        self._blobs = []
+        self._locations = {}
+
+    def add(self, data):
+        """ Adds a blob to the pack.
+
+        Arguments::
+            data str,unicode the blob; unicode is encoded as UTF-8
+
+        Returns::
+            A tuple containing the offset and length of the blob.
+        """
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
+
+        location = self._locations.get(data)
+        if location is None:
+            location = self._locations[data] = (self.size, len(data))
+            self._blobs.append(data)
+            self.size += len(data)
+        return location
+
+    def getvalue(self):
+        """ Returns the blob region of the pack.
+
+        Returns::
+            str containing every blob, back to back
+        """
+        return ''.join(self._blobs)
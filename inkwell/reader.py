@@ -1,14 +1,191 @@
 # -*- coding: utf-8 -*-
 import os
 import re
+import copy
 import yaml
 import markdown
-from dateutil import parser
-from datetime import datetime
+import time
+import hashlib
+import threading
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+from stat import S_ISREG
+from datetime import date, datetime
+from index import ArticleIndex, MetaIndex
+from cache import LRUCache, FileCache
+from encoding import dumps
+from search import SearchIndex
 
 ARTICLE_FILE_PATTERN = r'^(?P<year>\d{4})\-(?P<month>\d{2})\-(?P<day>\d{2})\-(?P<title>.*)\.txt$'
 ARTICLE_FILE_SEARCH_PATTERN = r'^%s\-%s\-%s\-.*\.txt$'
 ARTICLE_FILE_EXTENSION = 'txt'
+ARTICLE_CACHE_SIZE = 32 * 1024 * 1024
+ARTICLE_HEADER_READ_SIZE = 4096
+ARTICLE_HEADER_MAX_SIZE = 64 * 1024
+ARTICLE_BATCH_SIZE = 64
+MARKDOWN_CACHE_SIZE = 16 * 1024 * 1024
+MARKDOWN_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+MARKDOWN_EXTENSIONS = ['fenced_code']
+HEADER_CACHE_SIZE = 4 * 1024 * 1024
+FRAGMENT_CACHE_SIZE = 16 * 1024 * 1024
+INDEXED_META_KEYS = ['tags']
+
+try:
+    from yaml import CSafeLoader as HeaderLoader
+except ImportError:
+    from yaml import SafeLoader as HeaderLoader
+
+class HeaderParser(object):
+    """ Class `inkwell.reader.HeaderParser` parses the YAML header blocks of
+    articles with the safe loader, backed by libyaml where it is available,
+    so headers can never construct arbitrary Python objects. Parsed headers
+    are memoized by the SHA-1 hash of the header block, so editing the body of
+    an article does not parse its header again.
+
+    Usage::
+
+        parser = HeaderParser()
+
+        print parser.parse('title: Hello World!')
+        >>> {'title': 'Hello World!'}
+    """
+    def __init__(self, cache_size=HEADER_CACHE_SIZE, loader=HeaderLoader):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            cache_size int,None combined size, in bytes, of the header blocks
+                                whose parsed headers are cached. None means
+                                unbounded and 0 disables the cache.
+            loader     class    YAML loader to parse headers with
+        """
+        self.cache = LRUCache(max_size=cache_size)
+        self.loader = loader
+
+    def parse(self, header):
+        """ Returns the parsed YAML header block. Each call returns its own
+        copy of the cached header, so articles sharing a header block never
+        see each other's changes to it.
+
+        Arguments::
+            header str YAML header block
+
+        Returns::
+            The parsed header; usually a dict.
+
+        Raises::
+            yaml.YAMLError if the header block is invalid.
+        """
+        key = hashlib.sha1(header).hexdigest()
+
+        parsed = self.cache.get(key)
+        if parsed is None:
+            parsed = yaml.load(header, Loader=self.loader)
+            self.cache.set(key, parsed, size=len(header))
+        return copy.deepcopy(parsed)
+
+class MarkdownRenderer(object):
+    """ Class `inkwell.reader.MarkdownRenderer` converts Markdown to HTML and
+    memoizes the result by the SHA-1 hash of the source text, so each version
+    of an article's body is only converted once. Rendered HTML is kept in an
+    in-memory LRU cache and, if a `folder` is specified, also written to disk
+    so it survives worker restarts and is shared between workers. Renderings
+    on disk older than `max_age` seconds are pruned when the renderer is
+    created and at most every `max_age` seconds afterwards, since those of
+    edited and deleted articles are never read again.
+
+    Usage::
+
+        renderer = MarkdownRenderer(folder='/tmp/inkwell-markdown')
+
+        print renderer.render('Hello *World*!')
+        >>> u'<p>Hello <em>World</em>!</p>'
+    """
+    def __init__(self, cache_size=MARKDOWN_CACHE_SIZE, folder=None,
+        max_age=MARKDOWN_CACHE_MAX_AGE):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            cache_size int,None   size, in bytes, of the in-memory cache. None
+                                  means unbounded and 0 disables it.
+            folder     str,None   optional folder for the on-disk cache.
+            max_age    float,None age, in seconds, after which renderings are
+                                  pruned from the on-disk cache. None never
+                                  prunes them.
+        """
+        self.cache = LRUCache(max_size=cache_size)
+        self.store = FileCache(folder) if folder else None
+        self.max_age = max_age
+        self._pruned = 0
+        self._lock = threading.Lock()
+        self.prune()
+
+    def prune(self):
+        """ Removes the renderings of the on-disk cache older than `max_age`
+        seconds, unless it was pruned less than `max_age` seconds ago.
+
+        Returns::
+            int number of renderings removed
+        """
+        if not self.store or self.max_age is None:
+            return 0
+
+        with self._lock:
+            now = time.time()
+            if now - self._pruned < self.max_age:
+                return 0
+            self._pruned = now
+        return self.store.prune(self.max_age)
+
+    def render(self, text):
+        """ Returns the HTML rendering of the specified Markdown.
+
+        Arguments::
+            text str,unicode Markdown to render
+
+        Returns::
+            unicode containing the rendered HTML
+        """
+        if isinstance(text, unicode):
+            text = text.encode('utf-8')
+
+        key = self.key(text)
+
+        html = self.cache.get(key)
+        if html is not None:
+            return html
+
+        if self.store:
+            html = self.store.get(key)
+            if html is not None:
+                html = html.decode('utf-8')
+
+        if html is None:
+            html = markdown.markdown(text.decode('utf-8'),
+                extensions=MARKDOWN_EXTENSIONS)
+            if self.store:
+                self.store.set(key, html.encode('utf-8'))
+                self.prune()
+
+        self.cache.set(key, html, size=len(html))
+        return html
+
+    def key(self, text):
+        """ Returns the key the rendering of the specified Markdown is cached
+        under.
+
+        Arguments::
+            text str,unicode Markdown to render
+
+        Returns::
+            str SHA-1 hex digest of the UTF-8 encoded text
+        """
+        if isinstance(text, unicode):
+            text = text.encode('utf-8')
+        return hashlib.sha1(text).hexdigest()
+
+# Shared by readers and articles created without their own.
+renderer = MarkdownRenderer()
+header_parser = HeaderParser()
 
 class Reader(object):
     """ Class `inkwell.reader.Reader` is responsible for finding articles within
@@ -37,14 +214,78 @@ class Reader(object):
 
         for article in result:
             print article.title
+
+    Note::
+        Filenames are indexed by date the first time a folder is listed. The
+        index is rebuilt whenever the modification time of the folder changes,
+        which it does when files are created, deleted or renamed, unless
+        `check_folder` is off; call `Reader.refresh` to rebuild it then, or
+        apply changes one file at a time with `Reader.update` and
+        `Reader.discard`, as `inkwell.watcher.Watcher` does.
+
+        Parsed articles are cached by the reader as well, and are only re-read
+        when the modification time or size of their file changes. The least
+        recently used articles are evicted once the combined size of their
+        files exceeds `cache_size`. Their serialized JSON is cached alongside,
+        up to `fragment_cache_size` bytes.
+
+        Readers are thread-safe, and are meant to be created once and shared;
+        an Inkwell server holds a single reader in
+        `app.extensions['inkwell_reader']`.
     """
-    def __init__(self, articles_folder=None):
+
+    def __init__(self, articles_folder=None, cache_size=ARTICLE_CACHE_SIZE,
+        fragment_cache_size=FRAGMENT_CACHE_SIZE,
+        indexed_meta_keys=INDEXED_META_KEYS, check_folder=True,
+        renderer=renderer, header_parser=header_parser):
         """ Creates class instance and assigns properties.
 
         Arguments::
-            articles_folder str absolute path to the articles folder.
+            articles_folder     str      absolute path to the articles folder.
+            cache_size          int,None size, in bytes, of the article cache.
+                                         None means unbounded and 0 disables
+                                         it.
+            fragment_cache_size int,None size, in bytes, of the cache of
+                                         serialized articles. See
+                                         `cache_size`.
+            indexed_meta_keys   list     meta keys, such as `tags`, to keep a
+                                         secondary index of. See
+                                         `Reader.meta_index`.
+            check_folder        bool     rebuild the index whenever the
+                                         modification time of the articles
+                                         folder changes.
+            renderer            object   instance of
+                                         `inkwell.reader.MarkdownRenderer`
+                                         the reader's articles are rendered
+                                         with. Defaults to one shared by
+                                         every reader.
+            header_parser       object   instance of
+                                         `inkwell.reader.HeaderParser` to
+                                         parse header blocks with. Defaults
+                                         to one shared by every reader.
         """
         self.articles_folder = articles_folder
+        self.cache_size = cache_size
+        self.fragment_cache_size = fragment_cache_size
+        self.indexed_meta_keys = list(indexed_meta_keys or [])
+        self.check_folder = check_folder
+        self.renderer = renderer
+        self.header_parser = header_parser
+
+        self.cache = LRUCache(max_size=cache_size)
+        self.fragment_cache = LRUCache(max_size=fragment_cache_size)
+
+        self._index = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+        self._search = None
+        self._search_pending = set()
+        self._search_lock = threading.Lock()
+
+        self._meta = None
+        self._meta_pending = set()
+        self._meta_lock = threading.Lock()
 
     @property
     def articles_folder(self):
@@ -65,6 +306,233 @@ class Reader(object):
             raise IOError("article path {} is invalid".format(path))
         self._articles_folder = path
 
+    @property
+    def index(self):
+        """ Provides access to the date-keyed index of the current articles
+        folder, building it on first access, and again whenever the folder's
+        modification time changes if `check_folder` is on.
+
+        Returns::
+            instance of `inkwell.index.ArticleIndex`
+        """
+        index = self._index
+        if index is not None and (not self.check_folder or
+            self._mtime == self._folder_mtime()):
+            return index
+
+        with self._lock:
+            # The modification time is read before listing the folder, so any
+            # change made while it is listed triggers another rebuild.
+            mtime = self._folder_mtime() if self.check_folder else None
+            if self._index is None or mtime != self._mtime:
+                self._index = self._build_index()
+                self._mtime = mtime
+            return self._index
+
+    def refresh(self):
+        """ Rebuilds the index of the current articles folder from a fresh
+        directory listing.
+
+        Returns::
+            instance of `inkwell.index.ArticleIndex`
+        """
+        mtime = self._folder_mtime() if self.check_folder else None
+        index = self._build_index()
+        with self._lock:
+            self._index = index
+            self._mtime = mtime
+        return index
+
+    def last_modified(self):
+        """ Returns the time articles were last created, deleted or renamed;
+        the modification time of the articles folder.
+
+        Returns::
+            The UNIX timestamp of the last change, or None if it is unknown.
+        """
+        return self._folder_mtime()
+
+    def version(self, filename):
+        """ Returns the version of the specified file without reading it. The
+        version changes whenever the content of the file does.
+
+        Arguments::
+            filename str the name of the article's file.
+
+        Returns::
+            The version of the file, or None if it does not exist.
+        """
+        stat = self._stat(filename)
+        return stat[0] if stat else None
+
+    def stat(self, filename):
+        """ Returns the version, size and modification time of the specified
+        file without reading it.
+
+        Arguments::
+            filename str the name of the article's file.
+
+        Returns::
+            A tuple containing the version, the size in bytes and the UNIX
+            timestamp of the last modification of the file, or None if it
+            does not exist.
+        """
+        return self._stat(filename)
+
+    def update(self, filename):
+        """ Brings the index and caches up to date with a created or modified
+        file, without rescanning the articles folder.
+
+        Arguments::
+            filename str the name of the article's file.
+
+        Returns::
+            Boolean True if the file is indexed as an article.
+        """
+        self.cache.delete(filename)
+        self.fragment_cache.delete(filename)
+        if not self._stat(filename):
+            self.discard(filename)
+            return False
+
+        indexed = self.index.add(filename)
+        self._search_pending.add(filename)
+        self._meta_pending.add(filename)
+        return indexed
+
+    def discard(self, filename):
+        """ Removes a deleted file from the index and caches.
+
+        Arguments::
+            filename str the name of the article's file.
+
+        Returns::
+            Boolean True if the file had been indexed.
+        """
+        self.cache.delete(filename)
+        self.fragment_cache.delete(filename)
+
+        removed = self.index.remove(filename)
+        self._search_pending.add(filename)
+        self._meta_pending.add(filename)
+        return removed
+
+    def search(self, query, offset=0, limit=0):
+        """ Finds the articles matching a full-text query, best matches first.
+        See `inkwell.search.SearchIndex`.
+
+        The search index is built from every article the first time it is
+        searched, and rebuilt whenever the date index is. Articles passed to
+        `Reader.update` or `Reader.discard` since, and, if `check_folder` is
+        on, articles whose file changed since they were indexed, are indexed
+        again before searching.
+
+        Arguments::
+            query  str the query; terms ending in `*` are matched as prefixes
+            offset int number of matching articles to skip
+            limit  int maximum number of filenames to return; 0 for all
+
+        Returns::
+            A tuple containing a list of filenames and the total number of
+            matching articles.
+
+        Raises::
+            ValueError if any of the articles are malformed.
+        """
+        index = self.index
+
+        with self._search_lock:
+            if self._search is None or self._search[0] is not index:
+                self._search_pending.clear()
+                versions = {}
+                self._search = index, self._build_search_index(index,
+                    versions), versions
+
+            search, versions = self._search[1:]
+            if self.check_folder:
+                self._search_pending.update(self._changed(versions))
+            while self._search_pending:
+                filename = self._search_pending.pop()
+                search.remove(filename)
+                versions.pop(filename, None)
+                if filename in index:
+                    versions[filename] = self.version(filename)
+                    for article in self.load_all([filename]):
+                        self._index_article(search, article)
+
+        return search.search(query, offset=offset, limit=limit)
+
+    @property
+    def meta_index(self):
+        """ Provides access to the secondary index of the meta keys listed in
+        `indexed_meta_keys`.
+
+        The meta index is built from the headers of every article on first
+        access, and rebuilt whenever the date index is. Articles passed to
+        `Reader.update` or `Reader.discard` since, and, if `check_folder` is
+        on, articles whose file changed since they were indexed, are indexed
+        again before it is returned.
+
+        Returns::
+            instance of `inkwell.index.MetaIndex`
+
+        Raises::
+            ValueError if any of the articles are malformed.
+        """
+        index = self.index
+
+        with self._meta_lock:
+            if self._meta is None or self._meta[0] is not index:
+                self._meta_pending.clear()
+                versions = {}
+                self._meta = index, self._build_meta_index(index,
+                    versions), versions
+
+            meta, versions = self._meta[1:]
+            if self.check_folder:
+                self._meta_pending.update(self._changed(versions))
+            while self._meta_pending:
+                filename = self._meta_pending.pop()
+                meta.remove(filename)
+                versions.pop(filename, None)
+                if filename in index:
+                    versions[filename] = self.version(filename)
+                    for article in self.load_all([filename], lazy=True):
+                        meta.add(article.filename, article.meta)
+
+        return meta
+
+    def neighbors(self, filename):
+        """ Finds the articles published right before and right after an
+        article. See `inkwell.index.ArticleIndex.neighbors`.
+
+        Arguments::
+            filename str the name of the article's file.
+
+        Returns::
+            A tuple containing the filenames of the previous, older, and the
+            next, newer, article, either of which may be None.
+        """
+        return self.index.neighbors(filename)
+
+    def related(self, filename, key='tags', limit=0):
+        """ Finds the articles sharing the most values of an indexed meta key,
+        tags by default, with an article. See
+        `inkwell.index.MetaIndex.related`.
+
+        Arguments::
+            filename str the name of the article's file.
+            key      str the meta key; articles are never related by keys
+                         which are not indexed.
+            limit    int maximum number of filenames to return; 0 for all
+
+        Returns::
+            A list of filenames, most related first.
+        """
+        if key not in self.indexed_meta_keys:
+            return []
+        return self.meta_index.related(filename, key, limit=limit)
+
     def list(self, **kwargs):
         """ Responsible for searching the specified articles folder for files
         that match ARTICLE_FILE_SEARCH_PATTERN. Returns an instance of
@@ -77,32 +545,223 @@ class Reader(object):
             by_month int Two-digit number representing the article month
             by_day   int Two-digit number representing the article day
             limit    int Number of articles to return
-            offset   int Position from which to collect articles
+            offset   int Number of articles to skip
+            after    str Path of an article, as in its `meta.path`; only
+                         older articles are returned. Applied before offset.
+            since    date,str Only articles published on or after this date;
+                          strings must be formatted as `YYYY-MM-DD`.
+            until    date,str Only articles published on or before this date.
+            by_meta  dict Only articles with these meta values, such as
+                          `{'tags': 'python'}`; keys must be listed in
+                          `indexed_meta_keys`.
+            lazy     bool Only read article headers; bodies are loaded when
+                          first accessed. See `Reader.fetch_article`.
+            parallel  int  Size of the pool articles are loaded across. See
+                           `Reader.load_all`.
+            processes bool Load articles across processes, not threads.
 
         Returns::
-            instance of `inkwell.reader.ArticleCollection`
+            instance of `inkwell.reader.ArticleCollection`, with its `total`
+            set to the number of matching articles and its `cursor` set to the
+            `after` value of the next page, if there is one.
+
+        Raises::
+            ValueError if the date elements, `after`, `since` or `until` are
+            invalid, or if `by_meta` holds a key that is not indexed.
         """
-        by_year  = kwargs.get('by_year', None)
-        by_month = kwargs.get('by_month', None)
-        by_day   = kwargs.get('by_day', None)
-        limit    = kwargs.get('limit', None)
-        offset   = kwargs.get('offset', None)
+        filenames, total, cursor = self.page(**kwargs)
 
-        articles = ArticleCollection()
+        articles = self.load_all(filenames
+            , parallel=kwargs.get('parallel', None)
+            , processes=kwargs.get('processes', False)
+            , lazy=kwargs.get('lazy', False)
+        )
+        articles.total = total
+        articles.cursor = cursor
+        return articles
 
-        # Get the entire list of article filenames and sort them chronologically
-        # in descending order by default.
-        filenames = sorted(self._filter_articles(by_year, by_month, by_day),
-            reverse=True)
+    def load_all(self, filenames=None, parallel=None, processes=False,
+        lazy=False):
+        """ Loads the specified articles, or every indexed article, into the
+        article cache. Articles which are not cached yet are read and parsed
+        across a pool of `parallel` threads or, since parsing YAML headers is
+        mostly CPU-bound, processes.
 
-        if limit:
-            filenames = filenames[offset:limit]
+        Arguments::
+            filenames list,None names of the articles' files; defaults to every
+                                indexed article, newest first
+            parallel  int,None  size of the pool; articles are loaded one at a
+                                time unless greater than 1
+            processes bool      use a process pool rather than a thread pool
+            lazy      bool      see `Reader.fetch_article`
 
-        for filename in filenames:
-            article = self.fetch_article(filename=filename)
-            if article:
-                articles.append(article)
-        return articles
+        Returns::
+            instance of `inkwell.reader.ArticleCollection` holding the
+            articles in the order of `filenames`, less any which no longer
+            exist.
+
+        Raises::
+            ValueError if any of the articles are malformed.
+        """
+        if filenames is None:
+            filenames = self.index.lookup()
+
+        articles = [None] * len(filenames)
+        pending = []
+        for position, filename in enumerate(filenames):
+            stat = self._stat(filename)
+            if not stat:
+                continue
+
+            article = self.cache.get(filename, version=stat[0])
+            if article is None:
+                pending.append((position, filename, stat))
+            else:
+                articles[position] = article
+
+        parsed = self._read_articles([filename for _, filename, _ in pending],
+            parallel, processes, lazy)
+
+        for (position, filename, stat), result in zip(pending, parsed):
+            article = self._build_article(filename, *result)
+            self.cache.set(filename, article, version=stat[0], size=stat[1])
+            articles[position] = article
+
+        return ArticleCollection([a for a in articles if a is not None])
+
+    def iterate(self, filenames=None, lazy=False, batch_size=ARTICLE_BATCH_SIZE):
+        """ Yields the specified articles one at a time, loading them
+        `batch_size` at a time, so no more than a batch of articles is held
+        outside of the article cache however many are iterated over.
+
+        Arguments::
+            filenames  list,None names of the articles' files; defaults to every
+                                 indexed article, newest first
+            lazy       bool      see `Reader.fetch_article`
+            batch_size int       number of articles loaded at once
+
+        Returns::
+            generator yielding `inkwell.reader.Article` instances in the order
+            of `filenames`, less any which no longer exist.
+
+        Raises::
+            ValueError if any of the articles are malformed.
+        """
+        if filenames is None:
+            filenames = self.index.lookup()
+
+        for start in xrange(0, len(filenames), batch_size):
+            batch = self.load_all(filenames[start:start + batch_size],
+                lazy=lazy)
+            for article in batch.articles:
+                yield article
+
+    def fragments(self, filenames, fields=None, lazy=True,
+        batch_size=ARTICLE_BATCH_SIZE):
+        """ Yields the JSON representation of the specified articles, as
+        returned by `Article.to_json`, already serialized. Each article is
+        serialized once per version of its file and set of fields, after which
+        it is served straight from the fragment cache without being read,
+        rendered or encoded again. Articles which are not cached are loaded
+        `batch_size` at a time, as with `Reader.iterate`.
+
+        Arguments::
+            filenames  list names of the articles' files
+            fields     list optional subset of `Article.JSON_FIELDS` to include
+            lazy       bool see `Reader.fetch_article`
+            batch_size int  number of articles loaded at once
+
+        Returns::
+            generator yielding `inkwell.encoding.Fragment` instances in the
+            order of `filenames`, less any articles which no longer exist.
+
+        Raises::
+            ValueError if any of the articles are malformed.
+        """
+        fields = tuple(f for f in Article.JSON_FIELDS
+            if not fields or f in fields)
+        cache = self.fragment_cache
+
+        for start in xrange(0, len(filenames), batch_size):
+            fragments = {}
+            pending = {}
+            for filename in filenames[start:start + batch_size]:
+                stat = self._stat(filename)
+                if not stat:
+                    continue
+
+                # Every set of fields an article was serialized with is
+                # cached under its filename, so they are dropped together.
+                cached = cache.get(filename, version=stat[0]) or {}
+                if fields in cached:
+                    fragments[filename] = cached[fields]
+                else:
+                    pending[filename] = stat, cached
+
+            if pending:
+                for article in self.load_all(sorted(pending), lazy=lazy):
+                    stat, cached = pending[article.filename]
+                    fragment = dumps(article.to_json(fields=fields))
+
+                    cached = dict(cached)
+                    cached[fields] = fragment
+                    cache.set(article.filename, cached, version=stat[0],
+                        size=sum(len(f) for f in cached.itervalues()))
+                    fragments[article.filename] = fragment
+
+            for filename in filenames[start:start + batch_size]:
+                if filename in fragments:
+                    yield fragments[filename]
+
+    def page(self, **kwargs):
+        """ Looks up the filenames of the articles `Reader.list` would return,
+        without opening any of them. Accepts the same arguments.
+
+        Returns::
+            A tuple containing a list of filenames, newest first, the total
+            number of matching articles and the `after` value of the next page,
+            or None if there is none.
+
+        Raises::
+            ValueError if the date elements, `after`, `since` or `until` are
+            invalid, or if `by_meta` holds a key that is not indexed.
+        """
+        by_year  = kwargs.get('by_year', None)
+        by_month = kwargs.get('by_month', None)
+        by_day   = kwargs.get('by_day', None)
+        limit    = max(kwargs.get('limit', None) or 0, 0)
+        offset   = kwargs.get('offset', None)
+        after    = kwargs.get('after', None)
+        since    = self._to_date(kwargs.get('since', None))
+        until    = self._to_date(kwargs.get('until', None))
+        by_meta  = kwargs.get('by_meta', None)
+
+        if after:
+            after = self._path_to_filename(after)
+
+        within = None
+        if by_meta:
+            meta = self.meta_index
+            for key, value in sorted(by_meta.iteritems()):
+                if key not in meta.keys:
+                    raise ValueError("{} is not an indexed meta key".format(key))
+                filenames = meta.lookup(key, value)
+                within = filenames if within is None else \
+                    sorted(set(within).intersection(filenames))
+
+        # The index returns filenames sorted chronologically in descending
+        # order by default. One extra filename is requested to find out
+        # whether there is a next page.
+        filenames, total = self.index.page(by_year, by_month, by_day,
+            offset=offset, limit=limit + 1 if limit else 0, after=after,
+            since=since, until=until, within=within)
+
+        cursor = None
+        if limit and len(filenames) > limit:
+            filenames = filenames[:limit]
+            cursor = self._filename_to_path(filenames[-1])
+
+        return filenames, total, cursor
 
     def fetch_article(self, filename=None, **kwargs):
         """ Attempts to locate and open the specified file. If a filename is
@@ -114,6 +773,9 @@ class Reader(object):
             month    str Two-digit number representing the article month
             day      str Two-digit number representing the article day
             title    str Slugified title of article
+            lazy     bool Only read the header block of the file, at most
+                          ARTICLE_HEADER_MAX_SIZE bytes of it, and defer
+                          reading the body until it is first accessed.
 
         Return::
             instance of `inkwell.reader.Article`
@@ -124,37 +786,57 @@ class Reader(object):
             this method will raise ValueError.
         """
         if not filename:
-            year  = kwargs.get('year', None)
-            month = kwargs.get('month', None)
-            day   = kwargs.get('day', None)
+            filename = self._build_filename(**kwargs)
 
-            year  = "%02d" % (int(year),) if year else None
-            month = "%02d" % (int(month),) if month else None
-            day   = "%02d" % (int(day),) if day else None
+        stat = self._stat(filename)
+        if not stat:
+            return False
+
+        version, size, modified = stat
+
+        article = self.cache.get(filename, version=version)
+        if article is None:
+            article = self._build_article(filename,
+                *self._read_article(filename, kwargs.get('lazy', False)))
+            self.cache.set(filename, article, version=version, size=size)
+        return article
 
-            title = kwargs.get('title', None)
+    def _build_filename(self, **kwargs):
+        """ Constructs the filename of an article from its date elements and
+        slugified title.
 
-            if not year and not month and not day and not title:
-                raise ValueError('Year, month, day and title not specified.')
+        Arguments::
+            year  str Four-digit number representing the article year
+            month str Two-digit number representing the article month
+            day   str Two-digit number representing the article day
+            title str Slugified title of article
 
-            filename = "{}.{}".format('-'.join([
-                  str(year)
-                , str(month)
-                , str(day)
-                , str(title)
-            ]), ARTICLE_FILE_EXTENSION)
+        Returns::
+            str filename matching ARTICLE_FILE_PATTERN
 
-        path_to_file = os.path.join(self._articles_folder, filename)
+        Raises::
+            ValueError if none of the arguments are specified, or the date
+            elements are not numeric.
+        """
+        year  = kwargs.get('year', None)
+        month = kwargs.get('month', None)
+        day   = kwargs.get('day', None)
+
+        year  = "%02d" % (int(year),) if year else None
+        month = "%02d" % (int(month),) if month else None
+        day   = "%02d" % (int(day),) if day else None
+
+        title = kwargs.get('title', None)
 
-        if os.path.isfile(path_to_file):
-            try:
-                with open(path_to_file) as f:
-                    article = self._article_factory(f.read(), filename)
-                    f.close()
-                return article
-            except:
-                raise
-        return False
+        if not year and not month and not day and not title:
+            raise ValueError('Year, month, day and title not specified.')
+
+        return "{}.{}".format('-'.join([
+              str(year)
+            , str(month)
+            , str(day)
+            , str(title)
+        ]), ARTICLE_FILE_EXTENSION)
 
     def _article_factory(self, content, filename):
         """ Attempts to parse the given file stream for article header and body
@@ -176,22 +858,149 @@ class Reader(object):
 
             Will raise ValueError if the file or header block are invalid.
         """
+        meta, body = self._split_article(content, filename)
+        return Article(filename=filename, meta=meta, body=body,
+            renderer=self.renderer)
+
+    def _split_article(self, content, filename):
+        """ Splits the content of a file into its parsed header and its body.
+
+        Arguments::
+            content  str The content of the current file.
+            filename str The name of the current file.
+
+        Return::
+            A tuple containing the article's metadata and body.
+
+        Raises::
+            ValueError if the file or header block are invalid.
+        """
         try:
             header, body = content.split('\n\n', 1)
         except:
             raise ValueError("{} may be malformed.".format(filename))
 
+        meta = self._parse_header(header, filename)
+
+        if isinstance(meta, str):
+            body = meta
+            meta = {}
+
+        return meta, body
+
+    def _read_article(self, filename, lazy=False):
+        """ Reads and parses the given file without creating an article. The
+        result only holds built-in types, so files can be read and parsed in
+        worker processes.
+
+        Arguments::
+            filename str  The name of the current file.
+            lazy     bool Only read the header block, in chunks of
+                          ARTICLE_HEADER_READ_SIZE bytes. Files without a
+                          YAML header, or whose header block is larger than
+                          ARTICLE_HEADER_MAX_SIZE bytes, are read in full.
+
+        Return::
+            A tuple containing the article's metadata, its body and the offset
+            of the body within the file. Lazily read articles have no body,
+            other articles have no offset.
+
+        Raises::
+            ValueError if the file or header block are invalid.
+        """
+        if lazy:
+            content = ''
+            with self._open(filename) as f:
+                while '\n\n' not in content and \
+                    len(content) < ARTICLE_HEADER_MAX_SIZE:
+                    chunk = f.read(ARTICLE_HEADER_READ_SIZE)
+                    if not chunk:
+                        break
+                    content += chunk
+
+            if '\n\n' in content:
+                header = content.split('\n\n', 1)[0]
+                meta = self._parse_header(header, filename)
+
+                if isinstance(meta, dict):
+                    return meta, None, len(header) + 2
+
+        with self._open(filename) as f:
+            meta, body = self._split_article(f.read(), filename)
+        return meta, body, None
+
+    def _read_articles(self, filenames, parallel=None, processes=False,
+        lazy=False):
+        """ Reads and parses several files, optionally across a pool of
+        threads or processes. See `Reader.load_all`.
+
+        Return::
+            A list holding the result of `Reader._read_article` for each of
+            the files, in order.
+        """
+        if not parallel > 1 or len(filenames) < 2:
+            return [self._read_article(filename, lazy) for filename in filenames]
+
+        if processes:
+            pool = multiprocessing.Pool(parallel,
+                initializer=_initialize_worker, initargs=(self, lazy))
+            read = _read_article
+        else:
+            pool = ThreadPool(parallel)
+            read = lambda filename: self._read_article(filename, lazy)
+
         try:
-            meta = yaml.load(header)
+            return pool.map(read, filenames,
+                max(len(filenames) // (parallel * 4), 1))
+        finally:
+            pool.close()
+            pool.join()
+
+    def _build_article(self, filename, meta, body=None, offset=None):
+        """ Creates an article from the result of `Reader._read_article`.
+        Articles with an offset read their body from the file when it is first
+        accessed.
+
+        Return::
+            instance of `inkwell.reader.Article`
+        """
+        if offset is None:
+            return Article(filename=filename, meta=meta, body=body,
+                renderer=self.renderer)
+
+        def loader():
+            with self._open(filename) as f:
+                f.seek(offset)
+                return f.read()
+
+        return Article(filename=filename, meta=meta, loader=loader,
+            renderer=self.renderer)
+
+    def _after_fork(self):
+        """ Called in worker processes forked by `Reader.load_all`, before
+        any file is read. Readers holding resources which cannot be shared
+        with their parent process replace them here.
+        """
+        pass
+
+    def _parse_header(self, header, filename):
+        """ Parses the YAML header block of an article.
+
+        Arguments::
+            header   str The header block of the current file.
+            filename str The name of the current file.
+
+        Return::
+            The parsed header; usually a dict.
 
-            if isinstance(meta, str):
-                body = meta
-                meta = {}
+        Raises::
+            ValueError if the header block is invalid.
+        """
+        try:
+            return self.header_parser.parse(header)
         except:
             raise ValueError("{} has an invalid header.".format(filename))
 
-        return Article(filename=filename, meta=meta, body=body)
-
     def _build_filter_pattern(self, year=None, month=None, day=None):
         """This method will attempt to dynamically construct the REGEX used to
         filter files by date elements.
@@ -219,9 +1028,190 @@ class Reader(object):
             , day   or '\d{2}'
         )
 
+    def _to_date(self, value):
+        """ Converts a `since` or `until` argument to a date.
+
+        Arguments::
+            value date,datetime,str,None a date, or a string formatted as
+                                         `YYYY-MM-DD`
+
+        Returns::
+            instance of `datetime.date`, or None
+
+        Raises::
+            ValueError if the string is not a valid date.
+        """
+        if not value:
+            return None
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return datetime.strptime(value, '%Y-%m-%d').date()
+
+    def _build_search_index(self, index, versions):
+        """ Builds a full-text index of every article in a date index.
+
+        Arguments::
+            index    object instance of `inkwell.index.ArticleIndex`
+            versions dict   filled with the version of every indexed file
+
+        Returns::
+            instance of `inkwell.search.SearchIndex`
+        """
+        filenames = list(index)
+        versions.update((f, self.version(f)) for f in filenames)
+
+        search = SearchIndex()
+        for article in self.iterate(filenames):
+            self._index_article(search, article)
+        return search
+
+    def _build_meta_index(self, index, versions):
+        """ Builds a secondary index of the meta data of every article in a
+        date index. Only article headers are read.
+
+        Arguments::
+            index    object instance of `inkwell.index.ArticleIndex`
+            versions dict   filled with the version of every indexed file
+
+        Returns::
+            instance of `inkwell.index.MetaIndex`
+        """
+        filenames = list(index)
+        versions.update((f, self.version(f)) for f in filenames)
+
+        meta = MetaIndex(self.indexed_meta_keys)
+        for article in self.iterate(filenames, lazy=True):
+            meta.add(article.filename, article.meta)
+        return meta
+
+    def _changed(self, versions):
+        """ Returns the indexed files which changed, or were deleted, since
+        they were indexed. Versions are recorded before files are read, so a
+        file changed while it is read is indexed again.
+
+        Arguments::
+            versions dict mapping filenames to the version they were indexed at
+
+        Returns::
+            A list of filenames.
+        """
+        return [filename for filename, version in versions.iteritems()
+            if self.version(filename) != version]
+
+    def _index_article(self, search, article):
+        """ Adds the title, tags, summary and body of an article to a
+        full-text index.
+
+        Arguments::
+            search  object instance of `inkwell.search.SearchIndex`
+            article object instance of `inkwell.reader.Article`
+        """
+        text = [t for t in (article.summary, article.body)
+            if isinstance(t, basestring)]
+        search.add(article.filename, title=article.title,
+            tags=article.meta.get('tags'), body='\n\n'.join(text))
+
+    def _path_to_filename(self, path):
+        """ Converts an article path, as in `meta.path`, to its filename.
+
+        Arguments::
+            path str path in the form of `year/month/day/slug`
+
+        Returns::
+            str filename matching ARTICLE_FILE_PATTERN
+
+        Raises::
+            ValueError if the path is malformed.
+        """
+        parts = path.strip('/').split('/', 3)
+        if len(parts) != 4:
+            raise ValueError("{} is not a valid article path.".format(path))
+
+        filename = "{}.{}".format('-'.join(parts), ARTICLE_FILE_EXTENSION)
+        if not re.match(ARTICLE_FILE_PATTERN, filename):
+            raise ValueError("{} is not a valid article path.".format(path))
+        return filename
+
+    def _filename_to_path(self, filename):
+        """ Converts an article filename to its path, as in `meta.path`.
+
+        Arguments::
+            filename str filename matching ARTICLE_FILE_PATTERN
+
+        Returns::
+            str path in the form of `year/month/day/slug`
+        """
+        matched = re.match(ARTICLE_FILE_PATTERN, filename)
+        return '/'.join(matched.group('year', 'month', 'day', 'title'))
+
+    def _build_index(self):
+        """ Lists the current articles folder once and indexes every filename
+        matching ARTICLE_FILE_PATTERN.
+
+        Returns::
+            instance of `inkwell.index.ArticleIndex`
+        """
+        return ArticleIndex(ARTICLE_FILE_PATTERN, self._listdir())
+
+    def _folder_mtime(self):
+        """ Returns the modification time of the articles folder, or None if
+        it cannot be read.
+        """
+        try:
+            return os.stat(self.articles_folder).st_mtime
+        except OSError:
+            return None
+
+    def _listdir(self):
+        """ Lists the names of all files in the current articles folder. This,
+        along with `Reader._stat` and `Reader._open`, is the only place the
+        reader touches storage and can be overridden to read articles from
+        elsewhere.
+
+        Returns::
+            A list of filenames.
+        """
+        return os.listdir(self.articles_folder)
+
+    def _stat(self, filename):
+        """ Returns the version, size and modification time of the specified
+        file. The version changes whenever the content of the file does.
+
+        Arguments::
+            filename str The name of the current file.
+
+        Returns::
+            A tuple containing the version, the size in bytes and the UNIX
+            timestamp of the last modification of the file, or None if it
+            does not exist or is not a regular file.
+        """
+        try:
+            stat = os.stat(os.path.join(self.articles_folder, filename))
+        except OSError:
+            return None
+
+        if not S_ISREG(stat.st_mode):
+            return None
+        return (stat.st_mtime, stat.st_size), stat.st_size, stat.st_mtime
+
+    def _open(self, filename):
+        """ Opens the specified file for reading.
+
+        Arguments::
+            filename str The name of the current file.
+
+        Returns::
+            A file-like object which supports `read`, `seek` and use as a
+            context manager.
+        """
+        return open(os.path.join(self.articles_folder, filename))
+
     def _filter_articles(self, year=None, month=None, day=None):
-        """Applies the configured filter pattern to the specified articles
-        folder and returns a list containing the resulting filenames.
+        """Looks up the specified date elements in the index of the current
+        articles folder and returns a list containing the resulting filenames,
+        newest first.
 
         Arguments::
             year  str Four-digit number representing the article year
@@ -231,11 +1221,7 @@ class Reader(object):
         Returns::
             A list containing any matched filenames.
         """
-        return [
-            f
-            for f in os.listdir(self.articles_folder)
-            if re.match(self._build_filter_pattern(year, month, day), f)
-        ]
+        return self.index.lookup(year, month, day)
 
 
 class Article(object):
@@ -285,9 +1271,21 @@ class Article(object):
 
         print article.tags
         >>> ['foo', 'bar']
+
+    `Article.meta` builds a new copy of the metadata on every access, so
+    changing it has no effect on the article. Set properties of the header
+    block as attributes, or assign a whole header block to `Article.meta`,
+    instead:
+
+        article.tags = ['foo', 'baz']
+        article.meta = {'tags': ['foo', 'baz'], 'time': '12:34:00'}
     """
 
     IGNORED_META_TAGS = ['date', 'summary']
+    JSON_FIELDS = ['title', 'summary', 'body', 'meta']
+
+    __slots__ = ['filename', 'loader', 'retain', 'renderer', 'rendered',
+        '_meta', '_body', '_summary', '_title', '_date', '_parts']
 
     def __init__(self, filename, **kwargs):
         """ Creates class instance and assigns properties.
@@ -297,52 +1295,52 @@ class Article(object):
             kwargs['title'] str  official article title
             kwargs['body']  str  the main body of the article
             kwargs['meta']  dict containing additional metadata properties
+            kwargs['loader'] callable returning the main body of the article;
+                             called the first time the body or summary is
+                             accessed, in place of specifying a body
+            kwargs['retain'] bool keep the body once loaded; if False, the
+                             loader is called every time the body or summary
+                             is accessed. Defaults to True.
+            kwargs['renderer'] object instance of
+                             `inkwell.reader.MarkdownRenderer` to render the
+                             summary and body with. Defaults to the one
+                             shared by every reader.
+            kwargs['rendered'] callable returning the HTML of the summary
+                             and body, or False for either, in place of
+                             rendering them with the renderer.
 
         Raises::
-            ValueError for invalid filename values
+            ValueError for invalid filename values, including filenames with
+            dates which do not exist
         """
-        self.matched = re.search(ARTICLE_FILE_PATTERN, filename)
-        if not self.matched:
+        matched = re.search(ARTICLE_FILE_PATTERN, filename)
+        if not matched:
             raise ValueError('filename must match ARTICLE_FILE_PATTERN.')
 
+        # The year, month, day and slug are looked up for every article
+        # listed, so the filename is only ever matched once.
         self.filename = filename
-        self.meta = kwargs.get('meta', {})
+        self._parts = matched.group('year', 'month', 'day', 'title')
+        self.date = datetime(*[int(part) for part in self._parts[:3]])
+        self.meta = kwargs.get('meta') or {}
         self.body = kwargs.get('body', '')
-        self.title = kwargs.get('title', '')
-
-        self.date = parser.parse("{}/{}/{}".format(
-              self.matched.group('year')
-            , self.matched.group('month')
-            , self.matched.group('day')
-        ))
-
-        if self.meta:
-            for key, value in self.meta.iteritems():
-                if key.lower() not in self.IGNORED_META_TAGS:
-                    setattr(self, key, value)
-
-        # Give 'summary' special treatment:
-        if 'summary' in self.meta and self.meta['summary'] is True:
-            summary, body = self.body.split('\n\n', 1)
-            self.summary = summary
-            self.body    = body
+        self.loader = kwargs.get('loader', None)
+        self.retain = kwargs.get('retain', True)
+        self.renderer = kwargs.get('renderer') or renderer
+        self.rendered = kwargs.get('rendered', None)
+        self._summary = None
 
-        self.meta['date']  = self.date
-        self.meta['slug']  = self.matched.group('title')
-        self.meta['year']  = self.matched.group('year')
-        self.meta['month'] = self.matched.group('month')
-        self.meta['day']   = self.matched.group('day')
-        self.meta['path']  = "{}/{}/{}/{}".format(
-              self.matched.group('year')
-            , self.matched.group('month')
-            , self.matched.group('day')
-            , self.matched.group('title')
-        )
+        # A title in the header block takes precedence over one passed in.
+        self.title = self._meta['title'] if 'title' in self._meta else \
+            kwargs.get('title', '')
+
+        if not self.loader:
+            self._split_summary()
 
     @property
     def title(self):
         """Returns the current article's title."""
-        return self._title
+        return self._title or self._unslugify(self.slug)
 
     @title.setter
     def title(self, title=None):
@@ -353,16 +1351,33 @@ class Article(object):
         Arguments::
             title str,None the title of the article
         """
-        if title:
-            self._title = title
-        else:
-            self._title = self._unslugify(self.matched.group('title'))
+        self._title = title or None
+
+    @property
+    def body(self):
+        """Returns the current article's body, loading it first if the
+        article was created with a loader.
+        """
+        if self.loader:
+            return self._load()[1]
+        return self._body
+
+    @body.setter
+    def body(self, body=''):
+        """Sets the current article's body.
+
+        Arguments::
+            body str the main body of the article
+        """
+        self._body = body
 
     @property
     def summary(self):
         """Returns the current article's summary (if specified in the meta
-        block.
+        block. The body is only loaded if the article has a summary.
         """
+        if self.loader and self._has_summary():
+            return self._load()[0]
         return self._summary
 
     @summary.setter
@@ -378,6 +1393,57 @@ class Article(object):
         """
         self._summary = summary
 
+    @property
+    def meta(self):
+        """Returns the metadata of the current article: every property of its
+        header block along with its date, slug, year, month, day and path,
+        which are derived from its filename. A deep copy is returned on each
+        access.
+        """
+        meta = copy.deepcopy(self._meta)
+        meta['date']  = self.date
+        meta['slug']  = self.slug
+        meta['year']  = self.year
+        meta['month'] = self.month
+        meta['day']   = self.day
+        meta['path']  = self.path
+        return meta
+
+    @meta.setter
+    def meta(self, meta):
+        """Sets the properties of the current article's header block.
+
+        Arguments::
+            meta dict containing additional metadata properties
+        """
+        self._meta = meta
+
+    @property
+    def slug(self):
+        """Returns the slugified title of the current article's filename."""
+        return self._parts[3]
+
+    @property
+    def year(self):
+        """Returns the four-digit year of the current article."""
+        return self._parts[0]
+
+    @property
+    def month(self):
+        """Returns the zero-padded month of the current article."""
+        return self._parts[1]
+
+    @property
+    def day(self):
+        """Returns the zero-padded day of the current article."""
+        return self._parts[2]
+
+    @property
+    def path(self):
+        """Returns the path of the current article, as in `year/month/day/slug`.
+        """
+        return '/'.join(self._parts)
+
     @property
     def date(self):
         """Returns the current article's date."""
@@ -394,8 +1460,10 @@ class Article(object):
         assert isinstance(date, datetime)
         self._date = date
 
-    def to_json(self):
-        """ Returns a JSON representation of the current article.
+    def to_json(self, fields=None):
+        """ Returns a JSON representation of the current article. Only the
+        specified fields are rendered; omitting `summary` and `body` means the
+        body of a lazily loaded article is never read.
 
         Usage::
 
@@ -420,22 +1488,78 @@ class Article(object):
                 }
             }
 
+            print article.to_json(fields=['title', 'meta'])
+            >>> {
+                  'title': 'Another Example'
+                , 'meta': { ... }
+            }
+
+        Arguments::
+            fields list optional subset of JSON_FIELDS to include
+
         Returns::
             dictionary containing the JSON output for the article.
         """
-        if self.summary:
-            summary = markdown.markdown(self.summary,
-                extensions=['fenced_code'])
+        fields = fields or self.JSON_FIELDS
+        result = {}
+
+        if 'title' in fields:
+            result['title'] = self.title
+
+        if 'summary' in fields or 'body' in fields:
+            if self.rendered:
+                html = self.rendered()
+            else:
+                # The body is loaded once, since articles which do not retain
+                # it read it again on every access.
+                html = [self.renderer.render(text) if text and
+                    field in fields else False
+                    for field, text in zip(('summary', 'body'), self._load())]
+
+            if 'summary' in fields:
+                result['summary'] = html[0] or False
+            if 'body' in fields:
+                result['body'] = html[1] or False
+
+        if 'meta' in fields:
+            result['meta'] = self.meta
+
+        return result
+
+    def _has_summary(self):
+        """Determines whether the meta block asks for a summary."""
+        return self._meta.get('summary') is True
+
+    def _split_summary(self):
+        """Gives 'summary' special treatment; if requested by the meta block,
+        everything before the first `\n\n` of the body becomes the summary.
+        """
+        if self._has_summary():
+            summary, body = self._body.split('\n\n', 1)
+            self.summary = summary
+            self.body    = body
 
-        if self.body:
-            body = markdown.markdown(self.body, extensions=['fenced_code'])
+    def _load(self):
+        """Loads the body of the article from its loader. The loader is only
+        cleared once the body and summary are in place, so concurrent readers
+        of a shared article never see a partially loaded one. Articles which
+        do not retain their body keep their loader.
 
-        return {
-              'title': self.title
-            , 'summary': summary if self.summary else False
-            , 'body': body if self.body else False
-            , 'meta': self.meta
-        }
+        Returns::
+            A tuple containing the summary and body of the article.
+        """
+        loader = self.loader
+        if not loader:
+            return self._summary, self._body
+
+        summary, body = self._summary, loader()
+        if self._has_summary():
+            summary, body = body.split('\n\n', 1)
+
+        if self.retain:
+            self._summary, self._body = summary, body
+            self.loader = None
+        return summary, body
 
     def _unslugify(self, string):
         """Takes the provided string and converts it into a human-readable
@@ -455,14 +1579,50 @@ class Article(object):
         """
         return string.replace('-', ' ').replace('_', ' ').title()
 
+    def __getstate__(self):
+        """Pickles every slot but the renderer, which holds locks; unpickled
+        articles are rendered with the shared renderer. Lazily loaded articles
+        are pickled with their body, since loaders usually cannot be, and
+        without their HTML."""
+        state = dict((slot, getattr(self, slot)) for slot in self.__slots__
+            if slot != 'renderer')
+        if self.loader:
+            state['_summary'], state['_body'] = self._load()
+            state['loader'] = None
+        state['rendered'] = None
+        return state
+
+    def __setstate__(self, state):
+        """Restores an article pickled by `Article.__getstate__`."""
+        for slot, value in state.iteritems():
+            setattr(self, slot, value)
+        self.renderer = renderer
+
+    def __setattr__(self, attr, value):
+        """ Sets a property of the header block, unless `attr` is one of the
+        article's own attributes. The header block is copied first, since it
+        may be shared with whoever created the article.
+        """
+        if hasattr(type(self), attr):
+            object.__setattr__(self, attr, value)
+        else:
+            meta = dict(self._meta)
+            meta[attr] = value
+            self._meta = meta
+
     def __getattr__(self, attr):
-        """ Prevents raising of KeyError when accessing a non-existent
-        attribute.
+        """ Provides attribute-style access to the properties of the header
+        block, and prevents raising of AttributeError when accessing a
+        non-existent one. Private and special attributes are not looked up.
 
         Returns::
-            None
+            The property of the header block, or None.
         """
-        return None
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        if attr.lower() in self.IGNORED_META_TAGS:
+            return None
+        return self._meta.get(attr)
 
 class ArticleCollection(object):
     """ Class `inkwell.reader.ArticleCollection` is an iterable collection of
@@ -484,13 +1644,17 @@ class ArticleCollection(object):
         >>> A Title
         >>> B Title
     """
-    def __init__(self, articles=None):
+    def __init__(self, articles=None, total=None, cursor=None):
         """ Creates class instance and assigns properties.
 
         Arguments::
-            articles list a list of `inkwell.reader.Article` instances
+            articles list     a list of `inkwell.reader.Article` instances
+            total    int,None number of articles this collection is a page of
+            cursor   str,None path of the last article, if there is a next page
         """
         self.articles = articles or []
+        self.total = total
+        self.cursor = cursor
         self._current_index = 0
 
     @property
@@ -662,10 +1826,40 @@ class ArticleCollection(object):
                 return False
         return True
 
-    def to_json(self):
+    def to_json(self, fields=None):
         """ Returns a JSON representation of the current article collection.
 
+        Arguments::
+            fields list optional subset of `Article.JSON_FIELDS` to include
+
         Returns::
-            A list of `inkwell.reader.Article` instances.
+            A list of `inkwell.reader.Article` instances, or a list of their
+            JSON representations if fields are specified.
         """
+        if fields:
+            return [article.to_json(fields=fields) for article in self.articles]
         return self.articles
+
+
+_worker = None
+
+def _initialize_worker(reader, lazy):
+    """ Prepares a worker process of `Reader.load_all`.
+
+    Arguments::
+        reader object instance of `inkwell.reader.Reader` to read with
+        lazy   bool   see `Reader.fetch_article`
+    """
+    global _worker
+    reader._after_fork()
+    _worker = reader, lazy
+
+def _read_article(filename):
+    """ Reads and parses a single file in a worker process of
+    `Reader.load_all`.
+
+    Returns::
+        see `Reader._read_article`
+    """
+    reader, lazy = _worker
+    return reader._read_article(filename, lazy)
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+import io
+import time
+import threading
+import subprocess
+from index import ArticleIndex
+from reader import Reader, ARTICLE_FILE_PATTERN, ARTICLE_CACHE_SIZE, \
+    FRAGMENT_CACHE_SIZE, INDEXED_META_KEYS, renderer, header_parser
+
+class Repository(object):
+    """ Class `inkwell.repository.Repository` is a thin wrapper around the git
+    plumbing commands needed to read articles straight out of a repository's
+    object store. Blobs are read through a single long-running
+    `git cat-file --batch` process.
+
+    Usage::
+
+        repository = Repository('/path/to/blog/articles')
+
+        commit = repository.resolve('HEAD')
+        for name, sha, size in repository.ls_tree(commit,
+            repository.prefix):
+            print name, len(repository.cat_file(sha))
+    """
+    def __init__(self, path):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            path str any folder within the work tree of a git repository
+
+        Raises::
+            IOError if the folder is not within a git repository.
+        """
+        try:
+            self.toplevel, self.prefix = subprocess.check_output(['git',
+                'rev-parse', '--show-toplevel', '--show-prefix'], cwd=path,
+                stderr=subprocess.STDOUT).split('\n')[:2]
+        except (OSError, subprocess.CalledProcessError):
+            raise IOError("{} is not within a git repository".format(path))
+
+        self._batch = None
+        self._lock = threading.Lock()
+
+    def git(self, *args):
+        """ Runs a git command at the top level of the repository.
+
+        Returns::
+            str containing the command's output
+
+        Raises::
+            ValueError if the command fails.
+        """
+        try:
+            return subprocess.check_output(('git',) + args, cwd=self.toplevel,
+                stderr=subprocess.STDOUT)
+        except subprocess.CalledProcessError as e:
+            raise ValueError(e.output.strip())
+
+    def resolve(self, ref):
+        """ Resolves the specified ref, such as `HEAD`, a branch or a tag, to
+        the SHA-1 of the commit it points to.
+
+        Arguments::
+            ref str the ref to resolve
+
+        Returns::
+            str SHA-1 of the commit
+        """
+        return self.git('rev-parse', '--verify', '-q',
+            "{}^{{commit}}".format(ref)).strip()
+
+    def commit_time(self, commit):
+        """ Returns the commit time of the specified commit.
+
+        Arguments::
+            commit str SHA-1 of the commit
+
+        Returns::
+            int UNIX timestamp
+        """
+        return int(self.git('show', '-s', '--format=%ct', commit).strip())
+
+    def ls_tree(self, commit, prefix=''):
+        """ Lists the blobs directly within the specified folder of a commit.
+
+        Arguments::
+            commit str SHA-1 of the commit
+            prefix str path of the folder, relative to the top level of the
+                       repository and ending with a `/`
+
+        Returns::
+            A list of tuples containing the name, SHA-1 and size of each blob.
+        """
+        tree = "{}:{}".format(commit, prefix) if prefix else \
+            "{}^{{tree}}".format(commit)
+
+        entries = []
+        for entry in self.git('ls-tree', '-z', '-l', tree).split('\0'):
+            if not entry:
+                continue
+            info, name = entry.split('\t', 1)
+            mode, kind, sha, size = info.split()
+            if kind == 'blob':
+                entries.append((name, sha, int(size)))
+        return entries
+
+    def cat_file(self, sha):
+        """ Reads the content of the specified blob.
+
+        Arguments::
+            sha str SHA-1 of the blob
+
+        Returns::
+            str containing the blob's content
+
+        Raises::
+            KeyError if the blob does not exist.
+        """
+        with self._lock:
+            if self._batch is None or self._batch.poll() is not None:
+                self._batch = subprocess.Popen(['git', 'cat-file', '--batch'],
+                    cwd=self.toplevel, stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE)
+
+            self._batch.stdin.write(sha + '\n')
+            self._batch.stdin.flush()
+
+            header = self._batch.stdout.readline().split()
+            if len(header) != 3:
+                raise KeyError(sha)
+
+            content = self._batch.stdout.read(int(header[2]))
+            self._batch.stdout.read(1)
+        return content
+
+    def close(self):
+        """Stops the `git cat-file --batch` process, if it is running."""
+        with self._lock:
+            if self._batch is not None:
+                self._batch.stdin.close()
+                self._batch.wait()
+                self._batch = None
+
+
+class Snapshot(object):
+    """ Class `inkwell.repository.Snapshot` holds the articles folder of a
+    single commit: the SHA-1 and size of every blob in it, and an index of
+    their filenames. Snapshots are never modified once built.
+    """
+    def __init__(self, ref, commit, committed, entries):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            ref       str  the ref the snapshot was resolved from
+            commit    str  SHA-1 of the commit
+            committed int  UNIX timestamp of the commit
+            entries   dict mapping filenames to tuples of SHA-1 and size
+        """
+        self.ref = ref
+        self.commit = commit
+        self.committed = committed
+        self.entries = entries
+        self.index = ArticleIndex(ARTICLE_FILE_PATTERN, entries.keys())
+
+
+class GitReader(Reader):
+    """ Class `inkwell.repository.GitReader` is a `inkwell.reader.Reader` that
+    reads articles from a commit in the git repository holding the articles
+    folder, rather than from the work tree. A deploy that is still writing
+    files to the work tree can never be half-read, and since blob SHA-1s are
+    used as article versions, cached articles are only ever re-read when
+    their content actually changes.
+
+    Usage::
+
+        reader = GitReader('/path/to/blog/articles', ref='HEAD')
+        result = reader.list(by_year='2013')
+
+        # After a deploy, switch the reader over to the new commit ...
+        reader.checkout()
+
+        # Or, pin it to a tag ...
+        reader.checkout('v1.0.0')
+
+        # Or, pick up new commits on the ref at most once a second ...
+        reader = GitReader('/path/to/blog/articles', check_interval=1.0)
+
+    Note::
+        Switching to a new snapshot replaces a single reference, so every
+        thread sharing the reader moves from one commit to the next at once
+        and the work tree is never consulted. Snapshots are never modified;
+        `GitReader.update` and `GitReader.discard` check out the ref again
+        instead.
+    """
+
+    def __init__(self, articles_folder=None, ref='HEAD',
+        cache_size=ARTICLE_CACHE_SIZE, fragment_cache_size=FRAGMENT_CACHE_SIZE,
+        indexed_meta_keys=INDEXED_META_KEYS, check_interval=None,
+        renderer=renderer, header_parser=header_parser):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            articles_folder     str      path to the articles folder within
+                                         the work tree of a git repository.
+            ref                 str      ref to read articles from.
+            cache_size          int,None see `inkwell.reader.Reader`.
+            fragment_cache_size int,None see `inkwell.reader.Reader`.
+            indexed_meta_keys   list     see `inkwell.reader.Reader`.
+            check_interval      float    seconds after which `ref` is
+                                         resolved again, the next time the
+                                         index is used; None leaves it to
+                                         `GitReader.checkout`, as called by
+                                         `inkwell.watcher.Watcher`.
+            renderer            object   see `inkwell.reader.Reader`.
+            header_parser       object   see `inkwell.reader.Reader`.
+
+        Raises::
+            IOError if the folder is not within a git repository.
+        """
+        super(GitReader, self).__init__(articles_folder, cache_size=cache_size,
+            fragment_cache_size=fragment_cache_size,
+            indexed_meta_keys=indexed_meta_keys, check_folder=False,
+            renderer=renderer, header_parser=header_parser)
+        self.ref = ref
+        self.check_interval = check_interval
+        self.repository = Repository(self.articles_folder)
+        self._snapshot = None
+        self._checked = 0
+
+    @property
+    def snapshot(self):
+        """ Provides access to the snapshot currently served by the reader,
+        checking out `ref` if there is none yet.
+
+        Returns::
+            instance of `inkwell.repository.Snapshot`
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.checkout(self.ref)
+        return snapshot
+
+    @property
+    def index(self):
+        """ Provides access to the index of the current snapshot, checking
+        out the latest commit of its ref first if `check_interval` has passed.
+
+        Returns::
+            instance of `inkwell.index.ArticleIndex`
+        """
+        if self.check_interval is not None and self._snapshot is not None and \
+            time.time() - self._checked >= self.check_interval:
+            self.checkout()
+        return self.snapshot.index
+
+    def checkout(self, ref=None):
+        """ Resolves the specified ref and atomically replaces the snapshot
+        served by the reader with the resulting commit.
+
+        Arguments::
+            ref str,None the ref to resolve; defaults to the ref of the current
+                         snapshot, picking up any new commits on it
+
+        Returns::
+            instance of `inkwell.repository.Snapshot`
+
+        Raises::
+            ValueError if the ref cannot be resolved.
+        """
+        current = self._snapshot
+        if ref is None:
+            ref = current.ref if current else self.ref
+
+        commit = self.repository.resolve(ref)
+        self._checked = time.time()
+
+        # The index and every index built from it are kept as long as the
+        # commit does not change.
+        if current is not None and current.ref == ref and \
+            current.commit == commit:
+            return current
+
+        entries = dict(
+            (name, (sha, size))
+            for name, sha, size in self.repository.ls_tree(commit,
+                self.repository.prefix)
+        )
+
+        snapshot = Snapshot(ref, commit, self.repository.commit_time(commit),
+            entries)
+        self._snapshot = snapshot
+        return snapshot
+
+    def refresh(self):
+        """ Checks out the latest commit of the current snapshot's ref.
+
+        Returns::
+            instance of `inkwell.index.ArticleIndex`
+        """
+        return self.checkout().index
+
+    def update(self, filename):
+        """ Snapshots are never modified, and files written to the work tree
+        are only served once committed, so checks out the latest commit of
+        the current ref instead.
+
+        Returns::
+            Boolean True if the file is indexed as an article.
+        """
+        return filename in self.checkout().index
+
+    def discard(self, filename):
+        """ Checks out the latest commit of the current ref. See
+        `GitReader.update`.
+
+        Returns::
+            Boolean True if the file had been indexed.
+        """
+        indexed = filename in self.snapshot.index
+        return indexed and filename not in self.checkout().index
+
+    def last_modified(self):
+        """ Articles only change along with the commit of the snapshot, so
+        returns its commit time.
+        """
+        return self.snapshot.committed
+
+    def _read_article(self, filename, lazy=False):
+        """ Blobs are always read whole, so there is nothing to gain from only
+        parsing the header; articles are parsed in full instead.
+        """
+        return super(GitReader, self)._read_article(filename)
+
+    def _after_fork(self):
+        """ Worker processes must not share the parent's
+        `git cat-file --batch` process, so each starts its own.
+        """
+        self.repository = Repository(self.articles_folder)
+
+    def _listdir(self):
+        """Lists the names of all blobs in the current snapshot."""
+        return self.snapshot.entries.keys()
+
+    def _stat(self, filename):
+        """ Returns the SHA-1 and size of the specified blob in the current
+        snapshot, along with the commit time of the snapshot, or None if it
+        does not exist.
+        """
+        snapshot = self.snapshot
+        entry = snapshot.entries.get(filename)
+        if entry is None:
+            return None
+        return entry + (snapshot.committed,)
+
+    def _open(self, filename):
+        """ Reads the specified blob of the current snapshot.
+
+        Returns::
+            instance of `io.BytesIO`
+
+        Raises::
+            IOError if the blob does not exist.
+        """
+        entry = self.snapshot.entries.get(filename)
+        if entry is None:
+            raise IOError("{} does not exist in {}".format(filename,
+                self.snapshot.commit))
+        return io.BytesIO(self.repository.cat_file(entry[0]))
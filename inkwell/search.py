@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+import re
+import math
+import heapq
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+FIELD_WEIGHTS = {'title': 3.0, 'tags': 2.0, 'body': 1.0}
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+def tokenize(text):
+    """ Splits text into lowercase words. Byte strings are decoded as UTF-8.
+
+    Arguments::
+        text str,unicode the text to split
+
+    Returns::
+        A list of unicode words.
+    """
+    if not text:
+        return []
+    if isinstance(text, str):
+        text = text.decode('utf-8', 'replace')
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex(object):
+    """ Class `inkwell.search.SearchIndex` is an in-memory inverted index of
+    article titles, tags and bodies. Documents are ranked with BM25, with the
+    terms of each field weighted by `FIELD_WEIGHTS`, so a match in a title
+    counts for more than one in a body. Documents can be added, replaced and
+    removed one at a time as articles change.
+
+    Query terms ending in `*` match every indexed term they are a prefix of.
+
+    Usage::
+
+        index = SearchIndex()
+        index.add('2013-07-12-welcome.txt', title='Welcome to Inkwell',
+            tags=['inkwell'], body='Hello World!')
+
+        print index.search('welc*')
+        >>> (['2013-07-12-welcome.txt'], 1)
+    """
+    def __init__(self, weights=None):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            weights dict optional weights of the `title`, `tags` and `body`
+                         fields; defaults to `FIELD_WEIGHTS`
+        """
+        self.weights = weights or FIELD_WEIGHTS
+
+        self._postings = defaultdict(dict)
+        self._documents = {}
+        self._length = 0.0
+        self._terms = None
+        self._lock = threading.RLock()
+
+    def add(self, filename, title=None, tags=None, body=None):
+        """ Indexes an article, replacing any previous version of it.
+
+        Arguments::
+            filename str      the name of the article's file
+            title    str      the article's title
+            tags     list,str the article's tags
+            body     str      the article's body, including its summary
+        """
+        if isinstance(tags, basestring):
+            tags = [tags]
+
+        frequencies = defaultdict(float)
+        for field, text in (('title', title), ('tags', ' '.join(
+            unicode(t) for t in tags or [])), ('body', body)):
+            weight = self.weights.get(field, 1.0)
+            for term in tokenize(text):
+                frequencies[term] += weight
+
+        with self._lock:
+            self.remove(filename)
+
+            length = sum(frequencies.itervalues())
+            for term, frequency in frequencies.iteritems():
+                if term not in self._postings:
+                    self._terms = None
+                self._postings[term][filename] = frequency
+
+            self._documents[filename] = (length, frequencies.keys())
+            self._length += length
+
+    def remove(self, filename):
+        """ Removes an article from the index.
+
+        Arguments::
+            filename str the name of the article's file
+
+        Returns::
+            Boolean True if the article had been indexed.
+        """
+        with self._lock:
+            document = self._documents.pop(filename, None)
+            if document is None:
+                return False
+
+            length, terms = document
+            for term in terms:
+                postings = self._postings[term]
+                del postings[filename]
+                if not postings:
+                    del self._postings[term]
+                    self._terms = None
+            self._length -= length
+        return True
+
+    def search(self, query, offset=0, limit=0):
+        """ Finds the articles matching any of the terms of a query, best
+        matches first. Articles scoring the same are ordered newest first.
+
+        Arguments::
+            query  str the query
+            offset int number of matching articles to skip
+            limit  int maximum number of filenames to return; 0 for all
+
+        Returns::
+            A tuple containing a list of filenames and the total number of
+            matching articles.
+        """
+        scores = defaultdict(float)
+
+        with self._lock:
+            count = len(self._documents)
+            if not count:
+                return [], 0
+            average = self._length / count
+
+            for word in set(query.split()):
+                prefix = word.endswith('*')
+                for term in set(tokenize(word)):
+                    matches = {}
+                    for expanded in (self._expand(term) if prefix else
+                        [term]):
+                        for filename, score in self._score(expanded, count,
+                            average).iteritems():
+                            matches[filename] = max(score,
+                                matches.get(filename, 0))
+
+                    for filename, score in matches.iteritems():
+                        scores[filename] += score
+
+        offset = max(offset or 0, 0)
+        key = lambda (filename, score): (score, filename)
+        if limit and limit > 0:
+            ranked = heapq.nlargest(offset + limit, scores.iteritems(), key=key)
+        else:
+            ranked = sorted(scores.iteritems(), key=key, reverse=True)
+        return [f for f, _ in ranked[offset:]], len(scores)
+
+    def _score(self, term, count, average):
+        """ Scores the articles containing a term with BM25.
+
+        Returns::
+            dict mapping filenames to their score
+        """
+        postings = self._postings.get(term)
+        if not postings:
+            return {}
+
+        idf = math.log(1 + (count - len(postings) + 0.5) /
+            (len(postings) + 0.5))
+
+        scores = {}
+        for filename, frequency in postings.iteritems():
+            length = self._documents[filename][0]
+            scores[filename] = idf * frequency * (BM25_K1 + 1) / (frequency +
+                BM25_K1 * (1 - BM25_B + BM25_B * length / (average or 1)))
+        return scores
+
+    def _expand(self, prefix):
+        """ Lists the indexed terms starting with a prefix.
+
+        Returns::
+            A list of terms.
+        """
+        if self._terms is None:
+            self._terms = sorted(self._postings)
+
+        terms = []
+        position = bisect_left(self._terms, prefix)
+        while position < len(self._terms) and \
+            self._terms[position].startswith(prefix):
+            terms.append(self._terms[position])
+            position += 1
+        return terms
+
+    def __contains__(self, filename):
+        """Implements `in` checks against indexed filenames."""
+        return filename in self._documents
+
+    def __len__(self):
+        """Returns the number of indexed articles."""
+        return len(self._documents)
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+import os
+import zlib
+import struct
+import cPickle
+from pack import Pack, PackWriter
+from reader import Article
+from cache import makedirs, write_file
+
+SNAPSHOT_MAGIC = 'INKWELL\0'
+SNAPSHOT_FORMAT = 2
+SNAPSHOT_HEADER = '>8sHIiQ'
+SNAPSHOT_HEADER_SIZE = struct.calcsize(SNAPSHOT_HEADER)
+
+def dump(path, entries, html=None, pack=False):
+    """ Writes a snapshot file. Snapshots start with a fixed-size header
+    holding `SNAPSHOT_MAGIC`, the format version, the length and CRC-32 of the
+    index, which is a zlib-compressed pickle of the entries and HTML, and the
+    length of the blob region which follows it.
+
+    Arguments::
+        path    str  path of the snapshot file
+        entries dict mapping filenames to tuples of their version, size,
+                     metadata, body and body offset
+        html    dict optional mapping of Markdown cache keys to rendered HTML
+        pack    bool store bodies and HTML in the blob region, where
+                     `inkwell.snapshot.load` maps them, rather than in the
+                     index. Their places in the index are taken by tuples of
+                     their offset and length.
+    """
+    html = html or {}
+
+    writer = PackWriter()
+    if pack:
+        entries = dict(
+            (filename, entry[:3] + (writer.add(entry[3]), None)
+                if isinstance(entry[3], basestring) else entry)
+            for filename, entry in entries.iteritems()
+        )
+        html = dict((key, writer.add(value) if isinstance(value,
+            basestring) else value) for key, value in html.iteritems())
+
+    index = zlib.compress(cPickle.dumps({
+          'entries': entries
+        , 'html': html
+    }, cPickle.HIGHEST_PROTOCOL))
+
+    header = struct.pack(SNAPSHOT_HEADER, SNAPSHOT_MAGIC, SNAPSHOT_FORMAT,
+        len(index), zlib.crc32(index), writer.size)
+
+    makedirs(os.path.dirname(path))
+    write_file(path, header + index + writer.getvalue())
+
+def load(path):
+    """ Reads a snapshot file written by `inkwell.snapshot.dump`.
+
+    Arguments::
+        path str path of the snapshot file
+
+    Returns::
+        A tuple containing the entries and HTML of the snapshot, along with
+        an instance of `inkwell.pack.Pack` mapping its blob region. Entries
+        and HTML are empty, and the pack None, if the file does not exist, is
+        corrupt or was written in another format.
+
+    Note::
+        Snapshots are unpickled, so they must only ever be read from
+        locations nobody but Inkwell can write to.
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(SNAPSHOT_HEADER_SIZE)
+            if len(header) < SNAPSHOT_HEADER_SIZE:
+                return {}, {}, None
+
+            magic, version, length, checksum, blobs = struct.unpack(
+                SNAPSHOT_HEADER, header)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT:
+                return {}, {}, None
+
+            index = f.read(length)
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+    except IOError:
+        return {}, {}, None
+
+    if len(index) != length or checksum != zlib.crc32(index) or \
+        size != SNAPSHOT_HEADER_SIZE + length + blobs:
+        return {}, {}, None
+
+    try:
+        snapshot = cPickle.loads(zlib.decompress(index))
+    except Exception:
+        return {}, {}, None
+
+    return snapshot['entries'], snapshot['html'], Pack(path,
+        SNAPSHOT_HEADER_SIZE + length)
+
+def warm(reader, path, html=False, pack=False, parallel=None,
+    processes=False):
+    """ Fills a reader's article cache, and the Markdown cache, from the
+    specified snapshot. Articles whose files changed since the snapshot was
+    written are read again, and the snapshot is only rewritten if any were.
+
+    Arguments::
+        reader    object instance of `inkwell.reader.Reader`
+        path      str    path of the snapshot file
+        html      bool   keep bodies and their rendered HTML in the snapshot,
+                         rather than reading bodies from their files when they
+                         are first accessed
+        pack      bool   keep bodies, and HTML, in the snapshot's memory-mapped
+                         blob region. Articles and renderings are then copied
+                         out of the page cache every worker shares whenever
+                         they are used, rather than each worker keeping them
+                         in memory between requests.
+        parallel  int    see `Reader.load_all`
+        processes bool   see `Reader.load_all`
+
+    Returns::
+        dict containing the number of articles restored from the snapshot and
+        read from their files
+    """
+    previous, rendered, blobs = load(path)
+    bodies = html or pack
+
+    entries = {}
+    pending = []
+    for filename in reader.index:
+        stat = reader.stat(filename)
+        if not stat:
+            continue
+
+        version, size = stat[:2]
+        entry = previous.get(filename)
+        if entry and entry[:2] == (version, size) and \
+            (entry[3] is not None or not bodies):
+            entries[filename] = entry
+        else:
+            pending.append((filename, version, size))
+
+    parsed = reader._read_articles([filename for filename, _, _ in pending],
+        parallel, processes, lazy=not bodies)
+
+    for (filename, version, size), (meta, body, offset) in zip(pending,
+        parsed):
+        entries[filename] = (version, size, meta, body, offset)
+
+    changed = bool(pending) or len(entries) != len(previous)
+
+    renderer = reader.renderer
+    texts = {}
+    if html:
+        keys = set()
+        for filename, entry in entries.iteritems():
+            article = _article(reader, filename, entry, blobs)
+            texts[filename] = [None, None]
+            for i, text in enumerate((article.summary, article.body)):
+                if not text:
+                    continue
+                key = texts[filename][i] = renderer.key(text)
+                if key not in rendered:
+                    rendered[key] = renderer.render(text)
+                    changed = True
+                keys.add(key)
+
+        changed = changed or len(keys) != len(rendered)
+        rendered = dict((key, rendered[key]) for key in keys)
+    else:
+        changed = changed or bool(rendered)
+        rendered = {}
+
+    packed = any(isinstance(entry[3], tuple) for entry in entries.values())
+    if changed or (entries and packed != pack):
+        # Blobs of the previous snapshot are copied out of its pack before
+        # it is replaced.
+        entries = dict((filename, _unpack(entry, blobs))
+            for filename, entry in entries.iteritems())
+        rendered = dict((key, _unpack_html(value, blobs))
+            for key, value in rendered.iteritems())
+
+        dump(path, entries, rendered, pack=pack)
+        if pack:
+            entries, rendered, blobs = load(path)
+
+    # Packed HTML is located once here, so articles never hash their body
+    # to find it.
+    for filename, entry in entries.iteritems():
+        locations = None
+        if pack and filename in texts:
+            locations = [rendered.get(key) for key in texts[filename]]
+        reader.cache.set(filename,
+            _article(reader, filename, entry, blobs, locations),
+            version=entry[0], size=entry[1])
+
+    if not pack:
+        for key, value in rendered.iteritems():
+            renderer.cache.set(key, value, size=len(value))
+
+    return {
+          'restored': len(entries) - len(pending)
+        , 'read': len(pending)
+    }
+
+def _article(reader, filename, entry, blobs, locations=None):
+    """ Creates an article from a snapshot entry. Articles whose body is in
+    the snapshot's pack read it from there whenever it is used, and so do
+    articles whose summary and body HTML are located in the pack.
+
+    Arguments::
+        locations list optional offsets and lengths of the summary and body
+                       HTML within the pack, or None for either
+
+    Returns::
+        instance of `inkwell.reader.Article`
+    """
+    version, size, meta, body, offset = entry
+
+    if isinstance(body, tuple):
+        rendered = None
+        if locations:
+            rendered = lambda: [blobs.read(*location).decode('utf-8')
+                if location else False for location in locations]
+        return Article(filename=filename, meta=meta,
+            loader=lambda: blobs.read(*body), retain=False,
+            renderer=reader.renderer, rendered=rendered)
+    return reader._build_article(filename, meta, body, offset)
+
+def _unpack(entry, blobs):
+    """Replaces the location of a packed body with the body itself."""
+    if isinstance(entry[3], tuple):
+        return entry[:3] + (blobs.read(*entry[3]), None)
+    return entry
+
+def _unpack_html(value, blobs):
+    """Replaces the location of packed HTML with the HTML itself."""
+    if isinstance(value, tuple):
+        return blobs.read(*value).decode('utf-8')
+    return value
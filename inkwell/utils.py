@@ -1,16 +1,32 @@
 # -*- coding: utf-8 -*-
-from flask import request, current_app, json, make_response
+import hashlib
+import calendar
+import threading
+from datetime import datetime
+from functools import wraps
+from flask import request, current_app, make_response, stream_with_context
 from flask.views import MethodView
-from reader import Reader, Article, ArticleCollection
-from datetime import date, datetime
+from werkzeug.http import http_date, quote_etag
+from werkzeug.wrappers import BaseResponse
+from reader import Reader, MarkdownRenderer, HeaderParser, INDEXED_META_KEYS, \
+    MARKDOWN_CACHE_MAX_AGE
+from encoding import Encoder, dumps
+from repository import GitReader
+from validator import field, rules, collection
+import exceptions
 
 REGEX_YEAR  = '^(19|20)\d{2}$'
 REGEX_MONTH = '^(0?[1-9]|1[012])$'
 REGEX_DAY   = '^(0?[1-9]|[12]\d|3[01])$'
+REGEX_COUNT = '^\d+$'
+
+_reader_lock = threading.Lock()
 
 def json_presenter(f):
     """ A method view decorator used to transform view response bodies into
-    JSON-based Flask response objects with appropriate headers.
+    JSON-based Flask response objects with appropriate headers. Views may
+    return a tuple of `(body, headers)` to add headers of their own, or a
+    response object, which is passed through untouched.
     """
     def decorator(*args, **kwargs):
         try:
@@ -18,44 +34,159 @@ def json_presenter(f):
         except:
             raise
 
-        response = make_response(json.dumps(result, cls=Encoder))
-        response.headers['Content-Type'] = 'application/json; charset=utf-8'
+        if isinstance(result, BaseResponse):
+            return result
 
-        if current_app.config['ENVIRONMENT'] == 'production':
-            cache = "public, max-age={}".format(current_app.config['CACHE_TTL'])
-        else:
-            cache = 'no-cache, must-revalidate'
-        response.headers['Cache-Control'] = cache
+        headers = {}
+        if isinstance(result, tuple):
+            result, headers = result
 
-        return response
+        return json_response(dumps(result), headers)
     return decorator
 
-class Encoder(json.JSONEncoder):
-    """ Custom JSON encoder used to parse dicts which may contain instances of
-    `inkwell.reader.Article` or `inkwell.reader.ArticleCollection`.
+def json_response(body, headers=None):
+    """ Creates a Flask response object from an already serialized JSON body.
+
+    Arguments::
+        body    str  the serialized body of the response
+        headers dict optional headers of the response
+
+    Returns::
+        Flask response
+    """
+    response = make_response(body)
+    response.headers.extend(headers or {})
+    response.headers['Content-Type'] = 'application/json; charset=utf-8'
+    response.headers['Cache-Control'] = cache_control()
+    return response
+
+def json_stream(items, headers=None):
+    """ Creates a streamed Flask response holding a JSON array. Each item is
+    encoded and sent on its own as the response is written, so neither the
+    items nor the serialized array are ever held in memory all at once. The
+    body is identical to that of `json_response` for the same items.
+
+    Note::
+        The status and headers are sent before any item is encoded, so an
+        item which cannot be encoded cuts the response short.
+
+    Arguments::
+        items   iterable the items of the array, such as a generator
+        headers dict     optional headers of the response
+
+    Returns::
+        Flask response
+    """
+    def generate():
+        yield '['
+        separator = ''
+        for item in items:
+            yield separator + dumps(item)
+            separator = ', '
+        yield ']'
+
+    response = current_app.response_class(stream_with_context(generate()))
+    response.headers.extend(headers or {})
+    response.headers['Content-Type'] = 'application/json; charset=utf-8'
+    response.headers['Cache-Control'] = cache_control()
+    return response
+
+def cache_control():
+    """ Returns the `Cache-Control` header value for the current environment.
+
+    Returns::
+        str public caching for `CACHE_TTL` seconds in production, otherwise
+        forced revalidation
+    """
+    if current_app.config['ENVIRONMENT'] == 'production':
+        return "public, max-age={}".format(current_app.config['CACHE_TTL'])
+    return 'no-cache, must-revalidate'
+
+def validate_date(year=None, month=None, day=None):
+    """ Validates the date elements of a request.
+
+    Arguments::
+        year  str,None Four-digit number representing the article year
+        month str,None Two-digit number representing the article month
+        day   str,None Two-digit number representing the article day
+
+    Raises::
+        inkwell.exceptions.BadRequest listing every invalid date element.
+    """
+    check = collection.Collection()
+
+    if year:
+        check.append(field.Field('year', year).append(
+            rules.Regex(REGEX_YEAR, error='{} is not a valid year')))
+
+    if month:
+        check.append(field.Field('month', month).append(
+            rules.Regex(REGEX_MONTH, error='{} is not a valid month')))
+
+    if day:
+        check.append(field.Field('day', day).append(
+            rules.Regex(REGEX_DAY, error='{} is not a valid day')))
 
-    Usage::
+    if not check.run():
+        raise exceptions.BadRequest(check.errors())
 
-        response = {
-            articles: [
-                  Article(filename='2012-02-01-foo.txt', body='foo')
-                , Article(filename='2012-02-01-bar.txt', body='bar')
-                , Article(filename='2012-02-01-baz.txt', body='baz')
-            ]
-        }
+def validate_paging(limit=None, offset=None):
+    """ Validates the pagination arguments of a request.
 
-        parsed = json.dumps(response, cls=Encoder)
+    Arguments::
+        limit  str,None maximum number of articles to return
+        offset str,None number of articles to skip
+
+    Raises::
+        inkwell.exceptions.BadRequest unless each of them is a non-negative
+        number.
     """
-    def default(self, obj):
-        if isinstance(obj, Article):
-            return obj.to_json()
-        if isinstance(obj, ArticleCollection):
-            return obj.to_json()
-        elif isinstance(obj, (datetime, date)):
-            return obj.isoformat() + 'Z'
-        elif hasattr(obj, 'isoformat'):
-            return obj.isoformat()
-        return json.JSONEncoder.default(self, obj)
+    check = collection.Collection()
+
+    if limit is not None:
+        check.append(field.Field('limit', limit).append(
+            rules.Regex(REGEX_COUNT, error='{} is not a valid limit')))
+
+    if offset is not None:
+        check.append(field.Field('offset', offset).append(
+            rules.Regex(REGEX_COUNT, error='{} is not a valid offset')))
+
+    if not check.run():
+        raise exceptions.BadRequest(check.errors())
+
+def validate_range(since=None, until=None):
+    """ Validates the `since` and `until` arguments of a request.
+
+    Arguments::
+        since str,None first date to include, formatted as `YYYY-MM-DD`
+        until str,None last date to include, formatted as `YYYY-MM-DD`
+
+    Raises::
+        inkwell.exceptions.BadRequest listing every invalid date.
+    """
+    errors = {}
+    for name, value in (('since', since), ('until', until)):
+        if not value:
+            continue
+        try:
+            datetime.strptime(value, '%Y-%m-%d')
+        except ValueError:
+            errors[name] = ['{} is not a valid date'.format(value)]
+
+    if errors:
+        raise exceptions.BadRequest(errors)
+
+def http_timestamp(value):
+    """ Converts a naive UTC datetime, as parsed from HTTP date headers, to a
+    UNIX timestamp.
+
+    Arguments::
+        value datetime the date to convert
+
+    Returns::
+        int UNIX timestamp
+    """
+    return calendar.timegm(value.utctimetuple())
 
 
 # http://flask.pocoo.org/snippets/45/
@@ -70,16 +201,249 @@ def request_wants_json():
     return best == 'application/json' and request.accept_mimetypes[best] > request.accept_mimetypes['text/html']
 
 
+def reader_factory(config):
+    """ Creates the reader described by the specified configuration; an
+    instance of `inkwell.repository.GitReader` if `ARTICLES_REF` is set,
+    otherwise an instance of `inkwell.reader.Reader`. Unless `WATCH_ARTICLES`
+    keeps it up to date, the reader checks the articles folder for created and
+    deleted files whenever it looks articles up, or, for a git repository,
+    checks out new commits on `ARTICLES_REF` at most every `WATCH_INTERVAL`
+    seconds.
+
+    Each reader gets its own Markdown renderer and header parser, sized by
+    `MARKDOWN_CACHE_SIZE` and `HEADER_CACHE_SIZE`, so applications created
+    with different configurations never share them. Renderings cached in
+    `MARKDOWN_CACHE_FOLDER` are pruned after `MARKDOWN_CACHE_MAX_AGE` seconds.
+
+    Arguments::
+        config dict an Inkwell configuration
+
+    Returns::
+        instance of `inkwell.reader.Reader`
+    """
+    renderer = MarkdownRenderer(
+          cache_size=config.get('MARKDOWN_CACHE_SIZE')
+        , folder=config.get('MARKDOWN_CACHE_FOLDER')
+        , max_age=config.get('MARKDOWN_CACHE_MAX_AGE', MARKDOWN_CACHE_MAX_AGE)
+    )
+    header_parser = HeaderParser(cache_size=config.get('HEADER_CACHE_SIZE'))
+
+    if config.get('ARTICLES_REF'):
+        return GitReader(config.get('ARTICLES_FOLDER'),
+            ref=config.get('ARTICLES_REF'),
+            cache_size=config.get('ARTICLE_CACHE_SIZE'),
+            fragment_cache_size=config.get('FRAGMENT_CACHE_SIZE'),
+            indexed_meta_keys=config.get('INDEXED_META_KEYS',
+                INDEXED_META_KEYS),
+            check_interval=None if config.get('WATCH_ARTICLES') else
+                config.get('WATCH_INTERVAL'),
+            renderer=renderer, header_parser=header_parser)
+    return Reader(config.get('ARTICLES_FOLDER'),
+        cache_size=config.get('ARTICLE_CACHE_SIZE'),
+        fragment_cache_size=config.get('FRAGMENT_CACHE_SIZE'),
+        indexed_meta_keys=config.get('INDEXED_META_KEYS', INDEXED_META_KEYS),
+        check_folder=not config.get('WATCH_ARTICLES'),
+        renderer=renderer, header_parser=header_parser)
+
+
+def memoized(method):
+    """ Decorates a method of an endpoint so it runs once per request for each
+    set of arguments. Endpoints are created for every request, and look up
+    what they serve once in `sources`, to fingerprint it, and again in `get`;
+    memoizing the lookup means the body always holds what its `ETag`
+    describes, even if the index changes in between.
+    """
+    @wraps(method)
+    def memoize(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.iteritems())))
+        memo = self.__dict__.setdefault('_memo', {})
+        if key not in memo:
+            memo[key] = method(self, *args, **kwargs)
+        return memo[key]
+    return memoize
+
+def app_reader(app):
+    """ Returns the reader shared by every request to an app, creating it
+    with `reader_factory` on first use. Apps which register the API blueprint
+    without calling `inkwell.bootstrap` get one on their first request.
+
+    Arguments::
+        app object instance of `flask.Flask`
+
+    Returns::
+        instance of `inkwell.reader.Reader`
+    """
+    reader = app.extensions.get('inkwell_reader')
+    if reader is None:
+        with _reader_lock:
+            reader = app.extensions.get('inkwell_reader')
+            if reader is None:
+                reader = reader_factory(app.config)
+                app.extensions['inkwell_reader'] = reader
+    return reader
+
+
 class ApiEndpoint(MethodView):
     """ Base abstract class which implements `flask.view.MethodView` and
     provides Inkwell's endpoints with some convenience methods and decorators.
     """
 
     decorators = [json_presenter]
+    mimetype = 'application/json'
+    listing = True
     reader = None
 
     def __init__(self):
-        self.reader = Reader(current_app.config.get('ARTICLES_FOLDER'))
+        self.reader = app_reader(current_app)
+
+    def dispatch_request(self, *args, **kwargs):
+        """ Validates the request and answers conditional `GET` requests.
+        The endpoint's `sources` are fingerprinted into a strong `ETag` and a
+        `Last-Modified` date using only the versions and modification times
+        of their files, so a request carrying a matching `If-None-Match` or
+        `If-Modified-Since` header receives `304 Not Modified` before any
+        article is read, parsed or rendered.
+
+        Other responses are served from the app's response cache, if it has
+        one, which is keyed by the same fingerprint and so never serves a
+        response built from outdated articles. Streamed responses are not
+        cached.
+
+        Returns::
+            A tuple of the view's body and headers, or a response object.
+        """
+        self.validate(**kwargs)
+
+        sources = None
+        if self.request.method in ('GET', 'HEAD'):
+            sources = self.sources(**kwargs)
+
+        if sources is None:
+            return super(ApiEndpoint, self).dispatch_request(*args, **kwargs)
+
+        etag, modified = self.fingerprint(*sources)
+        headers = {'ETag': quote_etag(etag)}
+        if modified is not None:
+            headers['Last-Modified'] = http_date(modified)
+
+        if self.request.if_none_match:
+            not_modified = self.request.if_none_match.contains(etag)
+        elif self.request.if_modified_since and modified is not None:
+            not_modified = int(modified) <= \
+                int(http_timestamp(self.request.if_modified_since))
+        else:
+            not_modified = False
+
+        if not_modified:
+            response = current_app.response_class(status=304)
+            response.headers.extend(headers)
+            response.headers['Cache-Control'] = cache_control()
+            return response
+
+        # Headers such as `Link` hold absolute URLs, so responses are only
+        # shared between requests made to the same host.
+        responses = current_app.extensions.get('inkwell_responses')
+        key = hashlib.sha1(self.request.host_url + etag).hexdigest()
+        cached = responses.get(key) if responses is not None else None
+
+        if cached is None:
+            result = super(ApiEndpoint, self).dispatch_request(*args, **kwargs)
+            extra = {}
+            if isinstance(result, tuple):
+                result, extra = result
+
+            if isinstance(result, BaseResponse):
+                # Streamed responses are never buffered just to be cached.
+                result.headers.extend(headers)
+                return result
+
+            if responses is None:
+                headers.update(extra)
+                return self.respond(self.serialize(result), headers)
+
+            cached = self.serialize(result), extra
+            responses.set(key, *cached)
+
+        body, extra = cached
+        headers.update(extra)
+        return self.respond(body, headers)
+
+    def serialize(self, result):
+        """ Serializes the body returned by the view, so it can be cached.
+
+        Returns::
+            str the serialized body
+        """
+        return dumps(result)
+
+    def respond(self, body, headers):
+        """ Creates the response object for a serialized body; a JSON
+        response, unless the endpoint serves another `mimetype`.
+
+        Returns::
+            Flask response
+        """
+        return json_response(body, headers)
+
+    def validate(self, **kwargs):
+        """ Validates the view arguments of the current request before
+        anything is looked up. Endpoints raise
+        `inkwell.exceptions.BadRequest` for invalid requests.
+        """
+        pass
+
+    def sources(self, **kwargs):
+        """ Lists the articles the response to the current request is built
+        from, without reading any of them. Endpoints which return None are not
+        fingerprinted and never answer with `304 Not Modified`.
+
+        Returns::
+            A tuple containing a list of filenames and the total number of
+            articles described by the response, or None.
+        """
+        return None
+
+    def fingerprint(self, filenames, total):
+        """ Computes the strong entity tag and modification time of a response
+        from the endpoint, view arguments and query of the current request,
+        the total and the versions of the specified articles. Date elements
+        are normalized, so `/2013/7` and `/2013/07` share an entity tag.
+
+        Listings also change when articles are created or deleted, which
+        leaves the modification times of the articles they list untouched, so
+        the modification time of a `listing` endpoint is never earlier than
+        the last change to the set of articles. See
+        `inkwell.reader.Reader.last_modified`.
+
+        Arguments::
+            filenames list names of the articles the response is built from
+            total     int  total number of articles described by the response
+
+        Returns::
+            A tuple containing the entity tag and the UNIX timestamp of the
+            latest modification, or None if there are no articles.
+        """
+        digest = hashlib.sha1(self.request.endpoint)
+        for key, value in sorted(self.request.view_args.iteritems()):
+            if key in ('year', 'month', 'day') and value.isdigit():
+                value = str(int(value))
+            digest.update(u"\n{}={}".format(key, value).encode('utf-8'))
+        for key, value in sorted(self.request.args.iteritems(multi=True)):
+            digest.update(u"\n?{}={}".format(key, value).encode('utf-8'))
+        digest.update("\n{}".format(total))
+
+        modified = None
+        for filename in filenames:
+            stat = self.reader.stat(filename)
+            if stat is None:
+                continue
+            digest.update("\n{} {!r}".format(filename, stat[0]))
+            modified = max(modified, stat[2])
+
+        if self.listing:
+            modified = max(modified, self.reader.last_modified())
+
+        return digest.hexdigest(), modified
 
     @property
     def config(self):
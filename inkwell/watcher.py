@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+import errno
+import select
+import struct
+import logging
+import threading
+from stat import S_ISREG
+
+try:
+    import ctypes
+    import ctypes.util
+except ImportError:
+    ctypes = None
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_DELETE      = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF   = 0x00000800
+IN_Q_OVERFLOW  = 0x00004000
+IN_ISDIR       = 0x40000000
+
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE | \
+    IN_DELETE_SELF | IN_MOVE_SELF
+INOTIFY_EVENT = 'iIII'
+INOTIFY_EVENT_SIZE = struct.calcsize(INOTIFY_EVENT)
+
+logger = logging.getLogger(__name__)
+
+class Watcher(threading.Thread):
+    """ Class `inkwell.watcher.Watcher` is a background thread that keeps a
+    reader's index and caches in sync with its articles folder, so articles
+    deployed with `git pull` show up without rescanning the folder or
+    restarting the server. On Linux, changes are picked up through inotify as
+    they happen; files are only picked up once they have been closed after
+    writing or moved into place, never while half-written. Elsewhere, the
+    folder is listed every `interval` seconds, and files which were created,
+    modified or deleted since the last listing are applied.
+
+    Readers of a git repository, instances of
+    `inkwell.repository.GitReader`, are not watched through their work tree;
+    their ref is resolved again every `interval` seconds instead, and new
+    commits are checked out as they land.
+
+    Usage::
+
+        watcher = Watcher(Reader('/path/to/articles'))
+        watcher.start()
+
+        ...
+
+        watcher.stop()
+
+    Note::
+        Threads do not survive a fork, so the watcher must be started in each
+        worker process rather than in a preloading master.
+    """
+    def __init__(self, reader, interval=1.0):
+        """ Creates class instance and assigns properties.
+
+        Arguments::
+            reader   object instance of `inkwell.reader.Reader` to update
+            interval float  seconds between polls, or between checks for
+                            `Watcher.stop` when using inotify
+        """
+        super(Watcher, self).__init__(name='inkwell-watcher')
+        self.daemon = True
+        self.reader = reader
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._fd = None
+        self._follow = hasattr(reader, 'checkout')
+
+    def start(self):
+        """ Starts watching the articles folder, using inotify if it is
+        available and polling otherwise. The watch is in place by the time this
+        method returns, so no changes made afterwards are missed.
+        """
+        if self._follow:
+            self.reader.checkout()
+            super(Watcher, self).start()
+            return
+
+        self._fd = self._inotify_init()
+        if self._fd is None:
+            self._versions = self._scan()
+        else:
+            self._wd = self._inotify_add_watch(self._fd)
+        super(Watcher, self).start()
+
+    def run(self):
+        """Watches the articles folder until `Watcher.stop` is called."""
+        try:
+            if self._follow:
+                self._checkout()
+            elif self._fd is None:
+                self._poll()
+            else:
+                self._watch(self._fd)
+        except Exception:
+            logger.exception('inkwell watcher stopped unexpectedly')
+        finally:
+            if self._fd is not None:
+                os.close(self._fd)
+
+    def stop(self):
+        """Signals the watcher to stop within `interval` seconds."""
+        self._stopped.set()
+
+    def dispatch(self, mask, filename):
+        """ Applies a single filesystem event to the reader.
+
+        Arguments::
+            mask     int inotify event mask
+            filename str the name of the affected file
+        """
+        if mask & (IN_DELETE | IN_MOVED_FROM):
+            self.reader.discard(filename)
+        elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+            self.reader.update(filename)
+
+    def _watch(self, fd):
+        """ Reads inotify events from `fd` and dispatches them.
+
+        Arguments::
+            fd int inotify file descriptor
+        """
+        watch = self._wd
+
+        while not self._stopped.is_set():
+            if not select.select([fd], [], [], self.interval)[0]:
+                continue
+
+            try:
+                events = os.read(fd, 64 * 1024)
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+
+            position = 0
+            while position + INOTIFY_EVENT_SIZE <= len(events):
+                wd, mask, cookie, length = struct.unpack_from(INOTIFY_EVENT,
+                    events, position)
+                position += INOTIFY_EVENT_SIZE
+                filename = events[position:position + length].rstrip('\0')
+                position += length
+
+                if mask & IN_Q_OVERFLOW:
+                    self.reader.refresh()
+                elif mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    # The folder itself was moved or deleted; index whatever
+                    # now lives at its path and watch that instead.
+                    self.reader.refresh()
+                    watch = self._inotify_add_watch(fd)
+                elif wd == watch and filename and not mask & IN_ISDIR:
+                    self.dispatch(mask, filename)
+
+    def _poll(self):
+        """ Lists the articles folder every `interval` seconds and applies any
+        created, modified or deleted files. Files are compared by modification
+        time and size, so edits made in place are picked up as well, and the
+        reader's indexes are updated along with its caches.
+        """
+        versions = self._versions
+
+        while not self._stopped.wait(self.interval):
+            try:
+                current = self._scan()
+            except OSError:
+                continue
+
+            for filename in set(versions) - set(current):
+                self.dispatch(IN_DELETE, filename)
+            for filename, version in current.iteritems():
+                if filename not in versions:
+                    self.dispatch(IN_MOVED_TO, filename)
+                elif versions[filename] != version:
+                    self.dispatch(IN_CLOSE_WRITE, filename)
+            versions = current
+
+    def _checkout(self):
+        """ Checks out the latest commit of the reader's ref every `interval`
+        seconds. Snapshots, and the indexes built from them, are only
+        replaced when the commit changes.
+        """
+        while not self._stopped.wait(self.interval):
+            try:
+                self.reader.checkout()
+            except ValueError:
+                logger.exception('inkwell watcher could not resolve %s',
+                    self.reader.ref)
+
+    def _scan(self):
+        """ Lists the regular files of the articles folder.
+
+        Returns::
+            dict mapping filenames to their modification time and size
+
+        Raises::
+            OSError if the folder cannot be listed.
+        """
+        folder = self.reader.articles_folder
+
+        versions = {}
+        for filename in os.listdir(folder):
+            try:
+                stat = os.stat(os.path.join(folder, filename))
+            except OSError:
+                continue
+            if S_ISREG(stat.st_mode):
+                versions[filename] = (stat.st_mtime, stat.st_size)
+        return versions
+
+    def _inotify_init(self):
+        """ Creates an inotify instance if the platform supports it.
+
+        Returns::
+            int inotify file descriptor, or None
+        """
+        if ctypes is None or not sys.platform.startswith('linux'):
+            return None
+
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library('c'),
+                use_errno=True)
+            fd = self._libc.inotify_init()
+        except (OSError, AttributeError):
+            return None
+        return fd if fd >= 0 else None
+
+    def _inotify_add_watch(self, fd):
+        """ Watches the reader's articles folder.
+
+        Arguments::
+            fd int inotify file descriptor
+
+        Returns::
+            int watch descriptor
+
+        Raises::
+            OSError if the folder cannot be watched.
+        """
+        folder = self.reader.articles_folder
+        if isinstance(folder, unicode):
+            folder = folder.encode(sys.getfilesystemencoding())
+
+        wd = self._libc.inotify_add_watch(fd, folder, INOTIFY_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        return wd
@@ -11,7 +11,7 @@ setup(
     author='Wilhelm Murdoch',
     author_email='wilhelm.murdoch@gmail.com',
     url='http://www.devilmayco.de/',
-    packages=find_packages(exclude=['tests', 'tests.*']),
+    packages=find_packages(exclude=['tests', 'tests.*', 'benchmarks']),
     install_requires=[
           'Flask==0.10'
         , 'PyYaml==3.10'
@@ -19,6 +19,9 @@ setup(
         , 'Markdown==2.3.1'
         , 'validator>=2.0.0'
     ],
+    entry_points={
+        'console_scripts': ['inkwell = inkwell.cli:main']
+    },
     setup_requires=[
           'nose==1.3.1'
         , 'yanc==0.2.4'
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
+import os
+import time
+import shutil
 import inkwell
+import tempfile
 import unittest
 import json
 import random
 from flask import json
 from tests import fixtures
+from inkwell.config import TestConfig
 from werkzeug.test import Client
 
 class ArchiveTest(unittest.TestCase):
@@ -19,6 +24,63 @@ class ArchiveTest(unittest.TestCase):
         body = json.loads(response.data)
         self.assertEquals(len(body), len(fixtures.valid_files))
 
+    def test_pagination(self):
+        response = fixtures.client.get('/inkwell/?limit=2&offset=2',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 200)
+        body = json.loads(response.data)
+
+        self.assertEquals(len(body), 2)
+        self.assertEquals(response.headers['X-Total-Count'],
+            str(len(fixtures.valid_files)))
+        self.assertTrue('after={}'.format(body[-1]['meta']['path'].replace(
+            '/', '%2F')) in response.headers['Link'])
+        self.assertFalse('offset' in response.headers['Link'])
+
+        response = fixtures.client.get('/inkwell/?limit=10',
+            headers={'Accept': 'application/json'})
+        self.assertFalse('Link' in response.headers)
+
+    def test_fields(self):
+        response = fixtures.client.get('/inkwell/?fields=title,meta',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 200)
+        body = json.loads(response.data)
+
+        self.assertEquals(len(body), len(fixtures.valid_files))
+        for article in body:
+            self.assertEquals(sorted(article.keys()), ['meta', 'title'])
+
+    def test_summary_only(self):
+        response = fixtures.client.get('/inkwell/?summary_only=1',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 200)
+        body = json.loads(response.data)
+
+        for article in body:
+            self.assertFalse('body' in article)
+            self.assertTrue('summary' in article)
+
+    def test_invalid_fields(self):
+        response = fixtures.client.get('/inkwell/?fields=title,merp',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 400)
+        body = json.loads(response.data)
+
+        self.assertEquals(body['description']['fields'][0],
+            'merp is not a valid field')
+
+    def test_invalid_paging(self):
+        response = fixtures.client.get('/inkwell/?limit=-1&offset=-2',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 400)
+        body = json.loads(response.data)
+
+        self.assertEquals(body['description']['limit'][0],
+            '-1 is not a valid limit')
+        self.assertEquals(body['description']['offset'][0],
+            '-2 is not a valid offset')
+
     def test_valid_year(self):
         year = random.choice(fixtures.dates.keys())
 
@@ -101,3 +163,196 @@ class ArchiveTest(unittest.TestCase):
 
         self.assertEquals(len(body['description']['day']), 1)
         self.assertEquals(body['description']['day'][0], '99 is not a valid day')
+
+    def test_etag_not_modified(self):
+        response = fixtures.client.get('/inkwell/?limit=2',
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(response.status_code, 200)
+        self.assertTrue(response.headers['ETag'].startswith('"'))
+        self.assertTrue('Last-Modified' in response.headers)
+
+        revalidated = fixtures.client.get('/inkwell/?limit=2', headers={
+              'Accept': 'application/json'
+            , 'If-None-Match': response.headers['ETag']
+        })
+
+        self.assertEquals(revalidated.status_code, 304)
+        self.assertEquals(revalidated.data, '')
+        self.assertEquals(revalidated.headers['ETag'], response.headers['ETag'])
+
+    def test_etag_varies_with_query(self):
+        first = fixtures.client.get('/inkwell/?limit=2',
+            headers={'Accept': 'application/json'})
+        second = fixtures.client.get('/inkwell/?limit=2&fields=title',
+            headers={'Accept': 'application/json'})
+
+        self.assertNotEquals(first.headers['ETag'], second.headers['ETag'])
+
+        response = fixtures.client.get('/inkwell/?limit=2', headers={
+              'Accept': 'application/json'
+            , 'If-None-Match': second.headers['ETag']
+        })
+        self.assertEquals(response.status_code, 200)
+
+    def test_if_modified_since(self):
+        response = fixtures.client.get('/inkwell/',
+            headers={'Accept': 'application/json'})
+
+        revalidated = fixtures.client.get('/inkwell/', headers={
+              'Accept': 'application/json'
+            , 'If-Modified-Since': response.headers['Last-Modified']
+        })
+        self.assertEquals(revalidated.status_code, 304)
+
+        stale = fixtures.client.get('/inkwell/', headers={
+              'Accept': 'application/json'
+            , 'If-Modified-Since': 'Thu, 01 Jan 1970 00:00:00 GMT'
+        })
+        self.assertEquals(stale.status_code, 200)
+
+    def test_if_modified_since_deleted(self):
+        folder = tempfile.mkdtemp()
+        try:
+            for filename in ('2013-07-01-first.txt', '2013-07-02-second.txt'):
+                path = os.path.join(folder, filename)
+                with open(path, 'w') as f:
+                    f.write('title: Article\n\nBody')
+                os.utime(path, (1000000000, 1000000000))
+
+            configuration = type('DeletionConfig', (TestConfig,),
+                {'ARTICLES_FOLDER': folder})
+            client = inkwell.bootstrap(configuration).test_client()
+            response = client.get('/inkwell/',
+                headers={'Accept': 'application/json'})
+
+            os.unlink(os.path.join(folder, '2013-07-02-second.txt'))
+            os.utime(folder, (0, time.time() + 10))
+
+            revalidated = client.get('/inkwell/', headers={
+                  'Accept': 'application/json'
+                , 'If-Modified-Since': response.headers['Last-Modified']
+            })
+            self.assertEquals(revalidated.status_code, 200)
+            self.assertEquals(len(json.loads(revalidated.data)), 1)
+        finally:
+            shutil.rmtree(folder)
+
+    def test_response_cache(self):
+        responses = fixtures.client.application.extensions['inkwell_responses']
+
+        first = fixtures.client.get('/inkwell/2013?limit=1',
+            headers={'Accept': 'application/json'})
+        hits = responses.memory.hits
+
+        second = fixtures.client.get('/inkwell/2013?limit=1',
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(responses.memory.hits, hits + 1)
+        self.assertEquals(second.data, first.data)
+        self.assertEquals(second.headers['Link'], first.headers['Link'])
+        self.assertEquals(second.headers['X-Total-Count'],
+            first.headers['X-Total-Count'])
+
+    def test_page_looked_up_once(self):
+        app = fixtures.client.application
+        reader = app.extensions['inkwell_reader']
+        app.extensions['inkwell_responses'].memory.clear()
+
+        page, pages = reader.page, []
+        reader.page = lambda **kwargs: pages.append(kwargs) or page(**kwargs)
+        try:
+            for url in ('/inkwell/?limit=1', '/inkwell/tags/lorem?limit=1'):
+                response = fixtures.client.get(url,
+                    headers={'Accept': 'application/json'})
+                self.assertEquals(response.status_code, 200)
+        finally:
+            del reader.page
+        self.assertEquals(len(pages), 2)
+
+    def test_since_and_until(self):
+        response = fixtures.client.get(
+            '/inkwell/?since=2013-07-02&until=2013-07-03',
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.headers['X-Total-Count'], '2')
+        self.assertEquals([a['meta']['path'] for a in json.loads(
+            response.data)], [
+              '2013/07/03/lorem-ipsum-example-three'
+            , '2013/07/02/lorem-ipsum-example-two'
+        ])
+
+        response = fixtures.client.get(
+            '/inkwell/?since=yesterday&until=2013-02-30',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 400)
+        body = json.loads(response.data)
+
+        self.assertEquals(body['description']['since'][0],
+            'yesterday is not a valid date')
+        self.assertEquals(body['description']['until'][0],
+            '2013-02-30 is not a valid date')
+
+        response = fixtures.client.get('/inkwell/tags/inkwell?until=9999-12-31',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 200)
+
+    def test_streamed_listing(self):
+        app = fixtures.client.application
+        responses = app.extensions['inkwell_responses']
+        headers = {'Accept': 'application/json'}
+
+        responses.memory.clear()
+        buffered = fixtures.client.get('/inkwell/', headers=headers)
+
+        with app.test_request_context('/inkwell/', headers=headers):
+            self.assertFalse(app.full_dispatch_request().is_streamed)
+
+        threshold = app.config['STREAM_THRESHOLD']
+        app.config['STREAM_THRESHOLD'] = 1
+        try:
+            responses.memory.clear()
+            streamed = fixtures.client.get('/inkwell/', headers=headers)
+            self.assertEquals(len(responses.memory), 0)
+
+            with app.test_request_context('/inkwell/', headers=headers):
+                response = app.full_dispatch_request()
+                self.assertTrue(response.is_streamed)
+                self.assertEquals(response.get_data(), buffered.data)
+        finally:
+            app.config['STREAM_THRESHOLD'] = threshold
+
+        self.assertEquals(streamed.status_code, 200)
+        self.assertEquals(streamed.data, buffered.data)
+        self.assertEquals(streamed.headers['ETag'], buffered.headers['ETag'])
+        self.assertEquals(streamed.headers['X-Total-Count'],
+            buffered.headers['X-Total-Count'])
+        self.assertEquals(streamed.headers['Content-Type'],
+            'application/json; charset=utf-8')
+
+    def test_summary(self):
+        response = fixtures.client.get('/inkwell/archive/summary',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.headers['X-Total-Count'],
+            str(len(fixtures.valid_files)))
+
+        body = json.loads(response.data)
+        self.assertEquals([y['year'] for y in body],
+            sorted(fixtures.dates, reverse=True))
+        for year in body:
+            self.assertEquals(sorted(m['month'] for m in year['months']),
+                sorted(fixtures.dates[year['year']]))
+            for month in year['months']:
+                self.assertEquals(sorted(d['day'] for d in month['days']),
+                    sorted(fixtures.dates[year['year']][month['month']]))
+                self.assertEquals(month['count'],
+                    sum(d['count'] for d in month['days']))
+        self.assertFalse('Last-Modified' in response.headers)
+
+        response = fixtures.client.get('/inkwell/archive/summary', headers={
+              'Accept': 'application/json'
+            , 'If-None-Match': response.headers['ETag']
+        })
+        self.assertEquals(response.status_code, 304)
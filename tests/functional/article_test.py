@@ -52,4 +52,103 @@ class ArticleTest(unittest.TestCase):
         self.assertEquals(body['description']['month'][0], '99 is not a valid month')
 
         self.assertEquals(len(body['description']['day']), 1)
-        self.assertEquals(body['description']['day'][0], '99 is not a valid day')
\ No newline at end of file
+        self.assertEquals(body['description']['day'][0], '99 is not a valid day')
+
+    def test_article_not_modified(self):
+        file = random.choice(fixtures.valid_files)
+        matched = re.match(inkwell.reader.ARTICLE_FILE_PATTERN, file)
+        url = "/inkwell/{}/{}/{}/{}".format(*matched.group('year', 'month',
+            'day', 'title'))
+
+        response = fixtures.client.get(url,
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 200)
+
+        revalidated = fixtures.client.get(url, headers={
+              'Accept': 'application/json'
+            , 'If-None-Match': response.headers['ETag']
+        })
+        self.assertEquals(revalidated.status_code, 304)
+
+        changed = fixtures.client.get(url, headers={
+              'Accept': 'application/json'
+            , 'If-None-Match': '"stale"'
+        })
+        self.assertEquals(changed.status_code, 200)
+
+    def test_shared_reader(self):
+        app = fixtures.client.application
+        reader = app.extensions['inkwell_reader']
+        app.extensions['inkwell_responses'].memory.clear()
+
+        filename = sorted(fixtures.valid_files)[-1]
+        reader.cache.delete(filename)
+
+        matched = re.match(inkwell.reader.ARTICLE_FILE_PATTERN, filename)
+        response = fixtures.client.get("/inkwell/{}/{}/{}/{}".format(
+            *matched.group('year', 'month', 'day', 'title')),
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(response.status_code, 200)
+        self.assertTrue(filename in reader.cache)
+
+    def test_reader_renderer(self):
+        reader = fixtures.client.application.extensions['inkwell_reader']
+        other = inkwell.bootstrap('inkwell.config.TestConfig').extensions[
+            'inkwell_reader']
+
+        self.assertFalse(reader.renderer is other.renderer)
+        self.assertFalse(reader.header_parser is other.header_parser)
+        self.assertFalse(reader.renderer is inkwell.reader.renderer)
+
+        article = reader.fetch_article(sorted(fixtures.valid_files)[-1])
+        self.assertTrue(article.renderer is reader.renderer)
+
+    def test_neighbors(self):
+        url = '/inkwell/2013/07/02/lorem-ipsum-example-two'
+        response = fixtures.client.get(url + '?neighbors=1',
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(response.status_code, 200)
+        body = json.loads(response.data)
+        self.assertEquals(body['previous']['meta']['path'],
+            '2013/07/01/lorem-ipsum-example-one')
+        self.assertEquals(body['next']['meta']['path'],
+            '2013/07/03/lorem-ipsum-example-three')
+        self.assertEquals(sorted(body['next'].keys()), ['meta', 'title'])
+
+        plain = fixtures.client.get(url, headers={'Accept': 'application/json'})
+        self.assertFalse('previous' in json.loads(plain.data))
+        self.assertNotEquals(plain.headers['ETag'], response.headers['ETag'])
+
+        response = fixtures.client.get(
+            '/inkwell/2014/07/03/lorem-ipsum-example-four?neighbors=1',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(json.loads(response.data)['next'], None)
+
+    def test_related(self):
+        response = fixtures.client.get(
+            '/inkwell/2013/07/02/lorem-ipsum-example-two?related=1',
+            headers={'Accept': 'application/json'})
+
+        body = json.loads(response.data)
+        self.assertEquals([a['meta']['path'] for a in body['related']],
+            ['2013/07/01/lorem-ipsum-example-one'])
+        self.assertFalse('previous' in body)
+
+        response = fixtures.client.get(
+            '/inkwell/2013/07/03/lorem-ipsum-example-three?related=5',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(json.loads(response.data)['related'], [])
+
+    def test_related_limit(self):
+        app = fixtures.client.application
+        limit = app.config['RELATED_LIMIT']
+        app.config['RELATED_LIMIT'] = 0
+        try:
+            response = fixtures.client.get(
+                '/inkwell/2013/07/02/lorem-ipsum-example-two?related=1000000',
+                headers={'Accept': 'application/json'})
+            self.assertFalse('related' in json.loads(response.data))
+        finally:
+            app.config['RELATED_LIMIT'] = limit
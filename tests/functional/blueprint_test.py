@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+import inkwell
+import unittest
+from flask import Flask, json
+from tests import fixtures
+
+class BlueprintTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask('host')
+        self.app.config.from_object('inkwell.config.TestConfig')
+        self.app.register_blueprint(inkwell.api)
+        self.client = self.app.test_client()
+
+    def test_archive(self):
+        response = self.client.get('/inkwell/',
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(len(json.loads(response.data)),
+            len(fixtures.valid_files))
+
+    def test_shared_reader(self):
+        self.client.get('/inkwell/', headers={'Accept': 'application/json'})
+        reader = self.app.extensions['inkwell_reader']
+
+        self.client.get('/inkwell/2013', headers={'Accept': 'application/json'})
+        self.assertTrue(self.app.extensions['inkwell_reader'] is reader)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from inkwell.build import Builder, BUILD_DOCUMENT
+from tests import fixtures
+
+class BuildTest(unittest.TestCase):
+    def setUp(self):
+        self.output = tempfile.mkdtemp()
+        self.builder = Builder('inkwell.config.TestConfig', output=self.output,
+            page_size=2, processes=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.output)
+
+    def load(self, path):
+        with open(os.path.join(self.output, path, BUILD_DOCUMENT)) as f:
+            return json.load(f)
+
+    def test_build(self):
+        result = self.builder.build()
+
+        self.assertEquals(result['built'], len(self.builder.targets()))
+        self.assertEquals(len(self.load('inkwell')),
+            len(fixtures.valid_files))
+        self.assertEquals(len(self.load('inkwell/page/1')), 2)
+        self.assertEquals(len(self.load('inkwell/page/3')), 1)
+        self.assertEquals(len(self.load('inkwell/2013/07')), 3)
+        self.assertEquals(self.load('inkwell/1900/07/03/'
+            'lorem-ipsum-example-old')['title'], 'Lorem Ipsum Example Old')
+
+        self.assertEquals(sum(y['count'] for y in
+            self.load('inkwell/archive/summary')), len(fixtures.valid_files))
+        self.assertEquals(self.load('inkwell/tags')[0],
+            {'value': 'lorem', 'count': 3})
+        self.assertEquals(len(self.load('inkwell/tags/lorem')), 3)
+        self.assertEquals(len(self.load('inkwell/tags/lorem/page/2')), 1)
+        self.assertEquals(len(self.load('inkwell/meta/tags/example')), 2)
+        self.assertEquals(self.load('inkwell/meta/tags'),
+            self.load('inkwell/tags'))
+
+        with open(os.path.join(self.output, 'inkwell', 'feed.json')) as f:
+            self.assertEquals(len(json.load(f)['items']),
+                len(fixtures.valid_files))
+        self.assertTrue(os.path.isfile(os.path.join(self.output, 'inkwell',
+            'feed.atom')))
+
+    def test_rebuild_only_changes(self):
+        self.builder.build()
+
+        result = self.builder.build()
+        self.assertEquals(result['built'], 0)
+        self.assertEquals(result['skipped'], len(self.builder.targets()))
+
+        os.unlink(os.path.join(self.output, 'inkwell', BUILD_DOCUMENT))
+        os.unlink(os.path.join(self.output, 'inkwell', 'feed.rss'))
+        self.assertEquals(self.builder.build()['built'], 2)
+
+    def test_parallel_build(self):
+        self.builder.processes = 2
+        result = self.builder.build()
+
+        self.assertEquals(result['built'], len(self.builder.targets()))
+        self.assertEquals(len(self.load('inkwell/2014')), 1)
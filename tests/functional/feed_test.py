@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import unittest
+from flask import json
+from xml.etree import ElementTree
+from tests import fixtures
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+
+class FeedTest(unittest.TestCase):
+    def test_atom(self):
+        response = fixtures.client.get('/inkwell/feed.atom')
+
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.headers['Content-Type'],
+            'application/atom+xml; charset=utf-8')
+
+        root = ElementTree.fromstring(response.data)
+        entries = root.findall(ATOM + 'entry')
+        self.assertEquals(len(entries), len(fixtures.valid_files))
+        self.assertEquals(entries[0].find(ATOM + 'id').text,
+            'http://localhost/inkwell/2014/07/03/lorem-ipsum-example-four')
+        self.assertEquals(root.find(ATOM + 'updated').text,
+            '2014-07-03T00:00:00Z')
+        self.assertEquals([c.get('term') for c in entries[0].findall(
+            ATOM + 'category')], ['lorem'])
+
+    def test_rss(self):
+        response = fixtures.client.get('/inkwell/feed.rss')
+
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.headers['Content-Type'],
+            'application/rss+xml; charset=utf-8')
+
+        items = ElementTree.fromstring(response.data).findall('channel/item')
+        self.assertEquals(len(items), len(fixtures.valid_files))
+        self.assertEquals(items[0].find('pubDate').text,
+            'Thu, 03 Jul 2014 00:00:00 GMT')
+
+    def test_json_feed(self):
+        response = fixtures.client.get('/inkwell/feed.json')
+
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.headers['Content-Type'],
+            'application/feed+json; charset=utf-8')
+
+        body = json.loads(response.data)
+        self.assertEquals(body['feed_url'], 'http://localhost/inkwell/feed.json')
+        self.assertEquals([i['date_published'][:10] for i in body['items']],
+            sorted([f[:10] for f in fixtures.valid_files], reverse=True))
+        self.assertTrue(body['items'][0]['content_html'].startswith('<p>'))
+
+    def test_not_modified(self):
+        response = fixtures.client.get('/inkwell/feed.atom')
+        self.assertTrue('Last-Modified' in response.headers)
+
+        response = fixtures.client.get('/inkwell/feed.atom',
+            headers={'If-None-Match': response.headers['ETag']})
+        self.assertEquals(response.status_code, 304)
+
+        response = fixtures.client.get('/inkwell/feed.rss',
+            headers={'If-None-Match': response.headers['ETag']})
+        self.assertEquals(response.status_code, 200)
+
+    def test_feed_size(self):
+        app = fixtures.client.application
+        size = app.config['FEED_SIZE']
+        app.config['FEED_SIZE'] = 2
+        try:
+            response = fixtures.client.get('/inkwell/feed.json')
+            self.assertEquals(len(json.loads(response.data)['items']), 2)
+        finally:
+            app.config['FEED_SIZE'] = size
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import unittest
+from flask import json
+from tests import fixtures
+
+class MetaTest(unittest.TestCase):
+    def test_tags(self):
+        response = fixtures.client.get('/inkwell/tags',
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(json.loads(response.data), [
+              {'value': 'lorem', 'count': 3}
+            , {'value': 'example', 'count': 2}
+        ])
+        self.assertEquals(response.headers['X-Total-Count'], '2')
+        self.assertFalse('Last-Modified' in response.headers)
+
+        response = fixtures.client.get('/inkwell/tags', headers={
+              'Accept': 'application/json'
+            , 'If-None-Match': response.headers['ETag']
+        })
+        self.assertEquals(response.status_code, 304)
+
+    def test_tag(self):
+        response = fixtures.client.get('/inkwell/tags/lorem?limit=2',
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.headers['X-Total-Count'], '3')
+        self.assertEquals([a['meta']['path'] for a in json.loads(
+            response.data)], [
+              '2014/07/03/lorem-ipsum-example-four'
+            , '2013/07/02/lorem-ipsum-example-two'
+        ])
+        self.assertTrue('after=2013%2F07%2F02' in response.headers['Link'])
+
+        response = fixtures.client.get('/inkwell/tags/nothing',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(json.loads(response.data), [])
+
+        for url in ('/inkwell/tags/%20', '/inkwell/meta/tags/%20'):
+            response = fixtures.client.get(url,
+                headers={'Accept': 'application/json'})
+            self.assertEquals(response.status_code, 200)
+            self.assertEquals(json.loads(response.data), [])
+
+    def test_meta(self):
+        response = fixtures.client.get('/inkwell/meta/tags/example',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.headers['X-Total-Count'], '2')
+
+        response = fixtures.client.get('/inkwell/meta/tags',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(len(json.loads(response.data)), 2)
+
+    def test_unindexed_key(self):
+        for url in ('/inkwell/meta/author', '/inkwell/meta/author/ada'):
+            response = fixtures.client.get(url,
+                headers={'Accept': 'application/json'})
+            self.assertEquals(response.status_code, 404)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import unittest
+from flask import json
+from tests import fixtures
+
+class SearchTest(unittest.TestCase):
+    def test_bad_accept_header(self):
+        response = fixtures.client.get('/inkwell/search?q=lorem')
+        self.assertEquals(response.status_code, 400)
+
+    def test_missing_query(self):
+        response = fixtures.client.get('/inkwell/search',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(response.status_code, 400)
+        self.assertEquals(json.loads(response.data)['description']['q'],
+            ['q is required'])
+
+    def test_search(self):
+        response = fixtures.client.get('/inkwell/search?q=two',
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.headers['X-Total-Count'], '1')
+        body = json.loads(response.data)
+        self.assertEquals([a['meta']['path'] for a in body],
+            ['2013/07/02/lorem-ipsum-example-two'])
+        self.assertTrue('ETag' in response.headers)
+
+        response = fixtures.client.get('/inkwell/search?q=nothing',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(json.loads(response.data), [])
+
+    def test_pagination(self):
+        response = fixtures.client.get(
+            '/inkwell/search?q=lor*&limit=2&fields=title',
+            headers={'Accept': 'application/json'})
+
+        self.assertEquals(len(json.loads(response.data)), 2)
+        self.assertEquals(response.headers['X-Total-Count'],
+            str(len(fixtures.valid_files)))
+        self.assertTrue('offset=2' in response.headers['Link'])
+
+        response = fixtures.client.get(
+            '/inkwell/search?q=lor*&limit=2&offset=4',
+            headers={'Accept': 'application/json'})
+        self.assertEquals(len(json.loads(response.data)), 1)
+        self.assertFalse('Link' in response.headers)
+
+    def test_not_modified(self):
+        response = fixtures.client.get('/inkwell/search?q=lorem',
+            headers={'Accept': 'application/json'})
+
+        response = fixtures.client.get('/inkwell/search?q=lorem', headers={
+              'Accept': 'application/json'
+            , 'If-None-Match': response.headers['ETag']
+        })
+        self.assertEquals(response.status_code, 304)
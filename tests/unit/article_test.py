@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
-from inkwell.reader import Article, Reader, ARTICLE_FILE_PATTERN
+from inkwell.reader import Article, Reader, MarkdownRenderer, \
+    ARTICLE_FILE_PATTERN
 from dateutil import parser
 from datetime import datetime
+import os
 import re
+import time
+import pickle
+import shutil
+import tempfile
 import unittest
 from tests import fixtures
 
@@ -64,7 +70,7 @@ class ArticleTest(unittest.TestCase):
         self.assertEquals(article.body, '')
         self.assertTrue(isinstance(article, Article))
 
-        self.assertEquals(article.date, meta['date'])
+        self.assertEquals(article.date, article.meta['date'])
         self.assertEquals(article.arbitrary, meta['arbitrary'])
         self.assertEquals(article.title, meta['title'])
 
@@ -111,6 +117,59 @@ class ArticleTest(unittest.TestCase):
         self.assertEquals(article['summary'], '<p>This is a summary.</p>')
         self.assertEquals(article['body'], '<p>This is a body.</p>')
 
+    def test_compact_representation(self):
+        meta = {'title': 'Compact', 'tags': ['foo']}
+        article = Article(filename='2013-07-28-compact.txt', meta=meta,
+            body='Body')
+
+        self.assertFalse(hasattr(article, '__dict__'))
+        self.assertEquals(meta, {'title': 'Compact', 'tags': ['foo']})
+        self.assertEquals(article.tags, ['foo'])
+        self.assertIsNone(article.missing)
+        self.assertEquals(article.meta['path'], '2013/07/28/compact')
+        self.assertEquals(article.slug, 'compact')
+
+        article.meta['tags'] = ['bar']
+        article.meta['tags'].append('bar')
+        self.assertEquals(article.tags, ['foo'])
+
+        article.tags = ['foo', 'baz']
+        self.assertEquals(article.meta['tags'], ['foo', 'baz'])
+        self.assertEquals(meta, {'title': 'Compact', 'tags': ['foo']})
+        article.tags = ['foo']
+
+        copy = pickle.loads(pickle.dumps(article, pickle.HIGHEST_PROTOCOL))
+        self.assertEquals(copy.to_json(), article.to_json())
+        self.assertEquals(copy.path, '2013/07/28/compact')
+
+    def test_article_with_loader(self):
+        filename = '2013-07-28-summary-test.txt'
+        meta = {
+              'title': 'I should have a summary!'
+            , 'summary': True
+        }
+        loads = []
+
+        def loader():
+            loads.append(filename)
+            return """This is a summary.\n\nThis is a body."""
+
+        article = Article(filename=filename, meta=meta, loader=loader)
+        self.assertEquals(article.to_json(fields=['title', 'meta']).keys(),
+            ['meta', 'title'])
+        self.assertEquals(loads, [])
+
+        self.assertEquals(article.summary, 'This is a summary.')
+        self.assertEquals(article.body, 'This is a body.')
+        self.assertEquals(loads, [filename])
+
+        article = Article(filename=filename, meta=meta, loader=loader,
+            retain=False)
+        copy = pickle.loads(pickle.dumps(article, pickle.HIGHEST_PROTOCOL))
+        self.assertIsNone(copy.loader)
+        self.assertEquals(copy.summary, 'This is a summary.')
+        self.assertEquals(copy.body, 'This is a body.')
+
     def test_article_has_no_summary(self):
         filename = '2013-07-28-summary-test.txt'
         meta = {
@@ -121,6 +180,44 @@ class ArticleTest(unittest.TestCase):
 
         self.assertFalse(article['summary'])
 
+    def test_markdown_renderer(self):
+        folder = tempfile.mkdtemp()
+
+        try:
+            renderer = MarkdownRenderer(folder=folder)
+            html = renderer.render('Hello *World*!')
+
+            self.assertEquals(html, '<p>Hello <em>World</em>!</p>')
+            self.assertEquals(renderer.render('Hello *World*!'), html)
+            self.assertEquals(renderer.cache.stats()['hits'], 1)
+
+            renderer = MarkdownRenderer(folder=folder)
+            self.assertEquals(renderer.render('Hello *World*!'), html)
+            self.assertEquals(renderer.cache.stats()['misses'], 1)
+        finally:
+            shutil.rmtree(folder)
+
+    def test_markdown_renderer_prune(self):
+        folder = tempfile.mkdtemp()
+
+        try:
+            renderer = MarkdownRenderer(folder=folder)
+            renderer.render('Hello *World*!')
+            renderer.render('Hello *Again*!')
+
+            path = renderer.store._path(renderer.key('Hello *World*!'))
+            os.utime(path, (time.time() - 120, time.time() - 120))
+
+            renderer = MarkdownRenderer(cache_size=0, folder=folder,
+                max_age=60)
+            self.assertIsNone(renderer.store.get(
+                renderer.key('Hello *World*!')))
+            self.assertTrue(renderer.store.get(
+                renderer.key('Hello *Again*!')))
+            self.assertEquals(renderer.prune(), 0)
+        finally:
+            shutil.rmtree(folder)
+
     def test_unslugify(self):
         for filename in fixtures.valid_files:
             article = Article(filename=filename)
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+from inkwell.cache import LRUCache, FileCache, ResponseCache, RESPONSE_FORMAT
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+class LRUCacheTest(unittest.TestCase):
+    def test_get_and_set(self):
+        cache = LRUCache()
+        cache.set('foo', 'bar')
+
+        self.assertEquals(cache.get('foo'), 'bar')
+        self.assertIsNone(cache.get('baz'))
+        self.assertEquals(cache.stats()['hits'], 1)
+        self.assertEquals(cache.stats()['misses'], 1)
+
+    def test_version_mismatch(self):
+        cache = LRUCache()
+        cache.set('foo', 'bar', version=1)
+
+        self.assertEquals(cache.get('foo', version=1), 'bar')
+        self.assertIsNone(cache.get('foo', version=2))
+        self.assertFalse('foo' in cache)
+        self.assertEquals(cache.size, 0)
+
+    def test_eviction(self):
+        cache = LRUCache(max_size=10)
+        cache.set('a', 'a', size=4)
+        cache.set('b', 'b', size=4)
+        cache.get('a')
+        cache.set('c', 'c', size=4)
+
+        self.assertTrue('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEquals(cache.size, 8)
+        self.assertEquals(cache.stats()['evictions'], 1)
+
+    def test_oversized_entry(self):
+        cache = LRUCache(max_size=10)
+        cache.set('a', 'a', size=11)
+
+        self.assertFalse('a' in cache)
+        self.assertEquals(cache.size, 0)
+
+    def test_disabled(self):
+        cache = LRUCache(max_size=0)
+        cache.set('a', 'a')
+
+        self.assertEquals(len(cache), 0)
+
+    def test_delete_and_clear(self):
+        cache = LRUCache()
+        cache.set('a', 'a', size=3)
+        cache.set('b', 'b', size=3)
+        cache.delete('a')
+
+        self.assertFalse('a' in cache)
+        self.assertEquals(cache.size, 3)
+
+        cache.clear()
+        self.assertEquals(len(cache), 0)
+        self.assertEquals(cache.size, 0)
+
+
+class FileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_get_and_set(self):
+        cache = FileCache(self.folder)
+        cache.set('abcdef', 'foo')
+
+        self.assertEquals(cache.get('abcdef'), 'foo')
+        self.assertEquals(FileCache(self.folder).get('abcdef'), 'foo')
+        self.assertIsNone(cache.get('ghijkl'))
+
+    def test_delete(self):
+        cache = FileCache(self.folder)
+        cache.set('abcdef', 'foo')
+        cache.delete('abcdef')
+        cache.delete('abcdef')
+
+        self.assertIsNone(cache.get('abcdef'))
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_get_and_set(self):
+        cache = ResponseCache()
+        cache.set('abcdef', '{"title": "Foo"}', {'X-Total-Count': '1'})
+
+        self.assertEquals(cache.get('abcdef'),
+            ('{"title": "Foo"}', {'X-Total-Count': '1'}))
+        self.assertIsNone(cache.get('ghijkl'))
+
+    def test_shared_folder(self):
+        ResponseCache(folder=self.folder).set('abcdef', '[]\n[]',
+            {'Link': '<http://localhost/>; rel="next"'})
+
+        cache = ResponseCache(max_size=0, folder=self.folder)
+        self.assertEquals(cache.get('abcdef'),
+            ('[]\n[]', {'Link': '<http://localhost/>; rel="next"'}))
+        self.assertEquals(len(cache.memory), 0)
+
+    def test_format_version(self):
+        ResponseCache(folder=self.folder).store.set('abcdef', '{}\n[]')
+        self.assertIsNone(ResponseCache(folder=self.folder).get('abcdef'))
+
+    def test_prune(self):
+        ResponseCache(folder=self.folder).set('abcdef', '[]')
+        ResponseCache(folder=self.folder).set('ghijkl', '[]')
+
+        path = ResponseCache(folder=self.folder).store._path(
+            'abcdef.{}'.format(RESPONSE_FORMAT))
+        os.utime(path, (time.time() - 120, time.time() - 120))
+
+        cache = ResponseCache(max_size=0, folder=self.folder, max_age=60)
+        self.assertIsNone(cache.get('abcdef'))
+        self.assertEquals(cache.get('ghijkl'), ('[]', {}))
+        self.assertEquals(cache.prune(), 0)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from inkwell import encoding
+from inkwell.encoding import Fragment, Encoder
+from inkwell.reader import Article
+from flask import json
+from datetime import date, datetime, time
+import unittest
+
+class EncodingTest(unittest.TestCase):
+    def test_dumps(self):
+        value = {'title': u'W\xf6rld', 'date': datetime(2013, 7, 12),
+            'tags': ('foo', 'bar')}
+
+        dumped = encoding.dumps(value)
+        self.assertTrue(isinstance(dumped, Fragment))
+        self.assertEquals(json.loads(dumped), {'title': u'W\xf6rld',
+            'date': '2013-07-12T00:00:00Z', 'tags': ['foo', 'bar']})
+        self.assertTrue(encoding.dumps(dumped) is dumped)
+
+    def test_plain(self):
+        self.assertEquals(encoding.plain({'a': [date(2013, 7, 12),
+            time(12, 34)]}), {'a': ['2013-07-12Z', '12:34:00']})
+
+        try:
+            encoding.plain({'a': object()})
+            assert False
+        except TypeError:
+            assert True
+
+    def test_array(self):
+        fragments = [encoding.dumps({'a': 1}), encoding.dumps({'b': 2})]
+        self.assertEquals(json.loads(encoding.array(fragments)),
+            [{'a': 1}, {'b': 2}])
+        self.assertEquals(encoding.array([]), '[]')
+
+    def test_encoder(self):
+        article = Article(filename='2013-07-12-example.txt', body='Hello')
+        self.assertEquals(json.loads(json.dumps([article], cls=Encoder)),
+            [json.loads(encoding.dumps(article.to_json()))])
+
+        try:
+            json.dumps(object(), cls=Encoder)
+            assert False
+        except TypeError:
+            assert True
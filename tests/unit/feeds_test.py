@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+from datetime import datetime
+from xml.etree import ElementTree
+from inkwell import feeds
+from inkwell.reader import Article
+from inkwell.encoding import Fragment
+
+FEED = {
+      'title': u'Caf\xe9 <Notes>'
+    , 'link': 'http://example.com/'
+    , 'url': 'http://example.com/inkwell/feed.atom'
+}
+
+class FeedsTest(unittest.TestCase):
+    def setUp(self):
+        article = Article(filename='2013-07-12-example.txt', title='Example',
+            meta={'tags': 'inkwell', 'summary': True, 'author': 'Wilhelm'},
+            body='This is a summary.\n\nThis is a <body>.')
+        self.entry = feeds.entry(article, 'http://example.com/2013/07/12/example')
+
+    def test_entry(self):
+        self.assertEquals(self.entry['title'], 'Example')
+        self.assertEquals(self.entry['date'], datetime(2013, 7, 12))
+        self.assertEquals(self.entry['tags'], [u'inkwell'])
+        self.assertEquals(self.entry['author'], u'Wilhelm')
+        self.assertEquals(self.entry['summary'], u'<p>This is a summary.</p>')
+        self.assertTrue(self.entry['content'].startswith(
+            u'<p>This is a summary.</p>\n<p>This is a'))
+
+    def test_atom(self):
+        root = ElementTree.fromstring(feeds.atom(FEED, [self.entry]))
+        ns = '{' + feeds.ATOM_NAMESPACE + '}'
+
+        self.assertEquals(root.find(ns + 'title').text, u'Caf\xe9 <Notes>')
+        content = root.find(ns + 'entry/' + ns + 'content')
+        self.assertEquals(content.get('type'), 'html')
+        self.assertEquals(content.text, self.entry['content'])
+        self.assertEquals(root.find(ns + 'author/' + ns + 'name').text,
+            u'Caf\xe9 <Notes>')
+        self.assertEquals(root.find(ns + 'entry/' + ns + 'author/' + ns +
+            'name').text, u'Wilhelm')
+
+        authored = ElementTree.fromstring(feeds.atom(dict(FEED,
+            author='Inkwell'), [self.entry]))
+        self.assertEquals(authored.find(ns + 'author/' + ns + 'name').text,
+            'Inkwell')
+
+        empty = ElementTree.fromstring(feeds.atom(FEED, []))
+        self.assertEquals(empty.find(ns + 'updated').text,
+            '1970-01-01T00:00:00Z')
+
+    def test_rss(self):
+        root = ElementTree.fromstring(feeds.rss(FEED, [self.entry]))
+        self.assertEquals(root.find('channel/item/pubDate').text,
+            'Fri, 12 Jul 2013 00:00:00 GMT')
+        self.assertEquals(root.find('channel/item/category').text, 'inkwell')
+
+    def test_json_feed(self):
+        document = feeds.json_feed(FEED, [self.entry])
+        self.assertTrue(isinstance(document, Fragment))
+        self.assertEquals(json.loads(document)['items'][0]['date_published'],
+            '2013-07-12T00:00:00Z')
+        self.assertEquals(json.loads(document)['items'][0]['authors'],
+            [{'name': 'Wilhelm'}])
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+from inkwell.index import ArticleIndex, MetaIndex
+from inkwell.reader import ARTICLE_FILE_PATTERN
+import unittest
+from datetime import date
+from tests import fixtures
+
+class ArticleIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = ArticleIndex(ARTICLE_FILE_PATTERN, fixtures.valid_files)
+
+    def test_init_with_filenames(self):
+        self.assertEquals(len(self.index), len(fixtures.valid_files))
+
+    def test_ignores_invalid_filenames(self):
+        index = ArticleIndex(ARTICLE_FILE_PATTERN, fixtures.invalid_files)
+        self.assertFalse(index.add('invalidfilename.txt'))
+        self.assertEquals(len(index), 0)
+
+    def test_tree(self):
+        self.assertEquals(self.index.tree['2013']['07']['01'], {
+            'lorem-ipsum-example-one': '2013-07-01-lorem-ipsum-example-one.txt'
+        })
+
+    def test_lookup(self):
+        self.assertEquals(self.index.lookup(), sorted(fixtures.valid_files,
+            reverse=True))
+        self.assertEquals(len(self.index.lookup(year=2013)), 3)
+        self.assertEquals(len(self.index.lookup(year='2013', month='07')), 3)
+        self.assertEquals(len(self.index.lookup(month=7)),
+            len(fixtures.valid_files))
+        self.assertEquals(self.index.lookup(year=2013, month=7, day=2),
+            ['2013-07-02-lorem-ipsum-example-two.txt'])
+        self.assertEquals(self.index.lookup(year=2099), [])
+
+    def test_lookup_invalid(self):
+        try:
+            self.index.lookup(year='merp')
+            assert False
+        except ValueError:
+            assert True
+
+    def test_add_and_remove(self):
+        filename = '2015-01-01-new-article.txt'
+
+        self.assertTrue(self.index.add(filename))
+        self.assertTrue(filename in self.index)
+        self.assertEquals(self.index.lookup()[0], filename)
+
+        self.assertTrue(self.index.remove(filename))
+        self.assertFalse(filename in self.index)
+        self.assertFalse('2015' in self.index.tree)
+        self.assertFalse(self.index.remove(filename))
+
+    def test_ignores_invalid_dates(self):
+        self.assertFalse(self.index.add('2013-02-30-not-a-day.txt'))
+        self.assertFalse('2013-02-30-not-a-day.txt' in self.index)
+
+    def test_page(self):
+        filenames, total = self.index.page(year=2013, limit=2)
+        self.assertEquals(filenames, self.index.lookup(year=2013)[:2])
+        self.assertEquals(total, 3)
+
+        filenames, total = self.index.page(year=2013, month=7, offset=1,
+            after='2013-07-03-lorem-ipsum-example-three.txt')
+        self.assertEquals(filenames, ['2013-07-01-lorem-ipsum-example-one.txt'])
+        self.assertEquals(total, 3)
+
+        self.assertEquals(self.index.page(month=7)[1],
+            len(fixtures.valid_files))
+        self.assertEquals(self.index.page(year=2099), ([], 0))
+
+    def test_page_since_and_until(self):
+        filenames, total = self.index.page(since=date(2013, 7, 2),
+            until=date(2014, 1, 1))
+        self.assertEquals(filenames, [
+              '2013-07-03-lorem-ipsum-example-three.txt'
+            , '2013-07-02-lorem-ipsum-example-two.txt'
+        ])
+        self.assertEquals(total, 2)
+
+        self.assertEquals(self.index.page(year=2013, since=date(2013, 7, 3))[0],
+            ['2013-07-03-lorem-ipsum-example-three.txt'])
+        self.assertEquals(self.index.page(until=date(1900, 12, 31))[0],
+            ['1900-07-03-lorem-ipsum-example-old.txt'])
+        self.assertEquals(self.index.page(month=7, until=date(1900, 12, 31)),
+            (['1900-07-03-lorem-ipsum-example-old.txt'], 1))
+        self.assertEquals(self.index.page(since=date(2015, 1, 1)), ([], 0))
+
+    def test_page_within(self):
+        within = [
+              '1900-07-03-lorem-ipsum-example-old.txt'
+            , '2013-07-01-lorem-ipsum-example-one.txt'
+            , '2013-07-03-lorem-ipsum-example-three.txt'
+        ]
+        self.assertEquals(self.index.page(within=within), (within[::-1], 3))
+        self.assertEquals(self.index.page(year=2013, within=within),
+            (within[:0:-1], 2))
+        self.assertEquals(self.index.page(year=2013, limit=1, within=within,
+            after='2013-07-03-lorem-ipsum-example-three.txt'), ([within[1]], 2))
+        self.assertEquals(self.index.page(until=date(9999, 12, 31),
+            within=within), (within[::-1], 3))
+        self.assertEquals(self.index.page(until=date(2013, 7, 3),
+            since=date(2013, 7, 3), within=within), ([within[2]], 1))
+        self.assertEquals(self.index.page(month=7, offset=2, within=within),
+            ([within[0]], 3))
+        self.assertEquals(self.index.page(until=date(2013, 7, 1),
+            within=within), (within[1::-1], 2))
+        self.assertEquals(self.index.page(within=[]), ([], 0))
+
+    def test_neighbors(self):
+        self.assertEquals(self.index.neighbors(
+            '2013-07-02-lorem-ipsum-example-two.txt'), (
+              '2013-07-01-lorem-ipsum-example-one.txt'
+            , '2013-07-03-lorem-ipsum-example-three.txt'
+        ))
+        self.assertEquals(self.index.neighbors(
+            '1900-07-03-lorem-ipsum-example-old.txt'),
+            (None, '2013-07-01-lorem-ipsum-example-one.txt'))
+        self.assertEquals(self.index.neighbors(
+            '2014-07-03-lorem-ipsum-example-four.txt')[1], None)
+        self.assertEquals(self.index.neighbors('2013-07-02-missing.txt'),
+            (None, None))
+
+    def test_count(self):
+        self.assertEquals(self.index.count(), len(fixtures.valid_files))
+        self.assertEquals(self.index.count(year=2013), 3)
+        self.assertEquals(self.index.count(year=2013, month=7, day=2), 1)
+        self.assertEquals(self.index.count(year=2099), 0)
+        self.assertRaises(ValueError, self.index.count, month=7)
+
+        self.index.add('2013-08-01-new-article.txt')
+        self.assertEquals(self.index.count(year=2013), 4)
+        self.assertEquals(self.index.count(year=2013, month=8), 1)
+
+        self.index.remove('2013-08-01-new-article.txt')
+        self.assertEquals(self.index.count(year=2013), 3)
+        self.assertEquals(self.index._counts.get(('2013', '08')), None)
+
+    def test_summary(self):
+        checksum = self.index.checksum()
+        self.index.add('2013-07-01-another-article.txt')
+        self.assertNotEquals(self.index.checksum(), checksum)
+        summary = self.index.summary()
+        self.assertTrue(self.index.summary() is summary)
+
+        self.assertEquals([y['year'] for y in summary],
+            ['2014', '2013', '1900'])
+        self.assertEquals(summary[1], {'year': '2013', 'count': 4, 'months': [
+            {'month': '07', 'count': 4, 'days': [
+                  {'day': '03', 'count': 1}
+                , {'day': '02', 'count': 1}
+                , {'day': '01', 'count': 2}
+            ]}
+        ]})
+        self.assertEquals(ArticleIndex(ARTICLE_FILE_PATTERN).summary(), [])
+
+
+class MetaIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = MetaIndex(['tags', 'author'])
+        self.index.add('2013-07-02-b.txt', {'tags': ['inkwell', 'python'],
+            'author': 'ada'})
+        self.index.add('2013-07-01-a.txt', {'tags': 'inkwell', 'title': 'A'})
+
+    def test_lookup(self):
+        self.assertEquals(self.index.lookup('tags', 'inkwell'),
+            ['2013-07-01-a.txt', '2013-07-02-b.txt'])
+        self.assertEquals(self.index.lookup('tags', u'python'),
+            ['2013-07-02-b.txt'])
+        self.assertEquals(self.index.lookup('author', 'ada'),
+            ['2013-07-02-b.txt'])
+        self.assertEquals(self.index.lookup('tags', 'nothing'), [])
+        self.assertEquals(self.index.lookup('tags', '  '), [])
+        self.assertRaises(KeyError, self.index.lookup, 'title', 'A')
+
+    def test_values(self):
+        self.assertEquals(self.index.values('tags'),
+            {u'inkwell': 2, u'python': 1})
+        self.assertEquals(self.index.values('author'), {u'ada': 1})
+
+    def test_replace_and_remove(self):
+        self.index.add('2013-07-02-b.txt', {'tags': ['python', 'python', 3]})
+        self.assertEquals(self.index.values('tags'),
+            {u'inkwell': 1, u'python': 1, u'3': 1})
+        self.assertEquals(self.index.values('author'), {})
+
+        self.assertTrue(self.index.remove('2013-07-02-b.txt'))
+        self.assertFalse(self.index.remove('2013-07-02-b.txt'))
+        self.assertEquals(self.index.values('tags'), {u'inkwell': 1})
+        self.assertEquals(len(self.index), 1)
+
+        self.index.add('2013-07-01-a.txt', {})
+        self.assertFalse('2013-07-01-a.txt' in self.index)
+        self.assertEquals(self.index.values('tags'), {})
+
+    def test_related(self):
+        self.index.add('2013-07-03-c.txt', {'tags': ['python', 'inkwell']})
+        self.assertEquals(self.index.related('2013-07-02-b.txt', 'tags'),
+            ['2013-07-03-c.txt', '2013-07-01-a.txt'])
+        self.assertEquals(self.index.related('2013-07-02-b.txt', 'tags',
+            limit=1), ['2013-07-03-c.txt'])
+        self.assertEquals(self.index._related['2013-07-02-b.txt'].keys(),
+            ['tags'])
+        self.assertEquals(self.index.related('2013-07-02-b.txt', 'author'), [])
+
+        # Changing an article only forgets the related articles of those
+        # sharing its values.
+        self.index.related('2013-07-01-a.txt', 'tags')
+        self.index.add('2013-07-04-d.txt', {'tags': ['python']})
+        self.assertFalse('2013-07-02-b.txt' in self.index._related)
+        self.assertTrue('2013-07-01-a.txt' in self.index._related)
+        self.assertEquals(self.index.related('2013-07-02-b.txt', 'tags'),
+            ['2013-07-03-c.txt', '2013-07-04-d.txt', '2013-07-01-a.txt'])
+
+        self.index.remove('2013-07-03-c.txt')
+        self.assertEquals(self.index.related('2013-07-01-a.txt', 'tags'),
+            ['2013-07-02-b.txt'])
+        self.assertEquals(self.index.related('2013-07-03-c.txt', 'tags'), [])
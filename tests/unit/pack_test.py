@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from inkwell.pack import Pack, PackWriter
+import os
+import shutil
+import tempfile
+import unittest
+
+class PackTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'blobs.pack')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_write_and_read(self):
+        writer = PackWriter()
+        first = writer.add('Hello')
+        second = writer.add(u'W\xf6rld')
+
+        self.assertEquals(writer.add('Hello'), first)
+        self.assertEquals(writer.size, 11)
+
+        with open(self.path, 'wb') as f:
+            f.write('header' + writer.getvalue())
+
+        pack = Pack(self.path, offset=6)
+        self.assertEquals(pack.read(*first), 'Hello')
+        self.assertEquals(pack.read(*second).decode('utf-8'), u'W\xf6rld')
+        pack.close()
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 import os
+import yaml
+import json
+import time
+import shutil
+import threading
+import tempfile
 import inkwell
 import unittest
 import re
-from datetime import datetime
+from datetime import date, datetime
 from tests import fixtures
 
 class ReaderTest(unittest.TestCase):
@@ -55,6 +61,56 @@ class ReaderTest(unittest.TestCase):
         articles = self.reader.list(by_year=2013, by_month=7, by_day=2)
         self.assertEquals(len(articles), 1)
 
+    def test_list_with_limit_and_offset(self):
+        filenames = sorted(fixtures.valid_files, reverse=True)
+
+        articles = self.reader.list(limit=2)
+        self.assertEquals([a.filename for a in articles], filenames[:2])
+        self.assertEquals(articles.total, len(filenames))
+        self.assertEquals(articles.cursor, articles[-1].meta['path'])
+
+        articles = self.reader.list(limit=2, offset=2)
+        self.assertEquals([a.filename for a in articles], filenames[2:4])
+
+        articles = self.reader.list(offset=3)
+        self.assertEquals([a.filename for a in articles], filenames[3:])
+        self.assertIsNone(articles.cursor)
+
+        articles = self.reader.list(by_year=2013, limit=2, offset=1)
+        self.assertEquals(len(articles), 2)
+        self.assertEquals(articles.total, 3)
+        self.assertIsNone(articles.cursor)
+
+    def test_list_after(self):
+        filenames = sorted(fixtures.valid_files, reverse=True)
+
+        page = self.reader.list(limit=2)
+        articles = self.reader.list(limit=2, after=page.cursor)
+        self.assertEquals([a.filename for a in articles], filenames[2:4])
+
+        articles = self.reader.list(by_year=2013, after=page.cursor)
+        self.assertEquals([a.filename for a in articles], filenames[2:4])
+
+        try:
+            self.reader.list(after='merp')
+            assert False
+        except ValueError:
+            assert True
+
+    def test_list_since_and_until(self):
+        articles = self.reader.list(since='2013-07-02', until=date(2013, 7, 3))
+        self.assertEquals([a.filename for a in articles], [
+              '2013-07-03-lorem-ipsum-example-three.txt'
+            , '2013-07-02-lorem-ipsum-example-two.txt'
+        ])
+        self.assertEquals(articles.total, 2)
+
+        try:
+            self.reader.list(since='2013-13-01')
+            assert False
+        except ValueError:
+            assert True
+
     def test_fetch_valid_article(self):
         article = self.reader.fetch_article(fixtures.valid_files[0])
 
@@ -68,6 +124,247 @@ class ReaderTest(unittest.TestCase):
         self.assertTrue(isinstance(article.date, datetime))
         self.assertTrue(isinstance(article, inkwell.reader.Article))
 
+    def test_fetch_article_cache(self):
+        folder = tempfile.mkdtemp()
+        filename = '2013-07-01-cached.txt'
+        path = os.path.join(folder, filename)
+
+        try:
+            with open(path, 'w') as f:
+                f.write('title: Before\n\nBody')
+
+            reader = inkwell.reader.Reader(folder)
+            article = reader.fetch_article(filename)
+
+            self.assertTrue(reader.fetch_article(filename) is article)
+            self.assertEquals(reader.cache.stats()['hits'], 1)
+            self.assertEquals(reader.cache.stats()['misses'], 1)
+
+            with open(path, 'w') as f:
+                f.write('title: After\n\nBody')
+            os.utime(path, (time.time() + 10, time.time() + 10))
+
+            self.assertEquals(reader.fetch_article(filename).title, 'After')
+            self.assertEquals(reader.cache.stats()['misses'], 2)
+        finally:
+            shutil.rmtree(folder)
+
+    def test_load_all_parallel(self):
+        folder = tempfile.mkdtemp()
+        try:
+            for filename in fixtures.valid_files:
+                shutil.copy(os.path.join(fixtures.valid_articles_folder,
+                    filename), folder)
+
+            reader = inkwell.reader.Reader(folder)
+            expected = [(a.filename, a.title, a.body)
+                for a in reader.load_all()]
+            self.assertEquals([f for f, _, _ in expected],
+                reader.index.lookup())
+
+            for processes in (False, True):
+                for lazy in (False, True):
+                    reader.cache.clear()
+                    articles = reader.load_all(parallel=3,
+                        processes=processes, lazy=lazy)
+                    self.assertEquals([(a.filename, a.title, a.body)
+                        for a in articles], expected)
+
+            articles = reader.list(limit=2, parallel=2, processes=True)
+            self.assertEquals([a.filename for a in articles],
+                [f for f, _, _ in expected[:2]])
+            self.assertEquals(articles.total, len(expected))
+        finally:
+            shutil.rmtree(folder)
+
+    def test_iterate(self):
+        filenames = self.reader.index.lookup()
+        articles = self.reader.iterate(filenames + ['2013-01-01-missing.txt'],
+            lazy=True, batch_size=2)
+
+        self.assertFalse(isinstance(articles, list))
+        self.assertEquals([a.filename for a in articles], filenames)
+        self.assertEquals([a.filename for a in self.reader.iterate()],
+            filenames)
+
+    def test_fragments(self):
+        folder = tempfile.mkdtemp()
+        try:
+            for filename in fixtures.valid_files:
+                shutil.copy(os.path.join(fixtures.valid_articles_folder,
+                    filename), folder)
+
+            reader = inkwell.reader.Reader(folder)
+            filenames = reader.index.lookup()
+
+            fragments = list(reader.fragments(filenames, fields=['meta',
+                'title'], batch_size=2))
+            self.assertEquals([json.loads(f) for f in fragments],
+                [json.loads(json.dumps(a, cls=inkwell.Encoder)) for a in
+                    reader.list().to_json(fields=['title', 'meta'])])
+
+            again = list(reader.fragments(filenames, fields=['title', 'meta']))
+            self.assertTrue(all(a is b for a, b in zip(again, fragments)))
+            self.assertEquals(len(list(reader.fragments(filenames))),
+                len(filenames))
+
+            path = os.path.join(folder, filenames[0])
+            with open(path, 'a') as f:
+                f.write('\n\nUpdated.')
+            reader.update(filenames[0])
+
+            updated = list(reader.fragments(filenames[:1]))[0]
+            self.assertTrue('Updated.' in json.loads(updated)['body'])
+        finally:
+            shutil.rmtree(folder)
+
+    def test_index_built_once(self):
+        reader = inkwell.reader.Reader(fixtures.valid_articles_folder)
+        other = inkwell.reader.Reader(fixtures.valid_articles_folder)
+
+        built = []
+        build_index = reader._build_index
+        def counting_build_index():
+            built.append(True)
+            time.sleep(0.05)
+            return build_index()
+        reader._build_index = counting_build_index
+
+        indexes = []
+        threads = [threading.Thread(target=lambda: indexes.append(
+            reader.index)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEquals(len(built), 1)
+        self.assertTrue(all(index is indexes[0] for index in indexes))
+        self.assertFalse(other.index is indexes[0])
+        self.assertFalse(other.cache is reader.cache)
+
+    def test_search(self):
+        folder = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(folder, '2013-07-01-first.txt'), 'w') as f:
+                f.write('title: First\ntags: [inkwell]\n\nHello World')
+
+            reader = inkwell.reader.Reader(folder)
+            self.assertEquals(reader.search('hello'),
+                (['2013-07-01-first.txt'], 1))
+            self.assertEquals(reader.search('inkwell')[1], 1)
+
+            with open(os.path.join(folder, '2013-07-02-second.txt'), 'w') as f:
+                f.write('title: Second\n\nHello again')
+            reader.update('2013-07-02-second.txt')
+            self.assertEquals(reader.search('hello')[1], 2)
+            self.assertEquals(reader.search('again'),
+                (['2013-07-02-second.txt'], 1))
+
+            os.unlink(os.path.join(folder, '2013-07-01-first.txt'))
+            reader.discard('2013-07-01-first.txt')
+            self.assertEquals(reader.search('hello'),
+                (['2013-07-02-second.txt'], 1))
+
+            reader.refresh()
+            self.assertEquals(reader.search('sec*'),
+                (['2013-07-02-second.txt'], 1))
+        finally:
+            shutil.rmtree(folder)
+
+    def test_indexes_pick_up_edits(self):
+        folder = tempfile.mkdtemp()
+        try:
+            path = os.path.join(folder, '2013-07-01-first.txt')
+            with open(path, 'w') as f:
+                f.write('title: First\ntags: [before]\n\nHello World')
+
+            reader = inkwell.reader.Reader(folder)
+            unchecked = inkwell.reader.Reader(folder, check_folder=False)
+            for subject in (reader, unchecked):
+                self.assertEquals(subject.search('hello')[1], 1)
+                self.assertEquals(subject.meta_index.values('tags'),
+                    {u'before': 1})
+
+            with open(path, 'w') as f:
+                f.write('title: First\ntags: [after]\n\nGoodbye World')
+            stat = os.stat(path)
+            os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+            self.assertEquals(reader.search('hello')[1], 0)
+            self.assertEquals(reader.search('goodbye'),
+                (['2013-07-01-first.txt'], 1))
+            self.assertEquals(reader.meta_index.values('tags'),
+                {u'after': 1})
+
+            self.assertEquals(unchecked.search('hello')[1], 1)
+            self.assertEquals(unchecked.meta_index.values('tags'),
+                {u'before': 1})
+        finally:
+            shutil.rmtree(folder)
+
+    def test_check_folder(self):
+        folder = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(folder, '2013-07-01-first.txt'), 'w') as f:
+                f.write('title: First\n\nHello')
+
+            reader = inkwell.reader.Reader(folder)
+            unchecked = inkwell.reader.Reader(folder, check_folder=False)
+            self.assertEquals(reader.list().total, 1)
+            self.assertEquals(unchecked.list().total, 1)
+
+            with open(os.path.join(folder, '2013-07-02-second.txt'), 'w') as f:
+                f.write('title: Second\n\nHello again')
+            os.utime(folder, (0, os.stat(folder).st_mtime + 1))
+            self.assertEquals(reader.list().total, 2)
+            self.assertEquals(unchecked.list().total, 1)
+
+            os.unlink(os.path.join(folder, '2013-07-01-first.txt'))
+            os.utime(folder, (0, os.stat(folder).st_mtime + 1))
+            articles = reader.list()
+            self.assertEquals((articles.total, len(articles)), (1, 1))
+        finally:
+            shutil.rmtree(folder)
+
+    def test_meta_index(self):
+        folder = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(folder, '2013-07-01-first.txt'), 'w') as f:
+                f.write('title: First\ntags: [inkwell, python]\n\nHello')
+
+            reader = inkwell.reader.Reader(folder)
+            self.assertEquals(reader.meta_index.values('tags'),
+                {u'inkwell': 1, u'python': 1})
+            self.assertTrue(reader.meta_index is reader.meta_index)
+
+            with open(os.path.join(folder, '2013-07-02-second.txt'), 'w') as f:
+                f.write('title: Second\ntags: inkwell\n\nHello again')
+            reader.update('2013-07-02-second.txt')
+            self.assertEquals(reader.page(by_meta={'tags': 'inkwell'})[:2],
+                (['2013-07-02-second.txt', '2013-07-01-first.txt'], 2))
+
+            os.unlink(os.path.join(folder, '2013-07-01-first.txt'))
+            reader.discard('2013-07-01-first.txt')
+            self.assertEquals(reader.meta_index.values('tags'),
+                {u'inkwell': 1})
+            self.assertRaises(ValueError, reader.page,
+                by_meta={'author': 'ada'})
+        finally:
+            shutil.rmtree(folder)
+
+    def test_list_by_meta(self):
+        articles = self.reader.list(by_meta={'tags': 'example'}, limit=1)
+        self.assertEquals(articles.total, 2)
+        self.assertEquals(articles[0].filename,
+            '2013-07-02-lorem-ipsum-example-two.txt')
+        self.assertEquals(articles.cursor, articles[0].meta['path'])
+
+        articles = self.reader.list(by_meta={'tags': 'lorem'}, by_year=2013)
+        self.assertEquals(articles.total, 2)
+        self.assertEquals(self.reader.list(by_meta={'tags': 'nothing'}).total,
+            0)
+
     def test_fetch_invalid_article(self):
         article = self.reader.fetch_article(year=2009, month=04, \
             day=1, title='ohoneos')
@@ -85,6 +382,24 @@ class ReaderTest(unittest.TestCase):
             self.assertTrue(isinstance(article.date, datetime))
             self.assertTrue(isinstance(article, inkwell.reader.Article))
 
+    def test_header_parser(self):
+        parser = inkwell.reader.HeaderParser()
+
+        header = parser.parse('title: Hello\ntags: [foo, bar]')
+        self.assertEquals(header, {'title': 'Hello', 'tags': ['foo', 'bar']})
+        header['tags'].append('baz')
+
+        cached = parser.parse('title: Hello\ntags: [foo, bar]')
+        self.assertEquals(cached, {'title': 'Hello', 'tags': ['foo', 'bar']})
+        self.assertFalse(cached is header)
+        self.assertEquals(parser.cache.stats()['hits'], 1)
+
+        try:
+            parser.parse('title: !!python/object/apply:os.getcwd []')
+            assert False
+        except yaml.YAMLError:
+            assert True
+
     def test_build_filter_pattern(self):
         filter = self.reader._build_filter_pattern()
         self.assertEquals(filter, r'^\d{4}\-\d{2}\-\d{2}\-.*\.txt$')
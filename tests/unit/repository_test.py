@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import shutil
+import tempfile
+import unittest
+import subprocess
+from inkwell.reader import Article
+from inkwell.repository import GitReader
+from inkwell.watcher import Watcher
+
+class GitReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.articles = os.path.join(self.folder, 'articles')
+        os.mkdir(self.articles)
+
+        self.git('init', '-q')
+        self.commit('2013-07-01-first.txt', 'title: First\n\nBody')
+
+        self.reader = GitReader(self.articles)
+
+    def tearDown(self):
+        self.reader.repository.close()
+        shutil.rmtree(self.folder)
+
+    def git(self, *args):
+        return subprocess.check_output(('git', '-c', 'user.name=Inkwell',
+            '-c', 'user.email=inkwell@example.com') + args, cwd=self.folder)
+
+    def commit(self, filename, content):
+        with open(os.path.join(self.articles, filename), 'w') as f:
+            f.write(content)
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', filename)
+
+    def test_not_a_repository(self):
+        folder = tempfile.mkdtemp()
+        try:
+            GitReader(folder)
+            assert False
+        except IOError:
+            assert True
+        finally:
+            shutil.rmtree(folder)
+
+    def test_list_and_fetch(self):
+        articles = self.reader.list()
+        self.assertEquals(len(articles), 1)
+
+        article = self.reader.fetch_article('2013-07-01-first.txt')
+        self.assertTrue(isinstance(article, Article))
+        self.assertEquals(article.title, 'First')
+        self.assertEquals(article.body, 'Body')
+
+    def test_reads_committed_content_only(self):
+        with open(os.path.join(self.articles, '2013-07-02-draft.txt'), 'w') \
+            as f:
+            f.write('title: Draft\n\nBody')
+
+        self.assertEquals(len(self.reader.list()), 1)
+        self.assertFalse(self.reader.fetch_article('2013-07-02-draft.txt'))
+
+    def test_checkout(self):
+        first = self.reader.snapshot
+        self.git('tag', 'v1')
+        self.commit('2013-07-02-second.txt', 'title: Second\n\nBody')
+
+        self.assertEquals(len(self.reader.list()), 1)
+
+        snapshot = self.reader.checkout()
+        self.assertNotEquals(snapshot.commit, first.commit)
+        self.assertEquals(len(GitReader(self.articles).list()), 2)
+
+        self.reader.checkout('v1')
+        self.assertEquals(self.reader.snapshot.commit, first.commit)
+        self.assertEquals(len(self.reader.list()), 1)
+
+    def test_checkout_unchanged(self):
+        snapshot = self.reader.snapshot
+        self.assertTrue(self.reader.checkout() is snapshot)
+
+    def test_check_interval(self):
+        reader = GitReader(self.articles, check_interval=0)
+        try:
+            self.assertEquals(len(reader.list()), 1)
+            self.commit('2013-07-02-second.txt', 'title: Second\n\nBody')
+            self.assertEquals(len(reader.list()), 2)
+        finally:
+            reader.repository.close()
+
+    def test_update_checks_out(self):
+        index = self.reader.index
+        with open(os.path.join(self.articles, '2013-07-02-draft.txt'), 'w') \
+            as f:
+            f.write('title: Draft\n\nBody')
+
+        self.assertFalse(self.reader.update('2013-07-02-draft.txt'))
+        self.assertEquals(len(index), 1)
+
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', 'draft')
+        self.assertTrue(self.reader.update('2013-07-02-draft.txt'))
+        self.assertEquals(len(index), 1)
+        self.assertEquals(len(self.reader.index), 2)
+
+    def test_watcher_follows_ref(self):
+        watcher = Watcher(self.reader, interval=0.05)
+        watcher.start()
+        try:
+            self.commit('2013-07-02-second.txt', 'title: Second\n\nBody')
+            deadline = time.time() + 2
+            while time.time() < deadline and len(self.reader.index) < 2:
+                time.sleep(0.01)
+            self.assertEquals(len(self.reader.index), 2)
+        finally:
+            watcher.stop()
+            watcher.join()
+
+    def test_blob_sha_versions(self):
+        version, size, modified = self.reader._stat('2013-07-01-first.txt')
+        self.assertEquals(version, self.git('rev-parse',
+            'HEAD:articles/2013-07-01-first.txt').strip())
+        self.assertEquals(size, len('title: First\n\nBody'))
+        self.assertEquals(modified, self.reader.snapshot.committed)
+
+    def test_load_all_processes(self):
+        self.commit('2013-07-02-second.txt', 'title: Second\n\nMore')
+        self.reader.checkout()
+
+        articles = self.reader.load_all(parallel=2, processes=True)
+        self.assertEquals([a.title for a in articles], ['Second', 'First'])
+        self.assertEquals(articles[0].body, 'More')
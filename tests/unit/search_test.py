@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from inkwell.search import SearchIndex, tokenize
+import unittest
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = SearchIndex()
+        self.index.add('2013-07-01-python.txt', title='Python Tips',
+            tags=['python', 'code'], body='Generators are lazy.')
+        self.index.add('2013-07-02-flask.txt', title='Flask',
+            tags='python', body='Flask is a Python web framework.')
+        self.index.add('2013-07-03-cooking.txt', title='Cooking',
+            body=u'A r\xe9sum\xe9 of recipes. Nothing about code.')
+
+    def test_tokenize(self):
+        self.assertEquals(tokenize('Hello, *World*!'), [u'hello', u'world'])
+        self.assertEquals(tokenize(u'R\xe9sum\xe9'.encode('utf-8')),
+            [u'r\xe9sum\xe9'])
+        self.assertEquals(tokenize(None), [])
+
+    def test_search(self):
+        filenames, total = self.index.search('python')
+        self.assertEquals(total, 2)
+        self.assertEquals(set(filenames), set(['2013-07-01-python.txt',
+            '2013-07-02-flask.txt']))
+
+        filenames, total = self.index.search('flask')
+        self.assertEquals(filenames, ['2013-07-02-flask.txt'])
+
+        self.assertEquals(self.index.search('missing'), ([], 0))
+        self.assertEquals(self.index.search(u'R\xc9SUM\xc9')[0],
+            ['2013-07-03-cooking.txt'])
+
+    def test_ranking(self):
+        # A match in the title outweighs the same match in the body.
+        filenames, total = self.index.search('code')
+        self.assertEquals(filenames[0], '2013-07-01-python.txt')
+
+        filenames, total = self.index.search('python generators')
+        self.assertEquals(filenames[0], '2013-07-01-python.txt')
+
+    def test_prefix(self):
+        self.assertEquals(self.index.search('pyth')[1], 0)
+        self.assertEquals(self.index.search('pyth*')[1], 2)
+        self.assertEquals(self.index.search('reci* gener*')[1], 2)
+
+    def test_pagination(self):
+        filenames, total = self.index.search('python code')
+        self.assertEquals(total, 3)
+        self.assertEquals(self.index.search('python code', limit=2),
+            (filenames[:2], 3))
+        self.assertEquals(self.index.search('python code', offset=2),
+            (filenames[2:], 3))
+
+    def test_update_and_remove(self):
+        self.index.add('2013-07-03-cooking.txt', title='Cooking Python')
+        self.assertEquals(self.index.search('python')[1], 3)
+        self.assertEquals(self.index.search('recipes')[1], 0)
+
+        self.assertTrue(self.index.remove('2013-07-02-flask.txt'))
+        self.assertFalse(self.index.remove('2013-07-02-flask.txt'))
+        self.assertEquals(self.index.search('flask*'), ([], 0))
+        self.assertEquals(len(self.index), 2)
+        self.assertFalse('2013-07-02-flask.txt' in self.index)
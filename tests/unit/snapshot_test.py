@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from inkwell import reader, snapshot
+from inkwell.reader import Reader
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.articles = os.path.join(self.folder, 'articles')
+        self.path = os.path.join(self.folder, 'snapshot', 'articles.bin')
+        os.mkdir(self.articles)
+
+        self.write('2013-07-01-first.txt', 'title: First\n\nFirst *body*')
+        self.write('2013-07-02-second.txt', 'title: Second\n\nSecond body')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write(self, filename, content, delay=0):
+        path = os.path.join(self.articles, filename)
+        with open(path, 'w') as f:
+            f.write(content)
+        os.utime(path, (time.time() + delay, time.time() + delay))
+
+    def test_dump_and_load(self):
+        entries = {'2013-07-01-first.txt': ((1.0, 2), 2, {'title': 'First'},
+            None, 14)}
+        snapshot.dump(self.path, entries, {'abc': u'<p>First</p>'})
+
+        self.assertEquals(snapshot.load(self.path)[:2],
+            (entries, {'abc': u'<p>First</p>'}))
+
+    def test_dump_and_load_pack(self):
+        entries = {'2013-07-01-first.txt': ((1.0, 2), 2, {'title': 'First'},
+            'First body', None)}
+        snapshot.dump(self.path, entries, {'abc': u'<p>F\xefrst</p>'},
+            pack=True)
+
+        entries, html, pack = snapshot.load(self.path)
+        body = entries['2013-07-01-first.txt'][3]
+
+        self.assertTrue(isinstance(body, tuple))
+        self.assertEquals(pack.read(*body), 'First body')
+        self.assertEquals(pack.read(*html['abc']).decode('utf-8'),
+            u'<p>F\xefrst</p>')
+
+    def test_load_invalid(self):
+        self.assertEquals(snapshot.load(self.path), ({}, {}, None))
+
+        snapshot.dump(self.path, {'foo': 'bar'})
+        with open(self.path, 'r+b') as f:
+            f.seek(-1, os.SEEK_END)
+            f.write('!')
+        self.assertEquals(snapshot.load(self.path), ({}, {}, None))
+
+        with open(self.path, 'wb') as f:
+            f.write('INKWELL')
+        self.assertEquals(snapshot.load(self.path), ({}, {}, None))
+
+    def test_warm(self):
+        subject = Reader(self.articles)
+        result = snapshot.warm(subject, self.path)
+        self.assertEquals(result, {'restored': 0, 'read': 2})
+        self.assertEquals(len(snapshot.load(self.path)[0]), 2)
+
+        subject = Reader(self.articles)
+        modified = os.path.getmtime(self.path)
+
+        result = snapshot.warm(subject, self.path)
+        self.assertEquals(result, {'restored': 2, 'read': 0})
+        self.assertEquals(os.path.getmtime(self.path), modified)
+        self.assertEquals(len(subject.cache), 2)
+
+        article = subject.fetch_article('2013-07-01-first.txt')
+        self.assertEquals(article.title, 'First')
+        self.assertTrue(article.loader)
+        self.assertEquals(article.body, 'First *body*')
+        self.assertEquals(subject.cache.stats()['misses'], 0)
+
+        self.write('2013-07-02-second.txt', 'title: Changed\n\nBody', 10)
+        result = snapshot.warm(subject, self.path)
+        self.assertEquals(result, {'restored': 1, 'read': 1})
+
+        entries = snapshot.load(self.path)[0]
+        self.assertEquals(entries['2013-07-02-second.txt'][2],
+            {'title': 'Changed'})
+
+    def test_warm_html(self):
+        snapshot.warm(Reader(self.articles), self.path, html=True)
+        entries, html, pack = snapshot.load(self.path)
+
+        self.assertEquals(entries['2013-07-01-first.txt'][3], 'First *body*')
+        key = reader.renderer.key('First *body*')
+        self.assertEquals(html[key], u'<p>First <em>body</em></p>')
+
+        reader.renderer.cache.clear()
+        snapshot.warm(Reader(self.articles), self.path, html=True)
+        self.assertTrue(key in reader.renderer.cache)
+
+    def test_warm_pack(self):
+        snapshot.warm(Reader(self.articles), self.path, html=True, pack=True)
+        entries, html, pack = snapshot.load(self.path)
+        self.assertTrue(isinstance(entries['2013-07-01-first.txt'][3], tuple))
+
+        reader.renderer.cache.clear()
+        subject = Reader(self.articles)
+        subject.cache.clear()
+
+        result = snapshot.warm(subject, self.path, html=True, pack=True)
+        self.assertEquals(result, {'restored': 2, 'read': 0})
+
+        article = subject.fetch_article('2013-07-01-first.txt')
+        self.assertEquals(article.body, 'First *body*')
+        self.assertTrue(article.loader)
+        self.assertEquals(article.to_json()['body'],
+            u'<p>First <em>body</em></p>')
+        self.assertEquals(len(reader.renderer.cache), 0)
+
+        key = reader.renderer.key
+        reader.renderer.key = None
+        try:
+            self.assertEquals(article.to_json()['body'],
+                u'<p>First <em>body</em></p>')
+        finally:
+            reader.renderer.key = key
+
+        snapshot.warm(subject, self.path, html=True)
+        entries = snapshot.load(self.path)[0]
+        self.assertEquals(entries['2013-07-01-first.txt'][3], 'First *body*')
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from inkwell.reader import Reader
+from inkwell.watcher import Watcher
+
+class WatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.reader = Reader(self.folder, check_folder=False)
+        self.watcher = Watcher(self.reader, interval=0.05)
+
+    def tearDown(self):
+        if self.watcher.is_alive():
+            self.watcher.stop()
+            self.watcher.join()
+        shutil.rmtree(self.folder)
+
+    def write(self, filename, content='title: Watched\n\nBody'):
+        path = os.path.join(self.folder, filename)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def wait_for(self, condition):
+        deadline = time.time() + 2
+        while time.time() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_create_rename_and_delete(self):
+        self.assertEquals(len(self.reader.list()), 0)
+
+        # The reader does not check the folder itself, so every change below
+        # has to be dispatched by the watcher.
+        dispatched = []
+        dispatch = self.watcher.dispatch
+        self.watcher.dispatch = lambda mask, filename: (
+            dispatched.append(filename), dispatch(mask, filename))
+        self.watcher.start()
+
+        path = self.write('2013-07-01-watched.txt')
+        self.assertTrue(self.wait_for(lambda: len(self.reader.list()) == 1))
+
+        os.rename(path, os.path.join(self.folder, '2013-07-02-renamed.txt'))
+        self.assertTrue(self.wait_for(lambda:
+            self.reader.index.lookup() == ['2013-07-02-renamed.txt']))
+
+        os.unlink(os.path.join(self.folder, '2013-07-02-renamed.txt'))
+        self.assertTrue(self.wait_for(lambda: len(self.reader.list()) == 0))
+
+        self.assertEquals(sorted(set(dispatched)),
+            ['2013-07-01-watched.txt', '2013-07-02-renamed.txt'])
+
+    def test_poll(self):
+        self.watcher._inotify_init = lambda: None
+        self.watcher.start()
+
+        self.write('2013-07-01-polled.txt')
+        self.assertTrue(self.wait_for(lambda: len(self.reader.list()) == 1))
+
+    def test_poll_modified(self):
+        self.write('2013-07-01-polled.txt', 'title: Polled\ntags: [before]\n\n'
+            'Body')
+        self.assertEquals(self.reader.meta_index.values('tags'),
+            {u'before': 1})
+
+        self.watcher._inotify_init = lambda: None
+        self.watcher.start()
+
+        path = self.write('2013-07-01-polled.txt', 'title: Polled\n'
+            'tags: [after]\n\nBody')
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+        self.assertTrue(self.wait_for(lambda:
+            self.reader.meta_index.values('tags') == {u'after': 1}))
+        self.assertEquals(self.reader.search('after')[1], 1)
+
+    def test_dispatch_modified(self):
+        self.write('2013-07-01-watched.txt')
+        self.assertEquals(self.reader.fetch_article('2013-07-01-watched.txt')
+            .title, 'Watched')
+
+        self.write('2013-07-01-watched.txt', 'title: Modified\n\nBody')
+        self.watcher.dispatch(0x00000008, '2013-07-01-watched.txt')
+
+        self.assertFalse('2013-07-01-watched.txt' in self.reader.cache)